@@ -0,0 +1,50 @@
+"""server_side_timestamp_defaults
+
+Revision ID: a3f1c9d2e7b4
+Revises: 15216b40982d
+Create Date: 2026-10-15 10:12:04.511203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f1c9d2e7b4'
+down_revision: Union[str, None] = '15216b40982d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column) pairs whose timestamps are now generated by the database
+TIMESTAMP_COLUMNS = (
+    ('applications', 'applied_at'),
+    ('applications', 'updated_at'),
+    ('jobs', 'created_at'),
+    ('email_verification_tokens', 'created_at'),
+    ('oauth_states', 'created_at'),
+)
+
+
+def upgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                server_default=sa.func.now(),
+            )
+
+
+def downgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                server_default=None,
+            )
@@ -0,0 +1,45 @@
+"""trigram_indexes_for_job_search
+
+Revision ID: a4d8f2b6c9e3
+Revises: f3b9d5a1c7e4
+Create Date: 2026-10-16 00:52:18.417305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d8f2b6c9e3'
+down_revision: Union[str, None] = 'f3b9d5a1c7e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_COLUMNS = ('title', 'description', 'location')
+
+
+def upgrade() -> None:
+    # GIN trigram indexes let ILIKE '%term%' use an index instead of
+    # scanning every job; SQLite has no equivalent, so nothing to do there
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for column in SEARCH_COLUMNS:
+        op.create_index(
+            f'ix_jobs_{column}_trgm',
+            'jobs',
+            [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for column in SEARCH_COLUMNS:
+        op.drop_index(f'ix_jobs_{column}_trgm', table_name='jobs')
@@ -0,0 +1,31 @@
+"""add_user_status_applied_index
+
+Revision ID: a6e9c2f7d3b1
+Revises: f5d1b8c3e6a2
+Create Date: 2026-10-15 14:31:05.772419
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6e9c2f7d3b1'
+down_revision: Union[str, None] = 'f5d1b8c3e6a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_applications_user_status_applied',
+        'applications',
+        ['user_id', 'status', 'applied_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_applications_user_status_applied', table_name='applications')
@@ -0,0 +1,65 @@
+"""shrink_varchar_widths
+
+Revision ID: a9d5e2b8c4f1
+Revises: f6a1d4c9e2b5
+Create Date: 2026-10-15 17:14:08.441963
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d5e2b8c4f1'
+down_revision: Union[str, None] = 'f6a1d4c9e2b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# column -> (old length, new length)
+USER_COLUMNS = {
+    'hashed_password': (255, 60),  # bcrypt hashes are 60 characters
+    'oauth_provider': (50, 20),
+    'oauth_provider_id': (255, 128),
+}
+TOKEN_LENGTHS = (255, 64)
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        for column, (old, new) in USER_COLUMNS.items():
+            batch_op.alter_column(
+                column,
+                existing_type=sa.String(length=old),
+                type_=sa.String(length=new),
+                existing_nullable=True,
+            )
+
+    with op.batch_alter_table('email_verification_tokens', schema=None) as batch_op:
+        batch_op.alter_column(
+            'token',
+            existing_type=sa.String(length=TOKEN_LENGTHS[0]),
+            type_=sa.String(length=TOKEN_LENGTHS[1]),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('email_verification_tokens', schema=None) as batch_op:
+        batch_op.alter_column(
+            'token',
+            existing_type=sa.String(length=TOKEN_LENGTHS[1]),
+            type_=sa.String(length=TOKEN_LENGTHS[0]),
+            existing_nullable=False,
+        )
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        for column, (old, new) in USER_COLUMNS.items():
+            batch_op.alter_column(
+                column,
+                existing_type=sa.String(length=new),
+                type_=sa.String(length=old),
+                existing_nullable=True,
+            )
@@ -0,0 +1,50 @@
+"""server_side_timestamps_for_users_and_tokens
+
+Revision ID: b2e6f8a3d5c9
+Revises: a9d5e2b8c4f1
+Create Date: 2026-10-15 17:58:44.306217
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2e6f8a3d5c9'
+down_revision: Union[str, None] = 'a9d5e2b8c4f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column) pairs whose timestamps are now generated by the database
+TIMESTAMP_COLUMNS = (
+    ('users', 'created_at'),
+    ('users', 'updated_at'),
+    ('refresh_tokens', 'created_at'),
+    ('password_reset_tokens', 'created_at'),
+    ('saved_jobs', 'saved_at'),
+)
+
+
+def upgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                server_default=sa.func.now(),
+            )
+
+
+def downgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                server_default=None,
+            )
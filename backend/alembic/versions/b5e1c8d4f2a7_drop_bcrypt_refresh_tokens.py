@@ -0,0 +1,29 @@
+"""drop_bcrypt_refresh_tokens
+
+Revision ID: b5e1c8d4f2a7
+Revises: a4d8f2b6c9e3
+Create Date: 2026-10-16 09:14:37.205861
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e1c8d4f2a7'
+down_revision: Union[str, None] = 'a4d8f2b6c9e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Refresh tokens are now stored as 64-char HMAC-SHA256 digests; the old
+    # bcrypt hashes (60 chars) can never match again, so drop them
+    op.execute(sa.text('DELETE FROM refresh_tokens WHERE length(token) <> 64'))
+
+
+def downgrade() -> None:
+    # Deleted sessions can't be restored; users simply log in again
+    pass
@@ -0,0 +1,38 @@
+"""partial_index_on_active_oauth_states
+
+Revision ID: b7e2d4f1a9c3
+Revises: a3f1c9d2e7b4
+Create Date: 2026-10-15 11:03:47.218590
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2d4f1a9c3'
+down_revision: Union[str, None] = 'a3f1c9d2e7b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Used states are never looked up again; drop them before indexing
+    op.execute(sa.text("DELETE FROM oauth_states WHERE used = true"))
+
+    op.drop_index(op.f('ix_oauth_states_state'), table_name='oauth_states')
+    op.create_index(
+        'ix_oauth_states_state_active',
+        'oauth_states',
+        ['state'],
+        unique=True,
+        postgresql_where=sa.text('used = false'),
+        sqlite_where=sa.text('used = 0'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_oauth_states_state_active', table_name='oauth_states')
+    op.create_index(op.f('ix_oauth_states_state'), 'oauth_states', ['state'], unique=True)
@@ -0,0 +1,34 @@
+"""extend_job_status_index_with_applied_at
+
+Revision ID: b8f4d1a5e9c7
+Revises: a6e9c2f7d3b1
+Create Date: 2026-10-15 14:52:40.318856
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8f4d1a5e9c7'
+down_revision: Union[str, None] = 'a6e9c2f7d3b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (job_id, status) is a prefix of the new index, so it can go
+    op.create_index(
+        'ix_applications_job_status_applied',
+        'applications',
+        ['job_id', 'status', 'applied_at'],
+        unique=False,
+    )
+    op.drop_index('ix_applications_job_status', table_name='applications')
+
+
+def downgrade() -> None:
+    op.create_index('ix_applications_job_status', 'applications', ['job_id', 'status'], unique=False)
+    op.drop_index('ix_applications_job_status_applied', table_name='applications')
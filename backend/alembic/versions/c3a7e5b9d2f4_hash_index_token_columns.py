@@ -0,0 +1,47 @@
+"""hash_index_token_columns
+
+Revision ID: c3a7e5b9d2f4
+Revises: b8f4d1a5e9c7
+Create Date: 2026-10-15 15:20:11.864530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a7e5b9d2f4'
+down_revision: Union[str, None] = 'b8f4d1a5e9c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TOKEN_TABLES = ('refresh_tokens', 'password_reset_tokens')
+
+
+def upgrade() -> None:
+    for table in TOKEN_TABLES:
+        op.drop_index(f'ix_{table}_token', table_name=table)
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(
+                'token',
+                existing_type=sa.String(length=255),
+                type_=sa.String(length=64),
+                existing_nullable=False,
+            )
+        op.create_index(f'ix_{table}_token_hash', table, ['token'], postgresql_using='hash')
+
+
+def downgrade() -> None:
+    for table in TOKEN_TABLES:
+        op.drop_index(f'ix_{table}_token_hash', table_name=table)
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(
+                'token',
+                existing_type=sa.String(length=64),
+                type_=sa.String(length=255),
+                existing_nullable=False,
+            )
+        op.create_index(f'ix_{table}_token', table, ['token'], unique=True)
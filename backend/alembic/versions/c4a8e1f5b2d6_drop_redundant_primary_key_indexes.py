@@ -0,0 +1,41 @@
+"""drop_redundant_primary_key_indexes
+
+Revision ID: c4a8e1f5b2d6
+Revises: b7e2d4f1a9c3
+Create Date: 2026-10-15 11:41:09.634812
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a8e1f5b2d6'
+down_revision: Union[str, None] = 'b7e2d4f1a9c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables whose primary key carried a second, redundant ix_<table>_id index
+TABLES = (
+    'users',
+    'companies',
+    'jobs',
+    'applications',
+    'refresh_tokens',
+    'email_verification_tokens',
+    'password_reset_tokens',
+    'oauth_states',
+)
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.drop_index(f'ix_{table}_id', table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.create_index(f'ix_{table}_id', table, ['id'], unique=False)
@@ -0,0 +1,79 @@
+"""store_user_role_as_smallint
+
+Revision ID: c5f9b3d7e1a8
+Revises: b2e6f8a3d5c9
+Create Date: 2026-10-15 18:31:27.651093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5f9b3d7e1a8'
+down_revision: Union[str, None] = 'b2e6f8a3d5c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Role values in UserRole declaration order (code = position)
+ROLES = ('regular_user', 'employer', 'admin')
+ROLE_CHECK = f"role BETWEEN 0 AND {len(ROLES) - 1}"
+
+
+def _to_code() -> str:
+    whens = ' '.join(f"WHEN '{name}' THEN {code}" for code, name in enumerate(ROLES))
+    return f"CASE role {whens} END"
+
+
+def _to_name() -> str:
+    whens = ' '.join(f"WHEN {code} THEN '{name}'" for code, name in enumerate(ROLES))
+    return f"CASE role {whens} END"
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.alter_column(
+            'users',
+            'role',
+            existing_type=sa.String(length=20),
+            type_=sa.SmallInteger(),
+            existing_nullable=False,
+            postgresql_using=_to_code(),
+        )
+        op.create_check_constraint('ck_users_role', 'users', ROLE_CHECK)
+    else:
+        op.execute(f"UPDATE users SET role = {_to_code()}")
+        with op.batch_alter_table('users', schema=None) as batch_op:
+            batch_op.alter_column(
+                'role',
+                existing_type=sa.String(length=20),
+                type_=sa.SmallInteger(),
+                existing_nullable=False,
+            )
+            batch_op.create_check_constraint('ck_users_role', ROLE_CHECK)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_constraint('ck_users_role', 'users', type_='check')
+        op.alter_column(
+            'users',
+            'role',
+            existing_type=sa.SmallInteger(),
+            type_=sa.String(length=20),
+            existing_nullable=False,
+            postgresql_using=_to_name(),
+        )
+    else:
+        with op.batch_alter_table('users', schema=None) as batch_op:
+            batch_op.drop_constraint('ck_users_role', type_='check')
+            batch_op.alter_column(
+                'role',
+                existing_type=sa.SmallInteger(),
+                type_=sa.String(length=20),
+                existing_nullable=False,
+            )
+        op.execute(f"UPDATE users SET role = {_to_name()}")
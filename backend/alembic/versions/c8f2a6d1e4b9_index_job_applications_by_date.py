@@ -0,0 +1,30 @@
+"""index_job_applications_by_date
+
+Revision ID: c8f2a6d1e4b9
+Revises: b5e1c8d4f2a7
+Create Date: 2026-10-16 10:02:45.718204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8f2a6d1e4b9'
+down_revision: Union[str, None] = 'b5e1c8d4f2a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A job's applications without a status filter, newest first: the
+    # (job_id, status, applied_at) index can't return them in date order
+    with op.batch_alter_table('applications', schema=None) as batch_op:
+        batch_op.create_index('ix_applications_job_applied_at', ['job_id', 'applied_at'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('applications', schema=None) as batch_op:
+        batch_op.drop_index('ix_applications_job_applied_at')
@@ -0,0 +1,42 @@
+"""partial_indexes_on_active_tokens
+
+Revision ID: d7b2f9e4a1c6
+Revises: c3a7e5b9d2f4
+Create Date: 2026-10-15 15:48:29.150372
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7b2f9e4a1c6'
+down_revision: Union[str, None] = 'c3a7e5b9d2f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_refresh_tokens_user_revoked', table_name='refresh_tokens')
+    op.create_index(
+        'ix_refresh_tokens_user_active',
+        'refresh_tokens',
+        ['user_id'],
+        postgresql_where=sa.text('revoked = false'),
+        sqlite_where=sa.text('revoked = 0'),
+    )
+    op.create_index(
+        'ix_password_reset_tokens_user_unused',
+        'password_reset_tokens',
+        ['user_id'],
+        postgresql_where=sa.text('used = false'),
+        sqlite_where=sa.text('used = 0'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_password_reset_tokens_user_unused', table_name='password_reset_tokens')
+    op.drop_index('ix_refresh_tokens_user_active', table_name='refresh_tokens')
+    op.create_index('ix_refresh_tokens_user_revoked', 'refresh_tokens', ['user_id', 'revoked'], unique=False)
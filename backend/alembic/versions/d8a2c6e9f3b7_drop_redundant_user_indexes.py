@@ -0,0 +1,30 @@
+"""drop_redundant_user_indexes
+
+Revision ID: d8a2c6e9f3b7
+Revises: c5f9b3d7e1a8
+Create Date: 2026-10-15 18:55:12.984620
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8a2c6e9f3b7'
+down_revision: Union[str, None] = 'c5f9b3d7e1a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # email is already unique, so (email, is_active) never narrows a lookup
+    op.drop_index('ix_users_email_active', table_name='users')
+    # OAuth lookups filter on both columns, served by ix_users_oauth_provider
+    op.drop_index(op.f('ix_users_oauth_provider_id'), table_name='users')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_users_oauth_provider_id'), 'users', ['oauth_provider_id'], unique=False)
+    op.create_index('ix_users_email_active', 'users', ['email', 'is_active'], unique=False)
@@ -0,0 +1,88 @@
+"""store_enums_as_smallint
+
+Revision ID: d9b3f6a2c8e1
+Revises: c4a8e1f5b2d6
+Create Date: 2026-10-15 12:20:33.905147
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9b3f6a2c8e1'
+down_revision: Union[str, None] = 'c4a8e1f5b2d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, enum type name, member names in declaration order)
+ENUM_COLUMNS = (
+    ('applications', 'status', 'applicationstatus',
+     ('PENDING', 'REVIEWING', 'INTERVIEW', 'REJECTED', 'ACCEPTED', 'WITHDRAWN')),
+    ('jobs', 'level', 'joblevel',
+     ('JUNIOR', 'MIDDLE', 'SENIOR', 'LEAD')),
+)
+
+
+def _to_code(column: str, members: tuple, cast: str = '') -> str:
+    whens = ' '.join(f"WHEN '{name}' THEN {code}" for code, name in enumerate(members))
+    return f"CASE {column}{cast} {whens} END"
+
+
+def _to_name(column: str, members: tuple) -> str:
+    whens = ' '.join(f"WHEN {code} THEN '{name}'" for code, name in enumerate(members))
+    return f"CASE {column} {whens} END"
+
+
+def upgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == 'postgresql'
+
+    for table, column, enum_name, members in ENUM_COLUMNS:
+        if is_postgres:
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.Enum(*members, name=enum_name),
+                type_=sa.SmallInteger(),
+                existing_nullable=False,
+                postgresql_using=_to_code(column, members, '::text'),
+            )
+            op.execute(f"DROP TYPE IF EXISTS {enum_name}")
+        else:
+            op.execute(f"UPDATE {table} SET {column} = {_to_code(column, members)}")
+            with op.batch_alter_table(table, schema=None) as batch_op:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.Enum(*members, name=enum_name),
+                    type_=sa.SmallInteger(),
+                    existing_nullable=False,
+                )
+
+
+def downgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == 'postgresql'
+
+    for table, column, enum_name, members in ENUM_COLUMNS:
+        enum_type = sa.Enum(*members, name=enum_name)
+        if is_postgres:
+            enum_type.create(op.get_bind(), checkfirst=True)
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.SmallInteger(),
+                type_=enum_type,
+                existing_nullable=False,
+                postgresql_using=f"({_to_name(column, members)})::{enum_name}",
+            )
+        else:
+            with op.batch_alter_table(table, schema=None) as batch_op:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.SmallInteger(),
+                    type_=enum_type,
+                    existing_nullable=False,
+                )
+            op.execute(f"UPDATE {table} SET {column} = {_to_name(column, members)}")
@@ -0,0 +1,63 @@
+"""users_updated_at_trigger
+
+Revision ID: e1f7a3c9b5d2
+Revises: d8a2c6e9f3b7
+Create Date: 2026-10-15 23:20:41.517302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1f7a3c9b5d2'
+down_revision: Union[str, None] = 'd8a2c6e9f3b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Every users column except updated_at itself
+USER_COLUMNS = (
+    'id', 'email', 'hashed_password', 'full_name', 'role', 'is_active',
+    'is_verified', 'oauth_provider', 'oauth_provider_id', 'created_at',
+)
+
+
+def upgrade() -> None:
+    # Bump updated_at in the database, and only when the row really changed
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("""
+            CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+            BEGIN
+                NEW.updated_at = now();
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql
+        """)
+        op.execute("""
+            CREATE TRIGGER trg_users_updated_at
+            BEFORE UPDATE ON users
+            FOR EACH ROW
+            WHEN (OLD.* IS DISTINCT FROM NEW.*)
+            EXECUTE FUNCTION set_updated_at()
+        """)
+    else:
+        changed = ' OR '.join(f'OLD.{c} IS NOT NEW.{c}' for c in USER_COLUMNS)
+        op.execute(f"""
+            CREATE TRIGGER trg_users_updated_at
+            AFTER UPDATE ON users
+            FOR EACH ROW
+            WHEN OLD.updated_at IS NEW.updated_at AND ({changed})
+            BEGIN
+                UPDATE users SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+            END
+        """)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('DROP TRIGGER IF EXISTS trg_users_updated_at ON users')
+        op.execute('DROP FUNCTION IF EXISTS set_updated_at()')
+    else:
+        op.execute('DROP TRIGGER IF EXISTS trg_users_updated_at')
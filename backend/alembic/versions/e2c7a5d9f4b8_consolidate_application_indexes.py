@@ -0,0 +1,42 @@
+"""consolidate_application_indexes
+
+Revision ID: e2c7a5d9f4b8
+Revises: d9b3f6a2c8e1
+Create Date: 2026-10-15 12:58:16.402733
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2c7a5d9f4b8'
+down_revision: Union[str, None] = 'd9b3f6a2c8e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('applications', schema=None) as batch_op:
+        # Covered by the composite (user_id, ...) and (job_id, status) indexes
+        batch_op.drop_index('ix_applications_user_id')
+        batch_op.drop_index('ix_applications_job_id')
+        batch_op.drop_index('ix_applications_status')
+        batch_op.drop_index('ix_applications_unique_user_job')
+        batch_op.create_index(
+            'uq_applications_user_job',
+            ['user_id', 'job_id'],
+            unique=True,
+            postgresql_include=['applied_at', 'status'],
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('applications', schema=None) as batch_op:
+        batch_op.drop_index('uq_applications_user_job')
+        batch_op.create_index('ix_applications_unique_user_job', ['user_id', 'job_id'], unique=True)
+        batch_op.create_index('ix_applications_status', ['status'], unique=False)
+        batch_op.create_index('ix_applications_job_id', ['job_id'], unique=False)
+        batch_op.create_index('ix_applications_user_id', ['user_id'], unique=False)
@@ -0,0 +1,31 @@
+"""index_password_reset_expires_at
+
+Revision ID: e4c8a3f6b7d2
+Revises: d7b2f9e4a1c6
+Create Date: 2026-10-15 16:22:37.590184
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4c8a3f6b7d2'
+down_revision: Union[str, None] = 'd7b2f9e4a1c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f('ix_password_reset_tokens_expires_at'),
+        'password_reset_tokens',
+        ['expires_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_password_reset_tokens_expires_at'), table_name='password_reset_tokens')
@@ -0,0 +1,48 @@
+"""cluster_saved_jobs_by_user
+
+Revision ID: f3b9d5a1c7e4
+Revises: e1f7a3c9b5d2
+Create Date: 2026-10-15 23:41:07.205836
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b9d5a1c7e4'
+down_revision: Union[str, None] = 'e1f7a3c9b5d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep each user's saved jobs physically together
+    if op.get_bind().dialect.name == 'postgresql':
+        # CLUSTER is a one-off rewrite (ACCESS EXCLUSIVE lock); rerun it
+        # periodically, PostgreSQL does not maintain the order on insert
+        op.execute(
+            'ALTER TABLE saved_jobs SET (fillfactor = 90), '
+            'CLUSTER ON ix_saved_jobs_user_saved_at'
+        )
+        op.execute('CLUSTER saved_jobs')
+    else:
+        # WITHOUT ROWID stores rows in primary key (user_id, job_id) order
+        with op.batch_alter_table(
+            'saved_jobs', recreate='always', table_kwargs={'sqlite_with_rowid': False}
+        ):
+            pass
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            'ALTER TABLE saved_jobs RESET (fillfactor), SET WITHOUT CLUSTER'
+        )
+    else:
+        with op.batch_alter_table(
+            'saved_jobs', recreate='always', table_kwargs={'sqlite_with_rowid': True}
+        ):
+            pass
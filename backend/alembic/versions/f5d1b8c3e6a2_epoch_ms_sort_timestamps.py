@@ -0,0 +1,88 @@
+"""epoch_ms_sort_timestamps
+
+Revision ID: f5d1b8c3e6a2
+Revises: e2c7a5d9f4b8
+Create Date: 2026-10-15 13:47:52.117094
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5d1b8c3e6a2'
+down_revision: Union[str, None] = 'e2c7a5d9f4b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column) sort keys stored as epoch milliseconds from now on
+EPOCH_COLUMNS = (
+    ('applications', 'applied_at'),
+    ('jobs', 'created_at'),
+)
+
+POSTGRES_EPOCH_MS_NOW = sa.text("CAST(EXTRACT(EPOCH FROM now()) * 1000 AS BIGINT)")
+SQLITE_EPOCH_MS_NOW = sa.text("(CAST(ROUND((julianday('now') - 2440587.5) * 86400000) AS INTEGER))")
+
+
+def upgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == 'postgresql'
+
+    for table, column in EPOCH_COLUMNS:
+        if is_postgres:
+            op.alter_column(table, column, server_default=None)
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.DateTime(),
+                type_=sa.BigInteger(),
+                existing_nullable=False,
+                postgresql_using=f"CAST(EXTRACT(EPOCH FROM {column}) * 1000 AS BIGINT)",
+            )
+            op.alter_column(table, column, server_default=POSTGRES_EPOCH_MS_NOW)
+        else:
+            op.execute(
+                f"UPDATE {table} SET {column} = "
+                f"CAST(ROUND((julianday({column}) - 2440587.5) * 86400000) AS INTEGER)"
+            )
+            with op.batch_alter_table(table, schema=None) as batch_op:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.DateTime(),
+                    type_=sa.BigInteger(),
+                    existing_nullable=False,
+                    server_default=SQLITE_EPOCH_MS_NOW,
+                )
+
+
+def downgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == 'postgresql'
+
+    for table, column in EPOCH_COLUMNS:
+        if is_postgres:
+            op.alter_column(table, column, server_default=None)
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.BigInteger(),
+                type_=sa.DateTime(),
+                existing_nullable=False,
+                postgresql_using=f"to_timestamp({column} / 1000.0) AT TIME ZONE 'UTC'",
+            )
+            op.alter_column(table, column, server_default=sa.func.now())
+        else:
+            with op.batch_alter_table(table, schema=None) as batch_op:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.BigInteger(),
+                    type_=sa.DateTime(),
+                    existing_nullable=False,
+                    server_default=sa.func.now(),
+                )
+            op.execute(
+                f"UPDATE {table} SET {column} = "
+                f"strftime('%Y-%m-%d %H:%M:%f', {column} / 1000.0, 'unixepoch')"
+            )
@@ -0,0 +1,31 @@
+"""index_email_verification_expires_at
+
+Revision ID: f6a1d4c9e2b5
+Revises: e4c8a3f6b7d2
+Create Date: 2026-10-15 16:49:53.027461
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6a1d4c9e2b5'
+down_revision: Union[str, None] = 'e4c8a3f6b7d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f('ix_email_verification_tokens_expires_at'),
+        'email_verification_tokens',
+        ['expires_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_email_verification_tokens_expires_at'), table_name='email_verification_tokens')
@@ -4,14 +4,60 @@ Application configuration using Pydantic Settings.
 Loads environment variables from .env file.
 """
 
+from functools import cached_property, lru_cache
+from typing import Any
+
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+class SMTPSettings(BaseSettings):
+    """Email / SMTP settings, loaded on first access via Settings.smtp."""
+
+    SMTP_HOST: str = "smtp.gmail.com"
+    SMTP_PORT: int = 587
+    SMTP_USER: str = ""
+    SMTP_PASSWORD: str = ""
+    SMTP_FROM_EMAIL: str = ""
+    SMTP_FROM_NAME: str = "Job Board"
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=True,
+        extra="ignore"
+    )
+
+
+class OAuthSettings(BaseSettings):
+    """OAuth 2.0 provider settings, loaded on first access via Settings.oauth."""
+
+    GOOGLE_CLIENT_ID: str = ""
+    GOOGLE_CLIENT_SECRET: str = ""
+    GITHUB_CLIENT_ID: str = ""
+    GITHUB_CLIENT_SECRET: str = ""
+    # Supports both HTTP and HTTPS for development
+    OAUTH_REDIRECT_URI: str = "http://localhost:3000/auth/callback"  # Change to https:// in production
+    OAUTH_STATE_EXPIRE_MINUTES: int = 10  # OAuth state token expiration
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=True,
+        extra="ignore"
+    )
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./jobs.db"
+    DATABASE_READ_URL: str | None = None  # Read replica for GET endpoints; defaults to DATABASE_URL
+    DB_ECHO: bool = False  # Log every SQL statement (debugging only)
+    DB_POOL_SIZE: int = 20  # Persistent connections per worker (server databases only)
+    DB_MAX_OVERFLOW: int = 40  # Extra connections opened during bursts
+    DB_POOL_TIMEOUT: int = 10  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # Replace connections older than this (seconds)
+    DB_POOL_PRE_PING: bool = False  # Test connections before use (e.g. behind NAT/LB idle timeouts)
 
     # CORS Configuration
     # Comma-separated list of allowed origins
@@ -19,6 +65,8 @@ class Settings(BaseSettings):
     # Production: "https://yourdomain.com,https://www.yourdomain.com"
     # Use "*" only for public APIs (not recommended with credentials)
     CORS_ORIGINS: str = "http://localhost:3000,https://localhost:3000"
+    # Optional regex for origins that can't be listed (e.g. "https://(.*\.)?yourdomain\.com")
+    CORS_ORIGIN_REGEX: str | None = None
     
     # CORS settings
     CORS_ALLOW_CREDENTIALS: bool = True
@@ -45,64 +93,84 @@ class Settings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
     REFRESH_TOKEN_REMEMBER_ME_EXPIRE_DAYS: int = 90
 
-    # OAuth 2.0
-    GOOGLE_CLIENT_ID: str = ""
-    GOOGLE_CLIENT_SECRET: str = ""
-    GITHUB_CLIENT_ID: str = ""
-    GITHUB_CLIENT_SECRET: str = ""
-    # Supports both HTTP and HTTPS for development
-    OAUTH_REDIRECT_URI: str = "http://localhost:3000/auth/callback"  # Change to https:// in production
-    OAUTH_STATE_EXPIRE_MINUTES: int = 10  # OAuth state token expiration
-
-    # Email / SMTP
-    SMTP_HOST: str = "smtp.gmail.com"
-    SMTP_PORT: int = 587
-    SMTP_USER: str = ""
-    SMTP_PASSWORD: str = ""
-    SMTP_FROM_EMAIL: str = ""
-    SMTP_FROM_NAME: str = "Job Board"
+    # Token lifetimes for email verification and password reset links
     EMAIL_VERIFICATION_EXPIRE_HOURS: int = 24
     PASSWORD_RESET_EXPIRE_HOURS: int = 1
 
+    # How often expired tokens and OAuth states are purged
+    TOKEN_CLEANUP_INTERVAL_MINUTES: int = 10
+
     # Rate Limiting
     RATE_LIMIT_ENABLED: bool = False  # Temporarily disabled for debugging
     RATE_LIMIT_STORAGE_URI: str = "memory://"  # Use "redis://localhost:6379" for production
+    RATE_LIMIT_STRATEGY: str = "moving-window"  # Or "fixed-window" (cheaper, burstier)
     LOGIN_RATE_LIMIT: str = "5/minute"
     REGISTER_RATE_LIMIT: str = "3/minute"
     PASSWORD_RESET_RATE_LIMIT: str = "3/hour"
     API_RATE_LIMIT: str = "100/minute"  # General API rate limit
     SEARCH_RATE_LIMIT: str = "30/minute"  # Search endpoints
 
-    # Frontend
-    FRONTEND_URL: str = "http://localhost:3000"
-
     model_config = SettingsConfigDict(
         env_file=".env",
-        case_sensitive=True
+        case_sensitive=True,
+        extra="ignore"  # SMTP/OAuth keys are read by their own settings groups
     )
 
-    @property
-    def cors_origins_list(self) -> list[str]:
+    @cached_property
+    def smtp(self) -> SMTPSettings:
+        """SMTP settings, parsed on first access."""
+        return SMTPSettings()
+
+    @cached_property
+    def oauth(self) -> OAuthSettings:
+        """OAuth provider settings, parsed on first access."""
+        return OAuthSettings()
+
+    # Parsed CORS origins, computed once in model_post_init
+    _cors_origins: tuple[str, ...] = PrivateAttr(default=())
+
+    def model_post_init(self, __context: Any) -> None:
         """
-        Convert CORS_ORIGINS string to list and validate.
-        
-        Returns:
-            list[str]: List of allowed origins
-            
+        Parse and validate CORS_ORIGINS once at startup.
+
         Note:
             - Strips whitespace from each origin
             - Supports wildcard "*" for public APIs
             - Validates origin format (must start with http:// or https://)
         """
-        origins = [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
-        
+        origins = tuple(origin.strip() for origin in self.CORS_ORIGINS.split(","))
+
         # Validate origins (except wildcard)
         for origin in origins:
             if origin != "*" and not (origin.startswith("http://") or origin.startswith("https://")):
                 raise ValueError(f"Invalid CORS origin: {origin}. Must start with http:// or https://")
-        
-        return origins
+
+        self._cors_origins = origins
+
+    @property
+    def cors_origins_list(self) -> tuple[str, ...]:
+        """
+        Allowed CORS origins parsed from CORS_ORIGINS.
+
+        Returns:
+            tuple[str, ...]: Allowed origins (validated at startup)
+        """
+        return self._cors_origins
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the cached application settings.
+
+    The .env file is parsed only once per process; use with
+    Depends(get_settings) so tests can override it.
+
+    Returns:
+        Settings: Application settings
+    """
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
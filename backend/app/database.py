@@ -4,7 +4,8 @@ Async SQLAlchemy database configuration.
 Provides async engine, session factory, and dependency injection.
 """
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
+from sqlalchemy import event, insert
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     create_async_engine,
@@ -15,13 +16,99 @@ from sqlalchemy.orm import DeclarativeBase
 from app.config import settings
 
 
+def _engine_options(database_url: str, pre_ping: bool = False) -> dict:
+    """
+    Build backend-specific engine options.
+
+    SQLite uses a local file, so it needs no pool tuning or pre-ping.
+    Server databases keep a warm pool to avoid reconnect handshakes.
+
+    Pool sizing is per worker process (DB_POOL_* settings, defaults in
+    brackets): persistent connections cover the expected concurrent
+    requests [20], bursts may open more [40], and a request that still
+    can't get a connection fails after DB_POOL_TIMEOUT [10 s] instead of
+    queueing indefinitely. Keep workers * (pool_size + max_overflow) below
+    the server's max_connections. Async engines already use
+    AsyncAdaptedQueuePool.
+
+    Args:
+        database_url: SQLAlchemy database URL
+        pre_ping: Check server connections before use even if
+            DB_POOL_PRE_PING is off (for rarely used pools)
+
+    Returns:
+        dict: Keyword arguments for create_async_engine
+    """
+    if database_url.startswith("sqlite"):
+        return {"connect_args": {"check_same_thread": False}}
+
+    options: dict[str, Any] = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_pre_ping": pre_ping or settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    if "+asyncpg" in database_url:
+        # Have the server probe idle connections, so ones dropped by a
+        # NAT/load balancer are noticed instead of hanging the next query
+        options["connect_args"] = {
+            "server_settings": {"tcp_keepalives_idle": "60"}
+        }
+    return options
+
+
+# SQLite tuning applied to every new connection:
+# WAL lets readers run alongside a writer, NORMAL sync skips the fsync on each
+# commit (still safe in WAL mode), and temp tables, page cache (64 MB) and
+# mmap (256 MB) stay in memory. Foreign keys are enforced so ON DELETE
+# CASCADE / SET NULL apply to bulk deletes as they do on PostgreSQL.
+SQLITE_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Apply SQLITE_PRAGMAS to a freshly opened SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True
+    echo=settings.DB_ECHO,
+    future=True,
+    **_engine_options(settings.DATABASE_URL)
 )
 
+if settings.DATABASE_URL.startswith("sqlite"):
+    event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+
+# Separate pool for read-only endpoints, so writers never queue behind
+# long-running reads. Replica connections may sit idle for a long time,
+# so they are pre-pinged.
+if settings.DATABASE_READ_URL:
+    read_engine = create_async_engine(
+        settings.DATABASE_READ_URL,
+        echo=settings.DB_ECHO,
+        future=True,
+        **_engine_options(settings.DATABASE_READ_URL, pre_ping=True)
+    )
+    if settings.DATABASE_READ_URL.startswith("sqlite"):
+        event.listen(read_engine.sync_engine, "connect", _set_sqlite_pragmas)
+else:
+    read_engine = engine
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -32,15 +119,62 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+# Session factory for read-only work (replica if configured)
+ReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False
+)
+
+
+# Session factory for read-only request handlers. AUTOCOMMIT runs each
+# SELECT on its own, so reads skip the BEGIN/ROLLBACK round trips and never
+# hold a transaction open. Streamed results need a transaction for their
+# server-side cursor, so streams keep using ReadSessionLocal.
+ReadOnlySessionLocal = async_sessionmaker(
+    read_engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False
+)
+
+
 # Base class for all models
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
-    pass
+
+    @classmethod
+    async def bulk_create(cls, db: AsyncSession, rows: list[dict[str, Any]]) -> list[int]:
+        """
+        Insert many rows in a single INSERT ... RETURNING statement.
+
+        Skips the unit of work and identity map, so no ORM instances are
+        created. Column defaults still apply. The caller commits.
+
+        Args:
+            db: Database session
+            rows: Column values for each new row
+
+        Returns:
+            list[int]: IDs of the inserted rows, in the order of `rows`
+        """
+        if not rows:
+            return []
+
+        stmt = insert(cls).returning(cls.id, sort_by_parameter_order=True)
+        result = await db.execute(stmt, rows)
+        return list(result.scalars())
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency injection for database sessions.
+
+    The session is not committed implicitly, so read-only requests never
+    pay for a COMMIT. Services that write call `await db.commit()` themselves.
     
     Yields:
         AsyncSession: Database session
@@ -53,7 +187,6 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -61,6 +194,22 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency injection for read-only database sessions.
+
+    Served from DATABASE_READ_URL when set, so reads may lag slightly
+    behind writes. Statements run in autocommit mode, without a wrapping
+    transaction, so two queries in one request may see different
+    snapshots. Use get_db for anything that writes.
+
+    Yields:
+        AsyncSession: Read-only database session
+    """
+    async with ReadOnlySessionLocal() as session:
+        yield session
+
+
 async def init_db() -> None:
     """
     Initialize database tables.
@@ -73,3 +222,5 @@ async def init_db() -> None:
 async def close_db() -> None:
     """Close database connections."""
     await engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
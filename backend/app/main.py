@@ -4,12 +4,52 @@ FastAPI application entry point.
 Configures CORS, lifespan events, and routes.
 """
 
-from contextlib import asynccontextmanager
-from fastapi import FastAPI
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from slowapi import _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
 
 from app.config import settings
-from app.database import init_db, close_db
+from app.database import AsyncSessionLocal, init_db, close_db
+from app.routes import (
+    jobs_router,
+    companies_router,
+    auth_router,
+    saved_jobs_router,
+    applications_router,
+    hh_router
+)
+from app.services.auth_service import cleanup_expired_tokens
+from app.services.hh_client import HHService
+from app.services.oauth_service import close_http_client, get_http_client
+from app.services.oauth_service import cleanup_expired_oauth_states
+from app.utils.rate_limit import limiter
+
+logger = logging.getLogger(__name__)
+
+
+async def _purge_expired_tokens() -> None:
+    """
+    Periodically delete tokens that can no longer be redeemed.
+
+    Covers used/expired OAuth states and expired refresh, password reset
+    and email verification tokens, so those tables (and their indexes)
+    stay small.
+    """
+    interval = settings.TOKEN_CLEANUP_INTERVAL_MINUTES * 60
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                await cleanup_expired_oauth_states(db)
+                await cleanup_expired_tokens(db)
+        except Exception:
+            logger.exception("Failed to purge expired tokens")
+        await asyncio.sleep(interval)
 
 
 @asynccontextmanager
@@ -19,19 +59,32 @@ async def lifespan(app: FastAPI):
     
     Startup:
         - Initialize database tables
+        - Start periodic cleanup of expired tokens
+        - Open the shared HH API and OAuth provider clients
         
     Shutdown:
+        - Close the HH API and OAuth provider clients
+        - Stop token cleanup
         - Close database connections
     """
     # Startup
     print(">> Starting Job Board API...")
     await init_db()
     print(">> Database initialized")
+    purge_task = asyncio.create_task(_purge_expired_tokens())
+    app.state.hh = HHService()
+    await app.state.hh.open()
+    get_http_client()
     
     yield
     
     # Shutdown
     print(">> Shutting down Job Board API...")
+    await app.state.hh.close()
+    await close_http_client()
+    purge_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await purge_task
     await close_db()
     print(">> Database connections closed")
 
@@ -42,19 +95,28 @@ app = FastAPI(
     version=settings.VERSION,
     description=settings.DESCRIPTION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc"
 )
 
 # Add rate limiter to app state
-from app.utils.rate_limit import limiter
-from slowapi import _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
-
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 
+# Security headers, encoded once at import time
+_STATIC_HEADERS = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+)
+_HSTS_HEADER = (b"strict-transport-security", b"max-age=31536000; includeSubDomains; preload")
+# HSTS only in production (force HTTPS)
+_SECURITY_HEADERS = _STATIC_HEADERS + (() if settings.DEBUG else (_HSTS_HEADER,))
+_SECURITY_HEADER_NAMES = frozenset(name for name, _ in _SECURITY_HEADERS)
+
+
 # Security middleware for production
 @app.middleware("http")
 async def add_security_headers(request, call_next):
@@ -66,17 +128,19 @@ async def add_security_headers(request, call_next):
         - X-Content-Type-Options: Prevent MIME type sniffing
         - X-Frame-Options: Prevent clickjacking
         - X-XSS-Protection: Enable XSS filter
+
+    These replace any value a route or inner middleware already set, so
+    each header is sent exactly once.
     """
     response = await call_next(request)
+    raw_headers = response.raw_headers
     
-    # Add HSTS header in production (force HTTPS)
-    if not settings.DEBUG:
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains; preload"
-    
-    # Security headers (always enabled)
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["X-XSS-Protection"] = "1; mode=block"
+    # Overwrite rather than duplicate; most responses have none of these
+    if any(name in _SECURITY_HEADER_NAMES for name, _ in raw_headers):
+        raw_headers[:] = [
+            header for header in raw_headers if header[0] not in _SECURITY_HEADER_NAMES
+        ]
+    raw_headers.extend(_SECURITY_HEADERS)
     
     return response
 
@@ -84,9 +148,13 @@ async def add_security_headers(request, call_next):
 # Configure CORS
 # CORS (Cross-Origin Resource Sharing) allows the frontend to make requests to the backend
 # from a different origin (domain, protocol, or port)
+# Origins are checked on every request, so use a set for O(1) membership
+_ALLOW_ORIGINS = frozenset(settings.cors_origins_list)
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins_list,  # List of allowed origins
+    allow_origins=_ALLOW_ORIGINS,  # Set of allowed origins
+    allow_origin_regex=settings.CORS_ORIGIN_REGEX,  # Compiled once by the middleware
     allow_credentials=settings.CORS_ALLOW_CREDENTIALS,  # Allow cookies and auth headers
     allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],  # Allowed HTTP methods
     allow_headers=[
@@ -106,6 +174,20 @@ app.add_middleware(
 )
 
 
+# Static response bodies, encoded once at import time
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "version": settings.VERSION,
+    "service": settings.PROJECT_NAME
+})
+_ROOT_BODY = orjson.dumps({
+    "message": "Welcome to Job Board API",
+    "version": settings.VERSION,
+    "docs": "/docs",
+    "health": "/health"
+})
+
+
 # Health check endpoint
 @app.get("/health", tags=["Health"])
 async def health_check():
@@ -113,13 +195,9 @@ async def health_check():
     Health check endpoint.
     
     Returns:
-        dict: Status and version information
+        Response: Status and version information (pre-encoded JSON)
     """
-    return {
-        "status": "healthy",
-        "version": settings.VERSION,
-        "service": settings.PROJECT_NAME
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 # Root endpoint
@@ -129,14 +207,9 @@ async def root():
     Root endpoint with API information.
     
     Returns:
-        dict: Welcome message and documentation links
+        Response: Welcome message and documentation links (pre-encoded JSON)
     """
-    return {
-        "message": "Welcome to Job Board API",
-        "version": settings.VERSION,
-        "docs": "/docs",
-        "health": "/health"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 # Test endpoint to debug
@@ -147,18 +220,15 @@ async def test_endpoint():
 
 
 # Include API routers
-from app.routes import (
-    jobs_router,
-    companies_router,
-    auth_router,
-    saved_jobs_router,
-    applications_router
+_ROUTERS = (
+    (auth_router, ["Authentication"]),
+    (jobs_router, ["Jobs"]),
+    (companies_router, ["Companies"]),
+    (saved_jobs_router, ["Saved Jobs"]),
+    (applications_router, ["Applications"]),
+    (hh_router, ["HeadHunter"]),
 )
-from app.routes.hh_vacancies import router as hh_router
-
-app.include_router(auth_router, prefix=settings.API_V1_PREFIX, tags=["Authentication"])
-app.include_router(jobs_router, prefix=settings.API_V1_PREFIX, tags=["Jobs"])
-app.include_router(companies_router, prefix=settings.API_V1_PREFIX, tags=["Companies"])
-app.include_router(saved_jobs_router, prefix=settings.API_V1_PREFIX, tags=["Saved Jobs"])
-app.include_router(applications_router, prefix=settings.API_V1_PREFIX, tags=["Applications"])
-app.include_router(hh_router, prefix=settings.API_V1_PREFIX, tags=["HeadHunter"])
+_PREFIX = settings.API_V1_PREFIX
+
+for router, tags in _ROUTERS:
+    app.include_router(router, prefix=_PREFIX, tags=tags)
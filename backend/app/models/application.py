@@ -6,14 +6,20 @@ Represents a job application submitted by a user.
 
 from datetime import datetime
 from enum import Enum as PyEnum
-from sqlalchemy import Integer, String, ForeignKey, DateTime, Enum, Text, Index
+from typing import TYPE_CHECKING
+from sqlalchemy import Integer, String, ForeignKey, DateTime, Text, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.models.types import EnumInt, EpochMs, epoch_ms_now
+
+if TYPE_CHECKING:
+    from app.models.job import Job
+    from app.models.user import User
 
 
 class ApplicationStatus(str, PyEnum):
-    """Application status enum."""
+    """Application status enum (stored as SMALLINT; append new members only)."""
     PENDING = "pending"
     REVIEWING = "reviewing"
     INTERVIEW = "interview"
@@ -33,38 +39,37 @@ class Application(Base):
         - Many applications belong to one job (many-to-one)
 
     Indexes:
-        - user_id: For fetching all applications by a user
-        - job_id: For fetching all applications for a job
-        - status: For filtering by status
+        - (user_id, job_id): Unique; one application per user per job
+        - (user_id, applied_at): For a user's applications by date
+        - (user_id, status, applied_at): Same, filtered by status
+        - (job_id, applied_at): For a job's applications by date
+        - (job_id, status, applied_at): Same, filtered by status
         - applied_at: For sorting by application date
     """
 
     __tablename__ = "applications"
 
     # Primary Key
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
     # Foreign Keys
     user_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     job_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("jobs.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Application Details
     status: Mapped[ApplicationStatus] = mapped_column(
-        Enum(ApplicationStatus),
+        EnumInt(ApplicationStatus),
         default=ApplicationStatus.PENDING,
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     cover_letter: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -73,16 +78,16 @@ class Application(Base):
 
     # Timestamps
     applied_at: Mapped[datetime] = mapped_column(
-        DateTime,
-        default=datetime.utcnow,
+        EpochMs,
+        server_default=epoch_ms_now(),
         nullable=False,
         index=True
     )
 
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
 
@@ -97,12 +102,24 @@ class Application(Base):
         back_populates="applications"
     )
 
-    # Composite indexes for common query patterns
+    # Composite indexes for common query patterns; they also serve lookups
+    # on their leading column, so user_id/job_id need no indexes of their own
     __table_args__ = (
         Index("ix_applications_user_applied_at", "user_id", "applied_at"),
-        Index("ix_applications_job_status", "job_id", "status"),
-        Index("ix_applications_unique_user_job", "user_id", "job_id", unique=True),
+        Index("ix_applications_user_status_applied", "user_id", "status", "applied_at"),
+        Index("ix_applications_job_applied_at", "job_id", "applied_at"),
+        Index("ix_applications_job_status_applied", "job_id", "status", "applied_at"),
+        Index(
+            "uq_applications_user_job",
+            "user_id",
+            "job_id",
+            unique=True,
+            postgresql_include=["applied_at", "status"],
+        ),
     )
 
+    # Fetch server-generated timestamps in the INSERT/UPDATE itself (RETURNING)
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         return f"<Application(id={self.id}, user_id={self.user_id}, job_id={self.job_id}, status={self.status})>"
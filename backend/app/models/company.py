@@ -4,12 +4,16 @@ Company SQLAlchemy model.
 Represents tech companies posting jobs.
 """
 
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 from sqlalchemy import String, Text, Integer, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
+if TYPE_CHECKING:
+    from app.models.job import Job
+    from app.models.user import User
+
 
 class Company(Base):
     """
@@ -23,7 +27,7 @@ class Company(Base):
     __tablename__ = "companies"
 
     # Primary Key
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True)
 
     # Company Information
     name: Mapped[str] = mapped_column(String(200), nullable=False, unique=True)
@@ -5,11 +5,15 @@ Manages email verification tokens for user registration.
 """
 
 from datetime import datetime
-from sqlalchemy import String, Integer, ForeignKey, Boolean, DateTime
+from typing import TYPE_CHECKING
+from sqlalchemy import String, Integer, ForeignKey, Boolean, DateTime, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
+if TYPE_CHECKING:
+    from app.models.user import User
+
 
 class EmailVerificationToken(Base):
     """
@@ -24,16 +28,17 @@ class EmailVerificationToken(Base):
     Indexes:
         - token: For fast token lookup (unique)
         - user_id: For user-specific queries
+        - expires_at: For cleanup of expired tokens
     """
 
     __tablename__ = "email_verification_tokens"
 
     # Primary Key
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True)
 
     # Token Information
     token: Mapped[str] = mapped_column(
-        String(255),
+        String(64),
         unique=True,
         nullable=False,
         index=True
@@ -57,13 +62,14 @@ class EmailVerificationToken(Base):
     # Expiration
     expires_at: Mapped[datetime] = mapped_column(
         DateTime,
-        nullable=False
+        nullable=False,
+        index=True
     )
 
     # Timestamp
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False
     )
 
@@ -73,5 +79,8 @@ class EmailVerificationToken(Base):
         back_populates="email_verification_tokens"
     )
 
+    # Fetch server-generated timestamps in the INSERT itself (RETURNING)
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         return f"<EmailVerificationToken(id={self.id}, user_id={self.user_id}, used={self.used})>"
@@ -6,17 +6,24 @@ Represents job postings with company relationships.
 
 import enum
 from datetime import datetime
-from typing import Optional, List
-from sqlalchemy import String, Text, Integer, ForeignKey, Enum, DateTime, Index
+from typing import TYPE_CHECKING, Optional, List
+from sqlalchemy import DDL, String, Text, Integer, ForeignKey, Index, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.models.types import EnumInt, EpochMs, epoch_ms_now
+
+if TYPE_CHECKING:
+    from app.models.application import Application
+    from app.models.company import Company
+    from app.models.saved_job import SavedJob
+    from app.models.user import User
 
 
 class JobLevel(str, enum.Enum):
     """
     Job seniority level enumeration.
-    Enforces valid values at database level.
+    Stored as SMALLINT in declaration order; append new members only.
     """
     JUNIOR = "junior"
     MIDDLE = "middle"
@@ -36,12 +43,14 @@ class Job(Base):
         - level: For seniority level filtering
         - created_at: For sorting by date
         - company_id: For company-based queries (foreign key auto-indexed)
+        - title, description, location trigram GIN (PostgreSQL only): serve
+          the ILIKE '%...%' search and location filters without a seq scan
     """
     
     __tablename__ = "jobs"
     
     # Primary Key
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True)
     
     # Job Information
     title: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -49,7 +58,7 @@ class Job(Base):
     location: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
     salary: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     level: Mapped[JobLevel] = mapped_column(
-        Enum(JobLevel),
+        EnumInt(JobLevel),
         nullable=False,
         index=True
     )
@@ -70,8 +79,8 @@ class Job(Base):
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
-        default=datetime.utcnow,
+        EpochMs,
+        server_default=epoch_ms_now(),
         nullable=False,
         index=True
     )
@@ -104,7 +113,27 @@ class Job(Base):
     __table_args__ = (
         Index("ix_jobs_location_level", "location", "level"),
         Index("ix_jobs_company_created", "company_id", "created_at"),
+        *(
+            Index(
+                f"ix_jobs_{column}_trgm",
+                column,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            ).ddl_if(dialect="postgresql")
+            for column in ("title", "description", "location")
+        ),
     )
+
+    # Fetch server-generated timestamps in the INSERT itself (RETURNING)
+    __mapper_args__ = {"eager_defaults": True}
     
     def __repr__(self) -> str:
         return f"<Job(id={self.id}, title='{self.title}', level={self.level.value})>"
+
+
+# Trigram operator classes for the GIN indexes above
+event.listen(
+    Job.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
@@ -4,7 +4,7 @@ OAuth state token model for CSRF protection.
 """
 
 from datetime import datetime
-from sqlalchemy import String, DateTime, Boolean
+from sqlalchemy import String, DateTime, Boolean, Index, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -16,15 +16,27 @@ class OAuthState(Base):
     
     Stores state parameter used in OAuth flow to prevent CSRF attacks.
     State tokens expire after a short period (default 10 minutes).
+    Used and expired rows are purged periodically, so the table stays small.
     """
     __tablename__ = "oauth_states"
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    state: Mapped[str] = mapped_column(String(64), unique=True, index=True, nullable=False)
+    id: Mapped[int] = mapped_column(primary_key=True)
+    state: Mapped[str] = mapped_column(String(64), nullable=False)
     provider: Mapped[str] = mapped_column(String(20), nullable=False)  # 'google' or 'github'
     used: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
+
+    # Only unused states are ever looked up, so index just those
+    __table_args__ = (
+        Index(
+            "ix_oauth_states_state_active",
+            "state",
+            unique=True,
+            postgresql_where=text("used = false"),
+            sqlite_where=text("used = 0"),
+        ),
+    )
 
     def __repr__(self) -> str:
         return f"<OAuthState(state={self.state[:8]}..., provider={self.provider}, used={self.used})>"
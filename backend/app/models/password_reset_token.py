@@ -5,11 +5,15 @@ Manages password reset tokens for account recovery.
 """
 
 from datetime import datetime
-from sqlalchemy import String, Integer, ForeignKey, Boolean, DateTime
+from typing import TYPE_CHECKING
+from sqlalchemy import String, Integer, ForeignKey, Boolean, DateTime, Index, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
+if TYPE_CHECKING:
+    from app.models.user import User
+
 
 class PasswordResetToken(Base):
     """
@@ -22,21 +26,21 @@ class PasswordResetToken(Base):
         - Many reset tokens belong to one user (many-to-one)
 
     Indexes:
-        - token: For fast token lookup (unique)
+        - token: For fast token lookup (hash index; equality only)
         - user_id: For user-specific queries
+        - user_id WHERE NOT used: For a user's outstanding tokens (partial)
+        - expires_at: For cleanup of expired tokens
     """
 
     __tablename__ = "password_reset_tokens"
 
     # Primary Key
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True)
 
     # Token Information
     token: Mapped[str] = mapped_column(
-        String(255),
-        unique=True,
-        nullable=False,
-        index=True
+        String(64),
+        nullable=False
     )
 
     # Foreign Key
@@ -57,13 +61,14 @@ class PasswordResetToken(Base):
     # Expiration
     expires_at: Mapped[datetime] = mapped_column(
         DateTime,
-        nullable=False
+        nullable=False,
+        index=True
     )
 
     # Timestamp
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False
     )
 
@@ -73,5 +78,19 @@ class PasswordResetToken(Base):
         back_populates="password_reset_tokens"
     )
 
+    __table_args__ = (
+        # Tokens are only ever matched by equality
+        Index("ix_password_reset_tokens_token_hash", "token", postgresql_using="hash"),
+        Index(
+            "ix_password_reset_tokens_user_unused",
+            "user_id",
+            postgresql_where=text("used = false"),
+            sqlite_where=text("used = 0"),
+        ),
+    )
+
+    # Fetch server-generated timestamps in the INSERT itself (RETURNING)
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         return f"<PasswordResetToken(id={self.id}, user_id={self.user_id}, used={self.used})>"
@@ -5,11 +5,15 @@ Manages refresh token rotation for secure JWT authentication.
 """
 
 from datetime import datetime
-from sqlalchemy import String, Integer, ForeignKey, Boolean, DateTime, Index
+from typing import TYPE_CHECKING
+from sqlalchemy import String, Integer, ForeignKey, Boolean, DateTime, Index, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
+if TYPE_CHECKING:
+    from app.models.user import User
+
 
 class RefreshToken(Base):
     """
@@ -22,23 +26,22 @@ class RefreshToken(Base):
         - Many refresh tokens belong to one user (many-to-one)
 
     Indexes:
-        - token: For fast token lookup (hashed)
+        - token: For fast token lookup (hash index; equality only)
         - user_id: For user-specific queries
+        - user_id WHERE NOT revoked: For a user's active tokens (partial)
         - expires_at: For cleanup of expired tokens
     """
 
     __tablename__ = "refresh_tokens"
 
     # Primary Key
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True)
 
     # Token Information
     token: Mapped[str] = mapped_column(
-        String(255),
-        unique=True,
-        nullable=False,
-        index=True
-    )  # Hashed token value
+        String(64),
+        nullable=False
+    )  # Hashed token value (fixed-length digest)
 
     # Foreign Key
     user_id: Mapped[int] = mapped_column(
@@ -65,7 +68,7 @@ class RefreshToken(Base):
     # Timestamp
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False
     )
 
@@ -77,8 +80,18 @@ class RefreshToken(Base):
 
     # Composite indexes for common query patterns
     __table_args__ = (
-        Index("ix_refresh_tokens_user_revoked", "user_id", "revoked"),
+        # Lookups only ever want active tokens; revoked rows dominate the table
+        Index(
+            "ix_refresh_tokens_user_active",
+            "user_id",
+            postgresql_where=text("revoked = false"),
+            sqlite_where=text("revoked = 0"),
+        ),
+        Index("ix_refresh_tokens_token_hash", "token", postgresql_using="hash"),
     )
 
+    # Fetch server-generated timestamps in the INSERT itself (RETURNING)
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         return f"<RefreshToken(id={self.id}, user_id={self.user_id}, revoked={self.revoked})>"
@@ -0,0 +1,89 @@
+# app/models/types.py
+"""
+Custom column types shared by the ORM models.
+"""
+
+from datetime import datetime, timedelta, timezone
+from enum import Enum as PyEnum
+from typing import Optional, Type
+
+from sqlalchemy import BigInteger, SmallInteger
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import TypeDecorator
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+class EnumInt(TypeDecorator):
+    """
+    Store a Python enum as a SMALLINT holding the member's position.
+
+    Codes follow declaration order, so new members must only ever be
+    appended to the enum; reordering or removing members changes the
+    meaning of stored rows.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: Type[PyEnum], *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.enum_class = enum_class
+        self._members = tuple(enum_class)
+        self._codes = {member: code for code, member in enumerate(self._members)}
+
+    def process_bind_param(self, value, dialect) -> Optional[int]:
+        if value is None:
+            return None
+        return self._codes[self.enum_class(value)]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        # Checked explicitly: a negative code would otherwise index from the end
+        if not 0 <= value < len(self._members):
+            raise LookupError(f"{value} is not a valid {self.enum_class.__name__} code")
+        return self._members[value]
+
+
+class EpochMs(TypeDecorator):
+    """
+    Store a UTC datetime as BIGINT milliseconds since the Unix epoch.
+
+    Naive datetimes are taken to be UTC, and values are loaded back as
+    naive UTC datetimes, like the plain DateTime columns elsewhere.
+    Sorting and range filters then compare integers in the database.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[datetime], dialect) -> Optional[int]:
+        if value is None:
+            return None
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return (value - _EPOCH) // timedelta(milliseconds=1)
+
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[datetime]:
+        if value is None:
+            return None
+        return _EPOCH + timedelta(milliseconds=value)
+
+
+class epoch_ms_now(FunctionElement):
+    """Current time as epoch milliseconds, for EpochMs server defaults."""
+
+    type = BigInteger()
+    inherit_cache = True
+
+
+@compiles(epoch_ms_now)
+def _epoch_ms_now_default(element, compiler, **kw) -> str:
+    return "(CAST(EXTRACT(EPOCH FROM now()) * 1000 AS BIGINT))"
+
+
+@compiles(epoch_ms_now, "sqlite")
+def _epoch_ms_now_sqlite(element, compiler, **kw) -> str:
+    return "CAST(ROUND((julianday('now') - 2440587.5) * 86400000) AS INTEGER)"
@@ -6,17 +6,30 @@ Represents users with authentication and authorization capabilities.
 
 import enum
 from datetime import datetime
-from typing import Optional, List
-from sqlalchemy import String, Boolean, DateTime, Index
+from typing import TYPE_CHECKING, Optional, List
+from sqlalchemy import DDL, String, Boolean, DateTime, Index, CheckConstraint, event, func, select
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.schema import FetchedValue
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.database import Base
+from app.models.types import EnumInt
+
+if TYPE_CHECKING:
+    from app.models.application import Application
+    from app.models.company import Company
+    from app.models.email_verification_token import EmailVerificationToken
+    from app.models.job import Job
+    from app.models.password_reset_token import PasswordResetToken
+    from app.models.refresh_token import RefreshToken
+    from app.models.saved_job import SavedJob
 
 
 class UserRole(str, enum.Enum):
     """
     User role enumeration for RBAC (Role-Based Access Control).
-    Enforces valid role values at database level.
+    Stored as SMALLINT in declaration order; append new members only.
     """
     REGULAR_USER = "regular_user"
     EMPLOYER = "employer"
@@ -38,16 +51,16 @@ class User(Base):
         - One user can have many refresh tokens (one-to-many)
 
     Indexes:
-        - email: Unique constraint for login
+        - email: Unique index for login (at most one row per email)
         - is_active: For filtering active users
         - role: For role-based queries
-        - oauth_provider_id: For OAuth user lookup
+        - (oauth_provider, oauth_provider_id): For OAuth user lookup
     """
 
     __tablename__ = "users"
 
     # Primary Key
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True)
 
     # Authentication Information
     email: Mapped[str] = mapped_column(
@@ -57,7 +70,7 @@ class User(Base):
         index=True
     )
     hashed_password: Mapped[Optional[str]] = mapped_column(
-        String(255),
+        String(60),  # bcrypt hashes are always 60 characters
         nullable=True  # Nullable for OAuth users
     )
 
@@ -66,7 +79,7 @@ class User(Base):
 
     # Role & Status
     role: Mapped[UserRole] = mapped_column(
-        String(20),  # Using String instead of Enum for better SQLite compatibility
+        EnumInt(UserRole),  # SMALLINT code; valid range enforced by ck_users_role
         default=UserRole.REGULAR_USER,
         nullable=False,
         index=True
@@ -85,25 +98,24 @@ class User(Base):
 
     # OAuth Information
     oauth_provider: Mapped[Optional[str]] = mapped_column(
-        String(50),
+        String(20),
         nullable=True
     )  # 'google', 'github', or None for local auth
     oauth_provider_id: Mapped[Optional[str]] = mapped_column(
-        String(255),
-        nullable=True,
-        index=True
+        String(128),
+        nullable=True
     )
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),  # Set by trg_users_updated_at
         nullable=False
     )
 
@@ -154,9 +166,75 @@ class User(Base):
 
     # Composite indexes for common query patterns
     __table_args__ = (
-        Index("ix_users_email_active", "email", "is_active"),
         Index("ix_users_oauth_provider", "oauth_provider", "oauth_provider_id"),
+        CheckConstraint(f"role BETWEEN 0 AND {len(UserRole) - 1}", name="ck_users_role"),
     )
 
+    # Fetch server-generated timestamps in the INSERT/UPDATE itself (RETURNING)
+    __mapper_args__ = {"eager_defaults": True}
+
+    @hybrid_property
+    def is_admin(self) -> bool:
+        """Whether the user has the admin role (usable in queries as well)."""
+        return self.role == UserRole.ADMIN
+
     def __repr__(self) -> str:
         return f"<User(id={self.id}, email='{self.email}', role={self.role})>"
+
+
+# users.updated_at is bumped by a trigger only when some other column really
+# changes, so no-op saves don't rewrite the row. Created here for databases
+# built by init_db; migration e1f7a3c9b5d2 adds them to existing ones.
+_PG_SET_UPDATED_AT = DDL("""
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at = now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+""")
+
+_PG_USERS_UPDATED_AT = DDL("""
+CREATE TRIGGER trg_users_updated_at
+BEFORE UPDATE ON users
+FOR EACH ROW
+WHEN (OLD.* IS DISTINCT FROM NEW.*)
+EXECUTE FUNCTION set_updated_at()
+""")
+
+# SQLite can't assign NEW in a trigger, so it re-stamps the row afterwards
+# (recursive triggers are off by default, so this doesn't fire again)
+_SQLITE_USERS_UPDATED_AT = DDL(
+    "CREATE TRIGGER trg_users_updated_at\n"
+    "AFTER UPDATE ON users\n"
+    "FOR EACH ROW\n"
+    "WHEN OLD.updated_at IS NEW.updated_at AND ("
+    + " OR ".join(
+        f"OLD.{column.name} IS NOT NEW.{column.name}"
+        for column in User.__table__.columns
+        if column.name != "updated_at"
+    )
+    + ")\n"
+    "BEGIN\n"
+    "    UPDATE users SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;\n"
+    "END"
+)
+
+event.listen(User.__table__, "after_create", _PG_SET_UPDATED_AT.execute_if(dialect="postgresql"))
+event.listen(User.__table__, "after_create", _PG_USERS_UPDATED_AT.execute_if(dialect="postgresql"))
+event.listen(User.__table__, "after_create", _SQLITE_USERS_UPDATED_AT.execute_if(dialect="sqlite"))
+
+
+@event.listens_for(User, "after_update")
+def _reload_sqlite_updated_at(mapper, connection, target: User) -> None:
+    """
+    Pick up the timestamp written by SQLite's AFTER UPDATE trigger.
+
+    RETURNING runs before that trigger re-stamps the row, so the value
+    eager_defaults loaded is the old one. Postgres assigns NEW in a BEFORE
+    trigger, so RETURNING already has the new value there.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    updated_at = connection.scalar(select(User.updated_at).where(User.id == target.id))
+    set_committed_value(target, "updated_at", updated_at)
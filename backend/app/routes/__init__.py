@@ -8,6 +8,7 @@ from app.routes.companies import router as companies_router
 from app.routes.auth import router as auth_router
 from app.routes.saved_jobs import router as saved_jobs_router
 from app.routes.applications import router as applications_router
+from app.routes.hh_vacancies import router as hh_router
 
 __all__ = [
     "jobs_router",
@@ -15,4 +16,5 @@ __all__ = [
     "auth_router",
     "saved_jobs_router",
     "applications_router",
+    "hh_router",
 ]
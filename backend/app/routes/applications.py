@@ -3,12 +3,12 @@
 Job application API endpoints.
 """
 from typing import Annotated, List, Optional
-from fastapi import APIRouter, Depends, Query, HTTPException, Request, status
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import ReadSessionLocal, get_db, get_read_db
 from app.services.application_service import ApplicationService
-from app.services.job_service import JobService
 from app.schemas.application import (
     ApplicationCreate,
     ApplicationUpdate,
@@ -16,22 +16,38 @@ from app.schemas.application import (
     ApplicationWithoutJob
 )
 from app.schemas.user import UserResponse
-from app.models.user import UserRole
 from app.models.application import ApplicationStatus
 from app.utils.exceptions import NotFoundException
-from app.utils.dependencies import get_current_active_user
+from app.utils.dependencies import get_active_user_profile, get_read_user_profile
 from app.utils.rate_limit import limiter
+from app.utils.serialization import dump_json_list
+from app.utils.streaming import stream_json_response
 from app.config import settings
 
 router = APIRouter()
 
+_job_applications_adapter = TypeAdapter(List[ApplicationWithoutJob])
+
+
+def _can_view(user: UserResponse, applicant_id: int, job_owner_id: Optional[int]) -> bool:
+    """Applicants, job creators and admins may view an application."""
+    return (
+        applicant_id == user.id
+        or user.is_admin
+        or job_owner_id == user.id
+    )
+
+
+def _can_manage(user: UserResponse, job_owner_id: Optional[int]) -> bool:
+    """Only job creators and admins may change an application's status."""
+    return user.is_admin or job_owner_id == user.id
+
 
 @router.get("/applications/me", response_model=List[ApplicationResponse])
 @limiter.limit(settings.API_RATE_LIMIT)
 async def get_my_applications(
     request: Request,
-    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[UserResponse, Depends(get_read_user_profile)],
     status_filter: Optional[ApplicationStatus] = Query(None, alias="status"),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100)
@@ -39,6 +55,9 @@ async def get_my_applications(
     """
     Get all applications submitted by the current user.
 
+    The response is streamed: rows are read from the database and encoded
+    one at a time rather than building the whole list in memory.
+
     Args:
         current_user: Authenticated user
         status_filter: Optional status filter
@@ -48,14 +67,17 @@ async def get_my_applications(
     Returns:
         List of applications with job details
     """
-    applications = await ApplicationService.get_user_applications(
-        db,
-        user_id=current_user.id,
-        status=status_filter,
-        skip=skip,
-        limit=limit
+    return await stream_json_response(
+        ReadSessionLocal,
+        lambda db: ApplicationService.stream_user_applications(
+            db,
+            user_id=current_user.id,
+            status=status_filter,
+            skip=skip,
+            limit=limit
+        ),
+        ApplicationResponse
     )
-    return applications
 
 
 @router.get("/jobs/{job_id}/applications", response_model=List[ApplicationWithoutJob])
@@ -63,8 +85,8 @@ async def get_my_applications(
 async def get_job_applications(
     request: Request,
     job_id: int,
-    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[UserResponse, Depends(get_read_user_profile)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     status_filter: Optional[ApplicationStatus] = Query(None, alias="status"),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100)
@@ -89,26 +111,29 @@ async def get_job_applications(
         NotFoundException: If job not found
         HTTPException: If user doesn't have permission
     """
-    # Check if job exists and user has permission
-    job = await JobService.get_by_id(db, job_id)
-    if not job:
+    # Fetch applications and the job owner in one query
+    result = await ApplicationService.get_job_applications_with_owner(
+        db,
+        job_id=job_id,
+        status=status_filter,
+        skip=skip,
+        limit=limit
+    )
+    if result is None:
         raise NotFoundException("Job", job_id)
 
     # Check permission: must be job creator or admin
-    if current_user.role != UserRole.ADMIN and job.created_by_id != current_user.id:
+    job_owner_id, applications = result
+    if not current_user.is_admin and job_owner_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to view applications for this job"
         )
 
-    applications = await ApplicationService.get_job_applications(
-        db,
-        job_id=job_id,
-        status=status_filter,
-        skip=skip,
-        limit=limit
-    )
-    return applications
+    # Encoded in one pass through the compiled adapter; response_model
+    # only documents the shape
+    body = await dump_json_list(_job_applications_adapter, applications)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/applications/{application_id}", response_model=ApplicationResponse)
@@ -116,8 +141,8 @@ async def get_job_applications(
 async def get_application(
     request: Request,
     application_id: int,
-    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
-    db: Annotated[AsyncSession, Depends(get_db)]
+    current_user: Annotated[UserResponse, Depends(get_read_user_profile)],
+    db: Annotated[AsyncSession, Depends(get_read_db)]
 ):
     """
     Get a specific application by ID.
@@ -137,20 +162,24 @@ async def get_application(
         NotFoundException: If application not found
         HTTPException: If user doesn't have permission
     """
-    application = await ApplicationService.get_by_id(db, application_id)
-    if not application:
-        raise NotFoundException("Application", application_id)
+    forbidden = HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="You don't have permission to view this application"
+    )
 
-    # Check permission
-    is_applicant = application.user_id == current_user.id
-    is_job_owner = application.job.created_by_id == current_user.id
-    is_admin = current_user.role == UserRole.ADMIN
+    # Refuse known-forbidden requests before querying
+    context = ApplicationService.get_cached_auth_context(application_id)
+    if context is not None and not _can_view(current_user, *context):
+        raise forbidden
 
-    if not (is_applicant or is_job_owner or is_admin):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to view this application"
-        )
+    # Load and authorize in one query
+    result = await ApplicationService.get_with_auth(db, application_id, current_user.id)
+    if result is None:
+        raise NotFoundException("Application", application_id)
+
+    application, allowed = result
+    if not allowed:
+        raise forbidden
 
     return application
 
@@ -164,7 +193,7 @@ async def get_application(
 async def create_application(
     request: Request,
     application_data: ApplicationCreate,
-    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+    current_user: Annotated[UserResponse, Depends(get_active_user_profile)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ):
     """
@@ -195,7 +224,7 @@ async def update_application_status(
     request: Request,
     application_id: int,
     status_update: ApplicationUpdate,
-    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+    current_user: Annotated[UserResponse, Depends(get_active_user_profile)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ):
     """
@@ -216,23 +245,27 @@ async def update_application_status(
         NotFoundException: If application not found
         HTTPException: If user doesn't have permission
     """
+    forbidden = HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="You don't have permission to update this application"
+    )
+
+    # Refuse known-forbidden requests before querying
+    context = ApplicationService.get_cached_auth_context(application_id)
+    if context is not None and not _can_manage(current_user, context[1]):
+        raise forbidden
+
     application = await ApplicationService.get_by_id(db, application_id)
     if not application:
         raise NotFoundException("Application", application_id)
 
-    # Check permission: must be job creator or admin
-    is_job_owner = application.job.created_by_id == current_user.id
-    is_admin = current_user.role == UserRole.ADMIN
-
-    if not (is_job_owner or is_admin):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to update this application"
-        )
+    # Check permission: must be job creator or admin (job joined by get_by_id)
+    if not _can_manage(current_user, application.job.created_by_id):
+        raise forbidden
 
     updated_application = await ApplicationService.update_status(
         db,
-        application_id=application_id,
+        application=application,
         status_update=status_update
     )
     return updated_application
@@ -243,7 +276,7 @@ async def update_application_status(
 async def withdraw_application(
     request: Request,
     application_id: int,
-    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+    current_user: Annotated[UserResponse, Depends(get_active_user_profile)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ):
     """
@@ -6,10 +6,11 @@ Authentication and user management routes.
 import logging
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Request, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.models.user import User
 from app.schemas.user import (
     UserCreate,
     UserLogin,
@@ -48,6 +49,7 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 async def register(
     request: Request,
     user_data: UserCreate,
+    background_tasks: BackgroundTasks,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """
@@ -65,6 +67,7 @@ async def register(
             password=user_data.password,
             full_name=user_data.full_name,
             role=user_data.role,
+            background_tasks=background_tasks,
         )
         return user
     except ValidationException as e:
@@ -82,6 +85,7 @@ async def register(
 )
 async def verify_email(
     verification_data: EmailVerification,
+    background_tasks: BackgroundTasks,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """
@@ -95,6 +99,7 @@ async def verify_email(
         user = await auth_service.verify_email(
             db=db,
             token=verification_data.token,
+            background_tasks=background_tasks,
         )
         return user
     except ValidationException as e:
@@ -119,6 +124,7 @@ async def verify_email(
 async def resend_verification(
     request: Request,
     email_data: PasswordResetRequest,  # Reusing this schema as it only has email field
+    background_tasks: BackgroundTasks,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """
@@ -132,6 +138,7 @@ async def resend_verification(
         await auth_service.resend_verification_email(
             db=db,
             email=email_data.email,
+            background_tasks=background_tasks,
         )
     except ValidationException as e:
         raise HTTPException(
@@ -151,6 +158,7 @@ async def login(
     request: Request,
     login_data: UserLogin,
     db: Annotated[AsyncSession, Depends(get_db)],
+    background_tasks: BackgroundTasks,
 ):
     """
     Authenticate user and return JWT tokens.
@@ -166,11 +174,12 @@ async def login(
             email=login_data.email,
             password=login_data.password,
             remember_me=login_data.remember_me,
+            background_tasks=background_tasks,
         )
         return TokenResponse(
             access_token=access_token,
             refresh_token=refresh_token,
-            user=UserResponse.model_validate(user),
+            user=UserResponse.from_user(user),
         )
     except ValidationException as e:
         raise HTTPException(
@@ -197,22 +206,15 @@ async def refresh_token(
     - Revokes old refresh token
     """
     try:
-        new_access_token, new_refresh_token = await auth_service.refresh_access_token(
+        new_access_token, new_refresh_token, user = await auth_service.refresh_access_token(
             db=db,
             refresh_token_str=refresh_data.refresh_token,
         )
 
-        # Get user from new access token
-        from app.utils.security import decode_token
-        payload = decode_token(new_access_token)
-        user_id = int(payload.get("sub"))
-
-        user = await user_service.get_user_by_id(db=db, user_id=user_id)
-
         return TokenResponse(
             access_token=new_access_token,
             refresh_token=new_refresh_token,
-            user=UserResponse.model_validate(user),
+            user=UserResponse.from_user(user),
         )
     except ValidationException as e:
         raise HTTPException(
@@ -259,6 +261,7 @@ async def logout(
 async def request_password_reset(
     request: Request,
     reset_request: PasswordResetRequest,
+    background_tasks: BackgroundTasks,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """
@@ -271,6 +274,7 @@ async def request_password_reset(
     await auth_service.request_password_reset(
         db=db,
         email=reset_request.email,
+        background_tasks=background_tasks,
     )
 
 
@@ -366,7 +370,7 @@ async def google_callback(
         return TokenResponse(
             access_token=access_token,
             refresh_token=refresh_token,
-            user=UserResponse.model_validate(user),
+            user=UserResponse.from_user(user),
         )
     except ValidationException as e:
         raise HTTPException(
@@ -431,7 +435,7 @@ async def github_callback(
         return TokenResponse(
             access_token=access_token,
             refresh_token=refresh_token,
-            user=UserResponse.model_validate(user),
+            user=UserResponse.from_user(user),
         )
     except ValidationException as e:
         raise HTTPException(
@@ -447,12 +451,13 @@ async def github_callback(
     description="Get current authenticated user's profile",
 )
 async def get_current_user_profile(
-    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+    current_user: Annotated[User, Depends(get_current_active_user)],
 ):
     """
     Get current authenticated user's profile.
 
-    Requires valid JWT access token.
+    Requires valid JWT access token. The profile is read from the database
+    (one primary-key lookup), so it reflects changes made after login.
     """
     return current_user
 
@@ -465,7 +470,7 @@ async def get_current_user_profile(
 )
 async def update_profile(
     update_data: UserUpdate,
-    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+    current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """
@@ -475,12 +480,9 @@ async def update_profile(
     - Email change requires re-verification
     """
     try:
-        # Get full user object from DB
-        user = await user_service.get_user_by_id(db=db, user_id=current_user.id)
-
         updated_user = await user_service.update_user_profile(
             db=db,
-            user=user,
+            user=current_user,
             full_name=update_data.full_name,
             email=update_data.email,
         )
@@ -500,7 +502,7 @@ async def update_profile(
 )
 async def change_password_endpoint(
     password_data: PasswordChange,
-    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+    current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """
@@ -510,12 +512,9 @@ async def change_password_endpoint(
     - Validates new password strength
     """
     try:
-        # Get full user object from DB
-        user = await user_service.get_user_by_id(db=db, user_id=current_user.id)
-
         updated_user = await user_service.change_password(
             db=db,
-            user=user,
+            user=current_user,
             current_password=password_data.current_password,
             new_password=password_data.new_password,
         )
@@ -4,16 +4,24 @@ Company API endpoints with RBAC protection.
 """
 
 from typing import Annotated, List
-from fastapi import APIRouter, Depends, Request, status
+import orjson
+from fastapi import APIRouter, Depends, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.services.company_service import CompanyService
 from app.schemas.company import CompanyCreate, CompanyResponse, CompanyWithJobs
 from app.schemas.user import UserResponse
 from app.models.user import UserRole
 from app.utils.exceptions import NotFoundException
 from app.utils.dependencies import require_role
+from app.utils.http_cache import (
+    REVALIDATE_CACHE_CONTROL,
+    cached_json_response,
+    etag_matches,
+    make_etag,
+    not_modified,
+)
 from app.utils.rate_limit import limiter
 from app.config import settings
 
@@ -24,16 +32,34 @@ router = APIRouter()
 @limiter.limit(settings.API_RATE_LIMIT)
 async def get_companies(
     request: Request,
-    db: AsyncSession = Depends(get_db)
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=100, description="Maximum number of records"),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
-    Get all companies.
+    Get companies with pagination.
+    
+    Sends an ETag derived from a cheap version query and the requested page;
+    clients revalidating with a current If-None-Match get 304 before the
+    page is loaded.
+    
+    Query Parameters:
+        - skip: Pagination offset (default: 0)
+        - limit: Maximum results (default: 100, max: 100)
     
     Returns:
-        List of all companies
+        List of companies, ordered by ID
     """
-    companies = await CompanyService.get_all(db)
-    return companies
+    version = await CompanyService.get_list_version(db)
+    etag = make_etag(repr((version, skip, limit)).encode())
+    if etag_matches(request, etag):
+        return not_modified(etag, REVALIDATE_CACHE_CONTROL)
+
+    companies = await CompanyService.get_all(db, skip=skip, limit=limit)
+    body = orjson.dumps(
+        [CompanyResponse.model_validate(company).model_dump() for company in companies]
+    )
+    return cached_json_response(request, body, etag, REVALIDATE_CACHE_CONTROL)
 
 
 @router.get("/companies/{company_id}", response_model=CompanyWithJobs)
@@ -41,21 +67,23 @@ async def get_companies(
 async def get_company(
     request: Request,
     company_id: int,
-    db: AsyncSession = Depends(get_db)
+    jobs_limit: int = Query(100, ge=1, le=100, description="Maximum number of jobs to include"),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
-    Get company by ID with all jobs.
+    Get company by ID with its most recent jobs.
     
     Args:
         company_id: Company ID
+        jobs_limit: Maximum number of jobs to include (default: 100, max: 100)
         
     Returns:
-        Company with all jobs
+        Company with up to jobs_limit jobs, newest first
         
     Raises:
         NotFoundException: If company not found
     """
-    company = await CompanyService.get_by_id(db, company_id)
+    company = await CompanyService.get_by_id(db, company_id, jobs_limit=jobs_limit)
     if not company:
         raise NotFoundException("Company", company_id)
     return company
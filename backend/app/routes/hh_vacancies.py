@@ -2,9 +2,10 @@
 HeadHunter Vacancies API Routes
 Endpoints for searching and fetching vacancies from HH.ru
 """
-from fastapi import APIRouter, HTTPException, Query, Request
-from typing import Optional
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
+from typing import Annotated, Optional
 import logging
+import orjson
 
 from app.services.hh_client import (
     HHService,
@@ -13,6 +14,7 @@ from app.services.hh_client import (
     HHForbiddenError
 )
 from app.schemas.hh_vacancy import HHVacanciesResponse
+from app.utils.http_cache import STATIC_CACHE_CONTROL, cached_json_response, make_etag
 from app.utils.rate_limit import limiter
 from app.config import settings
 
@@ -21,10 +23,17 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def get_hh(request: Request) -> HHService:
+    """Shared HH client opened in the app lifespan."""
+    return request.app.state.hh
+
+
 @router.get("/hh/vacancies", response_model=HHVacanciesResponse)
 @limiter.limit(settings.SEARCH_RATE_LIMIT)  # Stricter limit for external API calls
 async def search_hh_vacancies(
     request: Request,
+    hh_client: Annotated[HHService, Depends(get_hh)],
+    background_tasks: BackgroundTasks,
     text: str = Query(..., description="Search query (e.g., 'Python', 'Java Developer')"),
     role_id: str = Query("96", description="Professional role ID (96 = Programmer/Developer)"),
     area_id: int = Query(40, description="Area ID (40 = Kazakhstan, 1 = Moscow, 113 = Russia)"),
@@ -53,22 +62,28 @@ async def search_hh_vacancies(
         500: Internal server error
     """
     try:
-        async with HHService() as hh_client:
-            response = await hh_client.get_vacancies(
-                text=text,
-                role_id=role_id,
-                area_id=area_id,
-                per_page=per_page,
-                page=page,
-                order_by=order_by
-            )
-            
-            logger.info(
-                f"Successfully fetched {len(response.items)} vacancies "
-                f"for query: {text}, area: {area_id}"
-            )
-            
-            return response
+        response = await hh_client.get_vacancies(
+            text=text,
+            role_id=role_id,
+            area_id=area_id,
+            per_page=per_page,
+            page=page,
+            order_by=order_by
+        )
+        
+        # Logged after the response is sent
+        background_tasks.add_task(
+            logger.info,
+            f"Successfully fetched {len(response.items)} vacancies "
+            f"for query: {text}, area: {area_id}"
+        )
+        
+        # Already validated when parsed from hh.ru; encode directly instead
+        # of letting response_model validate all items a second time
+        return Response(
+            content=response.model_dump_json(by_alias=True),
+            media_type="application/json"
+        )
     
     except HHRateLimitError as e:
         logger.error(f"Rate limit exceeded: {e}")
@@ -103,7 +118,9 @@ async def search_hh_vacancies(
 @limiter.limit(settings.API_RATE_LIMIT)
 async def get_hh_vacancy_details(
     request: Request,
-    vacancy_id: str
+    vacancy_id: str,
+    hh_client: Annotated[HHService, Depends(get_hh)],
+    background_tasks: BackgroundTasks
 ):
     """
     Get detailed information about a specific vacancy from HeadHunter
@@ -119,12 +136,13 @@ async def get_hh_vacancy_details(
         500: Internal server error
     """
     try:
-        async with HHService() as hh_client:
-            vacancy = await hh_client.get_vacancy_by_id(vacancy_id)
-            
-            logger.info(f"Successfully fetched vacancy details: {vacancy_id}")
-            
-            return vacancy
+        vacancy = await hh_client.get_vacancy_by_id(vacancy_id)
+        
+        background_tasks.add_task(
+            logger.info, f"Successfully fetched vacancy details: {vacancy_id}"
+        )
+        
+        return vacancy
     
     except HHAPIError as e:
         if "not found" in str(e).lower():
@@ -147,6 +165,32 @@ async def get_hh_vacancy_details(
         )
 
 
+# Static lookup data, encoded once at import
+_AREAS_BODY = orjson.dumps({
+    "areas": [
+        {"id": 40, "name": "Kazakhstan", "description": "All of Kazakhstan"},
+        {"id": 1, "name": "Moscow", "description": "Moscow, Russia"},
+        {"id": 2, "name": "St. Petersburg", "description": "St. Petersburg, Russia"},
+        {"id": 113, "name": "Russia", "description": "All of Russia"},
+        {"id": 5, "name": "Almaty", "description": "Almaty, Kazakhstan"},
+        {"id": 159, "name": "Astana", "description": "Astana (Nur-Sultan), Kazakhstan"},
+    ]
+})
+_AREAS_ETAG = make_etag(_AREAS_BODY)
+
+_ROLES_BODY = orjson.dumps({
+    "roles": [
+        {"id": "96", "name": "Programmer, Developer", "description": "General programming roles"},
+        {"id": "104", "name": "Web Developer", "description": "Frontend/Backend web development"},
+        {"id": "113", "name": "QA Engineer", "description": "Quality Assurance, Testing"},
+        {"id": "10", "name": "Analyst", "description": "Business/System Analyst"},
+        {"id": "73", "name": "DevOps Engineer", "description": "DevOps, Infrastructure"},
+        {"id": "124", "name": "Data Scientist", "description": "Data Science, ML"},
+    ]
+})
+_ROLES_ETAG = make_etag(_ROLES_BODY)
+
+
 @router.get("/hh/areas")
 @limiter.limit(settings.API_RATE_LIMIT)
 async def get_popular_areas(request: Request):
@@ -156,16 +200,7 @@ async def get_popular_areas(request: Request):
     Returns:
         Dictionary of popular areas with their IDs
     """
-    return {
-        "areas": [
-            {"id": 40, "name": "Kazakhstan", "description": "All of Kazakhstan"},
-            {"id": 1, "name": "Moscow", "description": "Moscow, Russia"},
-            {"id": 2, "name": "St. Petersburg", "description": "St. Petersburg, Russia"},
-            {"id": 113, "name": "Russia", "description": "All of Russia"},
-            {"id": 5, "name": "Almaty", "description": "Almaty, Kazakhstan"},
-            {"id": 159, "name": "Astana", "description": "Astana (Nur-Sultan), Kazakhstan"},
-        ]
-    }
+    return cached_json_response(request, _AREAS_BODY, _AREAS_ETAG, STATIC_CACHE_CONTROL)
 
 
 @router.get("/hh/roles")
@@ -177,13 +212,4 @@ async def get_professional_roles(request: Request):
     Returns:
         Dictionary of popular IT roles with their IDs
     """
-    return {
-        "roles": [
-            {"id": "96", "name": "Programmer, Developer", "description": "General programming roles"},
-            {"id": "104", "name": "Web Developer", "description": "Frontend/Backend web development"},
-            {"id": "113", "name": "QA Engineer", "description": "Quality Assurance, Testing"},
-            {"id": "10", "name": "Analyst", "description": "Business/System Analyst"},
-            {"id": "73", "name": "DevOps Engineer", "description": "DevOps, Infrastructure"},
-            {"id": "124", "name": "Data Scientist", "description": "Data Science, ML"},
-        ]
-    }
+    return cached_json_response(request, _ROLES_BODY, _ROLES_ETAG, STATIC_CACHE_CONTROL)
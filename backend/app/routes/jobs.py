@@ -4,22 +4,37 @@ Job API endpoints with RBAC protection.
 """
 
 from typing import Annotated, List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import ReadSessionLocal, get_db, get_read_db
 from app.services.job_service import JobService
 from app.schemas.job import JobCreate, JobUpdate, JobResponse
 from app.schemas.user import UserResponse
 from app.models.job import JobLevel
 from app.models.user import UserRole
+from app.utils.cache import TTLCache
 from app.utils.exceptions import NotFoundException
-from app.utils.dependencies import get_current_active_user, require_role
+from app.utils.http_cache import REVALIDATE_CACHE_CONTROL, cached_json_response, make_etag
+from app.utils.dependencies import get_active_user_profile, require_role
 from app.utils.rate_limit import limiter
+from app.utils.serialization import dump_json_list
+from app.utils.streaming import stream_json_response
 from app.config import settings
 
 router = APIRouter()
 
+_jobs_adapter = TypeAdapter(List[JobResponse])
+
+# Encoded GET /jobs pages keyed by their filters. Cleared on every job write
+# in this process; the TTL bounds how stale other workers can be.
+_jobs_page_cache = TTLCache(maxsize=256, ttl=30)
+
+# Encoded GET /jobs/{id} bodies and their ETags, dropped when that job is
+# updated or deleted
+_job_detail_cache = TTLCache(maxsize=1024, ttl=30)
+
 
 @router.get("/jobs", response_model=List[JobResponse])
 # @limiter.limit(settings.SEARCH_RATE_LIMIT)  # Temporarily disabled for debugging
@@ -30,7 +45,7 @@ async def get_jobs(
     search: Optional[str] = Query(None, description="Search in title and description"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all jobs with optional filters and pagination.
@@ -45,15 +60,35 @@ async def get_jobs(
     Returns:
         List of jobs matching filters
     """
-    jobs = await JobService.get_all(
-        db=db,
-        location=location,
-        level=level,
-        search=search,
-        skip=skip,
-        limit=limit
-    )
-    return jobs
+    if search:
+        # Free-text searches are too varied to be worth caching; stream them
+        # so the first rows go out while the rest are still being read
+        return await stream_json_response(
+            ReadSessionLocal,
+            lambda stream_db: JobService.stream_all(
+                stream_db,
+                location=location,
+                level=level,
+                search=search,
+                skip=skip,
+                limit=limit
+            ),
+            JobResponse
+        )
+
+    cache_key = (location, level, skip, limit)
+    body = _jobs_page_cache.get(cache_key)
+    if body is None:
+        jobs = await JobService.get_all(
+            db=db,
+            location=location,
+            level=level,
+            skip=skip,
+            limit=limit
+        )
+        body = await dump_json_list(_jobs_adapter, jobs)
+        _jobs_page_cache.set(cache_key, body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/jobs/{job_id}", response_model=JobResponse)
@@ -61,11 +96,14 @@ async def get_jobs(
 async def get_job(
     request: Request,
     job_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get job by ID with company information.
     
+    Sends an ETag of the body; clients revalidating with a current
+    If-None-Match get 304 without the body.
+    
     Args:
         job_id: Job ID
         
@@ -75,10 +113,16 @@ async def get_job(
     Raises:
         NotFoundException: If job not found
     """
-    job = await JobService.get_by_id(db, job_id)
-    if not job:
-        raise NotFoundException("Job", job_id)
-    return job
+    cached = _job_detail_cache.get(job_id)
+    if cached is None:
+        job = await JobService.get_by_id(db, job_id)
+        if not job:
+            raise NotFoundException("Job", job_id)
+        body = JobResponse.model_validate(job).model_dump_json().encode()
+        cached = (body, make_etag(body))
+        _job_detail_cache.set(job_id, cached)
+    body, etag = cached
+    return cached_json_response(request, body, etag, REVALIDATE_CACHE_CONTROL)
 
 
 @router.post("/jobs", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
@@ -100,6 +144,7 @@ async def create_job(
         Created job with company details
     """
     job = await JobService.create(db, job_data, created_by_id=current_user.id)
+    _jobs_page_cache.clear()
     return job
 
 
@@ -109,7 +154,7 @@ async def update_job(
     request: Request,
     job_id: int,
     job_data: JobUpdate,
-    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+    current_user: Annotated[UserResponse, Depends(get_active_user_profile)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ):
     """
@@ -125,21 +170,16 @@ async def update_job(
 
     Raises:
         NotFoundException: If job not found
-        HTTPException: If user doesn't have permission
+        ForbiddenException: If user doesn't have permission
     """
-    # Get existing job
-    existing_job = await JobService.get_by_id(db, job_id)
-    if not existing_job:
-        raise NotFoundException("Job", job_id)
-
-    # Check ownership (allow creator or admin to update)
-    if current_user.role != UserRole.ADMIN and existing_job.created_by_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to update this job"
-        )
-
-    job = await JobService.update(db, job_id, job_data)
+    # Ownership (creator or admin) is enforced by the UPDATE itself
+    job = await JobService.update(
+        db, job_id, job_data,
+        user_id=current_user.id,
+        is_admin=current_user.is_admin
+    )
+    _jobs_page_cache.clear()
+    _job_detail_cache.pop(job_id)
     return job
 
 
@@ -148,7 +188,7 @@ async def update_job(
 async def delete_job(
     request: Request,
     job_id: int,
-    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+    current_user: Annotated[UserResponse, Depends(get_active_user_profile)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ):
     """
@@ -160,20 +200,13 @@ async def delete_job(
 
     Raises:
         NotFoundException: If job not found
-        HTTPException: If user doesn't have permission
+        ForbiddenException: If user doesn't have permission
     """
-    # Get existing job
-    existing_job = await JobService.get_by_id(db, job_id)
-    if not existing_job:
-        raise NotFoundException("Job", job_id)
-
-    # Check ownership (allow creator or admin to delete)
-    if current_user.role != UserRole.ADMIN and existing_job.created_by_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to delete this job"
-        )
-
-    deleted = await JobService.delete(db, job_id)
-    if not deleted:
-        raise NotFoundException("Job", job_id)
+    # Ownership (creator or admin) is enforced by the DELETE itself
+    await JobService.delete(
+        db, job_id,
+        user_id=current_user.id,
+        is_admin=current_user.is_admin
+    )
+    _jobs_page_cache.clear()
+    _job_detail_cache.pop(job_id)
@@ -3,28 +3,37 @@
 Saved jobs API endpoints for authenticated users.
 """
 from typing import Annotated, List
-from fastapi import APIRouter, Depends, Query, Request, status, HTTPException
+from fastapi import APIRouter, Depends, Query, Request, Response, status, HTTPException
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.services.saved_job_service import SavedJobService
-from app.schemas.saved_job import SavedJobResponse, SavedJobCreate
+from app.schemas.saved_job import (
+    SavedJobResponse,
+    SavedJobCreate,
+    SavedJobCheckBatch,
+    SavedJobCheckBatchResponse,
+)
 from app.schemas.user import UserResponse
 from app.models.user import UserRole
 from app.utils.exceptions import NotFoundException, ConflictException
-from app.utils.dependencies import get_current_active_user
+from app.utils.dependencies import get_active_user_profile, get_read_user_profile
 from app.utils.rate_limit import limiter
+from app.utils.serialization import dump_json_list
 from app.config import settings
 
 router = APIRouter()
 
+_saved_jobs_adapter = TypeAdapter(List[SavedJobResponse])
+
 
 @router.get("/saved-jobs", response_model=List[SavedJobResponse])
 @limiter.limit(settings.API_RATE_LIMIT)
 async def get_saved_jobs(
     request: Request,
-    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[UserResponse, Depends(get_read_user_profile)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of records")
 ):
@@ -45,7 +54,10 @@ async def get_saved_jobs(
         skip=skip,
         limit=limit
     )
-    return saved_jobs
+    # Encoded in one pass through the compiled adapter; response_model
+    # only documents the shape
+    body = await dump_json_list(_saved_jobs_adapter, saved_jobs)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/saved-jobs/{job_id}/check")
@@ -53,8 +65,8 @@ async def get_saved_jobs(
 async def check_job_saved(
     request: Request,
     job_id: int,
-    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
-    db: Annotated[AsyncSession, Depends(get_db)]
+    current_user: Annotated[UserResponse, Depends(get_read_user_profile)],
+    db: Annotated[AsyncSession, Depends(get_read_db)]
 ):
     """
     Check if a job is saved by the current user.
@@ -74,6 +86,34 @@ async def check_job_saved(
     return {"is_saved": is_saved}
 
 
+@router.post("/saved-jobs/check-batch", response_model=SavedJobCheckBatchResponse)
+@limiter.limit(settings.API_RATE_LIMIT)
+async def check_jobs_saved(
+    request: Request,
+    check_data: SavedJobCheckBatch,
+    current_user: Annotated[UserResponse, Depends(get_read_user_profile)],
+    db: Annotated[AsyncSession, Depends(get_read_db)]
+):
+    """
+    Check which of up to 100 jobs are saved by the current user.
+
+    Lets a list page ask once instead of calling /check per job card.
+
+    Args:
+        check_data: Job IDs to check
+        current_user: Authenticated user
+
+    Returns:
+        Object with the saved subset of job_ids
+    """
+    saved_ids = await SavedJobService.get_saved_job_ids(
+        db,
+        user_id=current_user.id,
+        job_ids=check_data.job_ids
+    )
+    return {"saved_job_ids": sorted(saved_ids)}
+
+
 @router.post(
     "/saved-jobs",
     response_model=SavedJobResponse,
@@ -83,7 +123,7 @@ async def check_job_saved(
 async def save_job(
     request: Request,
     save_data: SavedJobCreate,
-    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+    current_user: Annotated[UserResponse, Depends(get_active_user_profile)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ):
     """
@@ -113,7 +153,7 @@ async def save_job(
 async def unsave_job(
     request: Request,
     job_id: int,
-    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+    current_user: Annotated[UserResponse, Depends(get_active_user_profile)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ):
     """
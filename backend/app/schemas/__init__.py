@@ -36,6 +36,8 @@ from app.schemas.auth import (
 from app.schemas.saved_job import (
     SavedJobResponse,
     SavedJobCreate,
+    SavedJobCheckBatch,
+    SavedJobCheckBatchResponse,
 )
 from app.schemas.application import (
     ApplicationCreate,
@@ -74,6 +76,8 @@ __all__ = [
     # Saved job schemas
     "SavedJobResponse",
     "SavedJobCreate",
+    "SavedJobCheckBatch",
+    "SavedJobCheckBatchResponse",
     # Application schemas
     "ApplicationCreate",
     "ApplicationUpdate",
@@ -25,30 +25,29 @@ class ApplicationUpdate(BaseModel):
     status: ApplicationStatus
 
 
-class ApplicationResponse(ApplicationBase):
-    """Response model for application."""
+class ApplicationWithoutJob(BaseModel):
+    """
+    Response model for application without job details (for job employer view).
+
+    Declares its own unconstrained fields instead of inheriting
+    ApplicationBase, so serializing a response doesn't re-run the
+    request-side length checks.
+    """
+    cover_letter: Optional[str] = None
+    resume_url: Optional[str] = None
     id: int
     user_id: int
     job_id: int
     status: ApplicationStatus
     applied_at: datetime
     updated_at: datetime
-    job: JobResponse  # Include full job details
 
     model_config = {
-        "from_attributes": True
+        "from_attributes": True,
+        "frozen": True
     }
 
 
-class ApplicationWithoutJob(ApplicationBase):
-    """Response model for application without job details (for job employer view)."""
-    id: int
-    user_id: int
-    job_id: int
-    status: ApplicationStatus
-    applied_at: datetime
-    updated_at: datetime
-
-    model_config = {
-        "from_attributes": True
-    }
+class ApplicationResponse(ApplicationWithoutJob):
+    """Response model for application."""
+    job: JobResponse  # Include full job details
@@ -5,7 +5,7 @@ Handles request validation and response serialization.
 """
 
 from typing import Optional, List
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field
 
 
 class CompanyBase(BaseModel):
@@ -25,29 +25,43 @@ class CompanyCreate(CompanyBase):
     pass
 
 
-class CompanyResponse(CompanyBase):
+class CompanyResponse(BaseModel):
     """
     Schema for company response.
     Includes database-generated fields.
+
+    Declares its own unconstrained fields instead of inheriting CompanyBase,
+    so serializing a response doesn't re-run the request-side length checks.
+    Frozen: responses are built once and never mutated.
     """
     
     id: int = Field(..., description="Company ID")
+    name: str = Field(..., description="Company name")
+    description: Optional[str] = Field(None, description="Company description")
+    logo: Optional[str] = Field(None, description="Logo URL")
+    website: Optional[str] = Field(None, description="Company website URL")
     
     model_config = {
-        "from_attributes": True  # Pydantic V2: Enable ORM mode
+        "from_attributes": True,  # Pydantic V2: Enable ORM mode
+        "frozen": True
     }
 
 
 class CompanyWithJobs(CompanyResponse):
     """
     Schema for company response with nested jobs.
-    Used when fetching company details with all jobs.
+    Used when fetching company details with its most recent jobs.
     """
     
-    jobs: List["JobResponse"] = Field(default_factory=list, description="List of jobs from this company")
+    jobs: List["JobResponse"] = Field(
+        default_factory=list,
+        max_length=100,
+        description="Most recent jobs from this company (bounded by jobs_limit)"
+    )
     
     model_config = {
-        "from_attributes": True
+        "from_attributes": True,
+        "frozen": True
     }
 
 
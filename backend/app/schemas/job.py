@@ -44,19 +44,29 @@ class JobUpdate(BaseModel):
     company_id: Optional[int] = Field(None, gt=0)
 
 
-class JobResponse(JobBase):
+class JobResponse(BaseModel):
     """
     Schema for job response.
     Includes database-generated fields and nested company info.
+
+    Declares its own unconstrained fields instead of inheriting JobBase,
+    so serializing a response doesn't re-run the request-side length checks.
+    Frozen: responses are built once and never mutated.
     """
     
     id: int = Field(..., description="Job ID")
+    title: str = Field(..., description="Job title")
+    description: str = Field(..., description="Job description")
+    location: str = Field(..., description="Job location")
+    salary: Optional[str] = Field(None, description="Salary range")
+    level: JobLevel = Field(..., description="Seniority level")
     company_id: int = Field(..., description="Company ID")
     created_at: datetime = Field(..., description="Creation timestamp")
     company: "CompanyResponse" = Field(..., description="Company information")
     
     model_config = {
-        "from_attributes": True  # Pydantic V2: Enable ORM mode
+        "from_attributes": True,  # Pydantic V2: Enable ORM mode
+        "frozen": True
     }
 
 
@@ -3,7 +3,7 @@
 Pydantic schemas for saved job requests and responses.
 """
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from app.schemas.job import JobResponse
 
 
@@ -15,10 +15,21 @@ class SavedJobResponse(BaseModel):
     job: JobResponse  # Include full job details
 
     model_config = {
-        "from_attributes": True
+        "from_attributes": True,
+        "frozen": True
     }
 
 
 class SavedJobCreate(BaseModel):
     """Request model for saving a job."""
     job_id: int
+
+
+class SavedJobCheckBatch(BaseModel):
+    """Request model for checking several jobs at once."""
+    job_ids: list[int] = Field(..., max_length=100)
+
+
+class SavedJobCheckBatchResponse(BaseModel):
+    """Response model listing which of the checked jobs are saved."""
+    saved_job_ids: list[int]
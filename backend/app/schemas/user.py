@@ -3,12 +3,53 @@
 Pydantic schemas for user-related requests and responses.
 """
 
+import re
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from pydantic import BaseModel, EmailStr, Field, field_validator
 
 from app.models.user import UserRole
 
+if TYPE_CHECKING:
+    from app.models.user import User
+
+_DIGIT_RE = re.compile(r"\d")
+
+# Cheap shape check for emails that are only looked up, never stored
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _validate_password_strength(v: str) -> str:
+    """
+    Check the password policy shared by registration, change and reset.
+
+    Each check is a single C-level pass: a string contains an uppercase
+    letter exactly when lowercasing changes it (and vice versa), which also
+    covers non-ASCII letters.
+    """
+    if len(v) < 8:
+        raise ValueError("Password must be at least 8 characters long")
+    if v.lower() == v:
+        raise ValueError("Password must contain at least one uppercase letter")
+    if v.upper() == v:
+        raise ValueError("Password must contain at least one lowercase letter")
+    if not _DIGIT_RE.search(v):
+        raise ValueError("Password must contain at least one digit")
+    return v
+
+
+def _validate_email_shape(v: str) -> str:
+    """
+    Validate an email used as a lookup key without email-validator.
+
+    Lowercases the domain the same way EmailStr does on registration, so
+    the value still matches the stored address.
+    """
+    if not _EMAIL_RE.match(v):
+        raise ValueError("value is not a valid email address")
+    local, _, domain = v.rpartition("@")
+    return f"{local}@{domain.lower()}"
+
 
 class UserBase(BaseModel):
     """Base user schema with common fields."""
@@ -27,30 +68,32 @@ class UserCreate(UserBase):
     @classmethod
     def validate_password(cls, v: str) -> str:
         """Validate password strength."""
-        if len(v) < 8:
-            raise ValueError("Password must be at least 8 characters long")
-        if not any(c.isupper() for c in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not any(c.islower() for c in v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("Password must contain at least one digit")
-        return v
+        return _validate_password_strength(v)
 
 
 class UserLogin(BaseModel):
     """Schema for user login."""
 
-    email: EmailStr
+    email: str = Field(..., max_length=320)
     password: str
     remember_me: bool = False
 
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, v: str) -> str:
+        """Check the email's shape (full validation happens on registration)."""
+        return _validate_email_shape(v)
+
 
 class UserResponse(UserBase):
     """Schema for user response (public data)."""
 
+    # Already validated when the user registered; responses don't need to
+    # run email-validator again
+    email: str
     id: int
     role: UserRole
+    is_admin: bool
     is_active: bool
     is_verified: bool
     oauth_provider: Optional[str] = None
@@ -59,6 +102,16 @@ class UserResponse(UserBase):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_user(cls, user: "User") -> "UserResponse":
+        """
+        Build a response from a User loaded from the database.
+
+        The columns are already typed and constrained by the model, so the
+        fields are copied without re-running validation.
+        """
+        return cls.model_construct(**{name: getattr(user, name) for name in cls.model_fields})
+
 
 class UserUpdate(BaseModel):
     """Schema for updating user profile."""
@@ -77,15 +130,7 @@ class PasswordChange(BaseModel):
     @classmethod
     def validate_password(cls, v: str) -> str:
         """Validate password strength."""
-        if len(v) < 8:
-            raise ValueError("Password must be at least 8 characters long")
-        if not any(c.isupper() for c in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not any(c.islower() for c in v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("Password must contain at least one digit")
-        return v
+        return _validate_password_strength(v)
 
 
 class EmailVerification(BaseModel):
@@ -97,7 +142,13 @@ class EmailVerification(BaseModel):
 class PasswordResetRequest(BaseModel):
     """Schema for requesting password reset."""
 
-    email: EmailStr
+    email: str = Field(..., max_length=320)
+
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, v: str) -> str:
+        """Check the email's shape (full validation happens on registration)."""
+        return _validate_email_shape(v)
 
 
 class PasswordReset(BaseModel):
@@ -110,12 +161,4 @@ class PasswordReset(BaseModel):
     @classmethod
     def validate_password(cls, v: str) -> str:
         """Validate password strength."""
-        if len(v) < 8:
-            raise ValueError("Password must be at least 8 characters long")
-        if not any(c.isupper() for c in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not any(c.islower() for c in v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("Password must contain at least one digit")
-        return v
+        return _validate_password_strength(v)
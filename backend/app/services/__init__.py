@@ -23,6 +23,7 @@ from app.services.auth_service import (
     logout,
     request_password_reset,
     reset_password,
+    cleanup_expired_tokens,
 )
 
 from app.services.user_service import (
@@ -39,6 +40,7 @@ from app.services.oauth_service import (
     get_github_auth_url,
     handle_google_callback,
     handle_github_callback,
+    cleanup_expired_oauth_states,
 )
 
 __all__ = [
@@ -60,6 +62,7 @@ __all__ = [
     "logout",
     "request_password_reset",
     "reset_password",
+    "cleanup_expired_tokens",
     # User service
     "get_user_by_id",
     "get_user_by_email",
@@ -72,4 +75,5 @@ __all__ = [
     "get_github_auth_url",
     "handle_google_callback",
     "handle_github_callback",
+    "cleanup_expired_oauth_states",
 ]
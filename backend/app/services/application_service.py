@@ -3,18 +3,27 @@
 Application service for managing job applications.
 """
 import logging
-from typing import List, Optional
-from sqlalchemy import select, and_
+from typing import AsyncIterator, List, Optional, Tuple
+from sqlalchemy import Select, select, and_, or_, exists, insert, literal
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import contains_eager, joinedload
 
 from app.models.application import Application, ApplicationStatus
 from app.models.job import Job
+from app.models.user import User
 from app.schemas.application import ApplicationCreate, ApplicationUpdate
+from app.utils.cache import TTLCache
 from app.utils.exceptions import NotFoundException, ConflictException
 
 logger = logging.getLogger(__name__)
 
+# application_id -> (applicant ID, job creator ID); neither changes after creation
+_auth_context_cache = TTLCache(maxsize=4096, ttl=60)
+
+# Rows fetched per round-trip when streaming applications
+STREAM_BATCH_SIZE = 50
+
 
 class ApplicationService:
     """Service for managing job applications."""
@@ -27,6 +36,10 @@ class ApplicationService:
         """
         Get an application by ID.
 
+        The job (with its company) is joined in the same query, so permission
+        checks on application.job.created_by_id and the response need no
+        further round-trips.
+
         Args:
             db: Database session
             application_id: Application ID
@@ -36,14 +49,78 @@ class ApplicationService:
         """
         stmt = (
             select(Application)
-            .options(
-                joinedload(Application.job).joinedload(Job.company),
-                joinedload(Application.user)
-            )
+            .options(joinedload(Application.job).joinedload(Job.company))
             .where(Application.id == application_id)
         )
         result = await db.execute(stmt)
-        return result.scalar_one_or_none()
+        application = result.scalar_one_or_none()
+
+        if application:
+            _auth_context_cache.set(
+                application_id, (application.user_id, application.job.created_by_id)
+            )
+        return application
+
+    @staticmethod
+    async def get_with_auth(
+        db: AsyncSession,
+        application_id: int,
+        user_id: int
+    ) -> Optional[Tuple[Application, bool]]:
+        """
+        Get an application together with whether a user may view it.
+
+        The permission (applicant, job creator or admin) is evaluated in SQL
+        alongside the application, its job and company, so loading and
+        authorizing take a single query.
+
+        Args:
+            db: Database session
+            application_id: Application ID
+            user_id: ID of the user requesting access
+
+        Returns:
+            (application, allowed) if found, None otherwise
+        """
+        allowed = or_(
+            Application.user_id == user_id,
+            Job.created_by_id == user_id,
+            User.is_admin
+        ).label("allowed")
+        stmt = (
+            select(Application, allowed)
+            .join(Application.job)
+            .outerjoin(User, User.id == user_id)
+            .options(contains_eager(Application.job).joinedload(Job.company))
+            .where(Application.id == application_id)
+        )
+        row = (await db.execute(stmt)).first()
+        if row is None:
+            return None
+
+        application = row.Application
+        _auth_context_cache.set(
+            application_id, (application.user_id, application.job.created_by_id)
+        )
+        return application, bool(row.allowed)
+
+    @staticmethod
+    def get_cached_auth_context(
+        application_id: int
+    ) -> Optional[Tuple[int, Optional[int]]]:
+        """
+        Get the recently seen permission context of an application.
+
+        Populated by get_by_id, so repeated requests from users without
+        access can be refused without touching the database.
+
+        Args:
+            application_id: Application ID
+
+        Returns:
+            (applicant ID, job creator ID) if cached, None otherwise
+        """
+        return _auth_context_cache.get(application_id)
 
     @staticmethod
     async def get_user_applications(
@@ -66,6 +143,51 @@ class ApplicationService:
         Returns:
             List of applications with job details
         """
+        stmt = ApplicationService._user_applications_stmt(user_id, status, skip, limit)
+        result = await db.execute(stmt)
+        return list(result.scalars().unique().all())
+
+    @staticmethod
+    async def stream_user_applications(
+        db: AsyncSession,
+        user_id: int,
+        status: Optional[ApplicationStatus] = None,
+        skip: int = 0,
+        limit: int = 20
+    ) -> AsyncIterator[Application]:
+        """
+        Stream a user's applications row by row.
+
+        Same query as get_user_applications, but rows are fetched from a
+        server-side cursor in batches of STREAM_BATCH_SIZE instead of being
+        buffered into a list first. The session must stay open until the
+        iterator is exhausted.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            status: Optional status filter
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Yields:
+            Applications with job details
+        """
+        stmt = ApplicationService._user_applications_stmt(user_id, status, skip, limit)
+        result = await db.stream_scalars(
+            stmt.execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        async for application in result:
+            yield application
+
+    @staticmethod
+    def _user_applications_stmt(
+        user_id: int,
+        status: Optional[ApplicationStatus],
+        skip: int,
+        limit: int
+    ) -> Select:
+        """Build the paginated query behind get/stream_user_applications."""
         stmt = (
             select(Application)
             .options(joinedload(Application.job).joinedload(Job.company))
@@ -75,10 +197,7 @@ class ApplicationService:
         if status:
             stmt = stmt.where(Application.status == status)
 
-        stmt = stmt.order_by(Application.applied_at.desc()).offset(skip).limit(limit)
-
-        result = await db.execute(stmt)
-        return list(result.scalars().unique().all())
+        return stmt.order_by(Application.applied_at.desc()).offset(skip).limit(limit)
 
     @staticmethod
     async def get_job_applications(
@@ -111,6 +230,53 @@ class ApplicationService:
         result = await db.execute(stmt)
         return list(result.scalars().all())
 
+    @staticmethod
+    async def get_job_applications_with_owner(
+        db: AsyncSession,
+        job_id: int,
+        status: Optional[ApplicationStatus] = None,
+        skip: int = 0,
+        limit: int = 20
+    ) -> Optional[Tuple[Optional[int], List[Application]]]:
+        """
+        Get applications for a job together with the job's creator ID.
+
+        Applications and the job owner come back in one joined query, so the
+        caller can check permissions without a separate job lookup. Only when
+        the page is empty is the job itself probed, to tell "no applications"
+        from "no such job".
+
+        Args:
+            db: Database session
+            job_id: Job ID
+            status: Optional status filter
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            (job creator ID, applications) if the job exists, None otherwise
+        """
+        stmt = (
+            select(Application, Job.created_by_id)
+            .join(Job, Application.job_id == Job.id)
+            .where(Application.job_id == job_id)
+        )
+
+        if status:
+            stmt = stmt.where(Application.status == status)
+
+        stmt = stmt.order_by(Application.applied_at.desc()).offset(skip).limit(limit)
+
+        rows = (await db.execute(stmt)).all()
+        if rows:
+            return rows[0].created_by_id, [row.Application for row in rows]
+
+        owner_stmt = select(Job.created_by_id).where(Job.id == job_id)
+        owner = (await db.execute(owner_stmt)).first()
+        if owner is None:
+            return None
+        return owner.created_by_id, []
+
     @staticmethod
     async def has_applied(
         db: AsyncSession,
@@ -128,14 +294,15 @@ class ApplicationService:
         Returns:
             True if user has applied, False otherwise
         """
-        stmt = select(Application).where(
-            and_(
-                Application.user_id == user_id,
-                Application.job_id == job_id
+        stmt = select(
+            exists().where(
+                and_(
+                    Application.user_id == user_id,
+                    Application.job_id == job_id
+                )
             )
         )
-        result = await db.execute(stmt)
-        return result.scalar_one_or_none() is not None
+        return bool(await db.scalar(stmt))
 
     @staticmethod
     async def create(
@@ -146,6 +313,10 @@ class ApplicationService:
         """
         Create a new job application.
 
+        The job-exists and not-yet-applied checks are part of a single
+        INSERT ... SELECT, so the happy path needs no separate lookups;
+        only a rejected insert probes the job to pick the right error.
+
         Args:
             db: Database session
             user_id: User ID
@@ -158,36 +329,43 @@ class ApplicationService:
             NotFoundException: If job not found
             ConflictException: If user already applied to this job
         """
-        # Check if job exists
-        job_stmt = select(Job).where(Job.id == application_data.job_id)
-        job_result = await db.execute(job_stmt)
-        job = job_result.scalar_one_or_none()
-        if not job:
-            raise NotFoundException("Job", application_data.job_id)
-
-        # Check if already applied
-        has_applied = await ApplicationService.has_applied(
-            db, user_id, application_data.job_id
+        job_id = application_data.job_id
+
+        # Insert only if the job exists and the user hasn't applied yet
+        candidate = select(
+            literal(user_id),
+            literal(job_id),
+            literal(application_data.cover_letter, Application.cover_letter.type),
+            literal(application_data.resume_url, Application.resume_url.type),
+        ).where(
+            exists().where(Job.id == job_id),
+            ~exists().where(
+                and_(Application.user_id == user_id, Application.job_id == job_id)
+            ),
         )
-        if has_applied:
-            raise ConflictException(
-                f"You have already applied to job {application_data.job_id}"
-            )
-
-        # Create application
-        application = Application(
-            user_id=user_id,
-            job_id=application_data.job_id,
-            cover_letter=application_data.cover_letter,
-            resume_url=application_data.resume_url,
-            status=ApplicationStatus.PENDING
+        stmt = (
+            insert(Application)
+            .from_select(["user_id", "job_id", "cover_letter", "resume_url"], candidate)
+            .returning(Application.id)
         )
-        db.add(application)
-        await db.flush()
-
-        # Reload with job details
-        await db.refresh(application, ["job"])
-        await db.refresh(application.job, ["company"])
+        try:
+            application_id = (await db.execute(stmt)).scalar_one_or_none()
+        except IntegrityError:
+            # A concurrent request inserted the same (user, job) first
+            await db.rollback()
+            raise ConflictException(f"You have already applied to job {job_id}")
+
+        if application_id is None:
+            # Nothing inserted: tell a missing job from a duplicate
+            job_found = await db.scalar(select(exists().where(Job.id == job_id)))
+            if not job_found:
+                raise NotFoundException("Job", job_id)
+            raise ConflictException(f"You have already applied to job {job_id}")
+
+        await db.commit()
+
+        # Load with job details for the response
+        application = await ApplicationService.get_by_id(db, application_id)
 
         logger.info(f"User {user_id} applied to job {application_data.job_id}")
         return application
@@ -195,30 +373,26 @@ class ApplicationService:
     @staticmethod
     async def update_status(
         db: AsyncSession,
-        application_id: int,
+        application: Application,
         status_update: ApplicationUpdate
-    ) -> Optional[Application]:
+    ) -> Application:
         """
         Update application status (employer only).
 
         Args:
             db: Database session
-            application_id: Application ID
+            application: Application loaded via get_by_id (permission already checked)
             status_update: New status
 
         Returns:
-            Updated application if found, None otherwise
+            Updated application
         """
-        application = await ApplicationService.get_by_id(db, application_id)
-        if not application:
-            return None
-
         application.status = status_update.status
-        await db.flush()
-        await db.refresh(application)
+        # updated_at comes back from the UPDATE itself (eager_defaults)
+        await db.commit()
 
         logger.info(
-            f"Application {application_id} status updated to {status_update.status}"
+            f"Application {application.id} status updated to {status_update.status}"
         )
         return application
 
@@ -244,8 +418,7 @@ class ApplicationService:
             return None
 
         application.status = ApplicationStatus.WITHDRAWN
-        await db.flush()
-        await db.refresh(application)
+        await db.commit()
 
         logger.info(f"User {user_id} withdrew application {application_id}")
         return application
@@ -7,13 +7,16 @@ Authentication service with business logic for:
 - Refresh token rotation
 - Logout with token revocation
 - Password reset flow
+- Cleanup of expired tokens
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from typing import Any, Awaitable, Callable, Optional, Tuple
 
-from sqlalchemy import select
+from fastapi import BackgroundTasks
+from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
@@ -29,9 +32,10 @@ from app.utils.security import (
     decode_token,
     generate_random_token,
     hash_token,
-    verify_token_hash,
+    REFRESH_TOKEN_TTL,
+    REFRESH_TOKEN_REMEMBER_ME_TTL,
 )
-from app.utils.exceptions import ValidationException, NotFoundException
+from app.utils.exceptions import ValidationException
 from app.services.email_service import (
     send_verification_email,
     send_password_reset_email,
@@ -40,13 +44,57 @@ from app.services.email_service import (
 
 logger = logging.getLogger(__name__)
 
+# Token lifetimes, computed once from settings
+EMAIL_VERIFICATION_TTL = timedelta(hours=settings.EMAIL_VERIFICATION_EXPIRE_HOURS)
+PASSWORD_RESET_TTL = timedelta(hours=settings.PASSWORD_RESET_EXPIRE_HOURS)
+
+
+def access_token_claims(user: User) -> dict[str, Any]:
+    """
+    Build the access token claims for a user.
+
+    Only the user ID and role go into the token: it is sent with every
+    request, and anything else in it would go stale as soon as the profile
+    changes. Endpoints load the current profile from the database.
+
+    Args:
+        user: User the token is issued to
+
+    Returns:
+        Claims for create_access_token
+    """
+    return {"sub": str(user.id), "role": user.role}
+
+
+async def _send_email(
+    background_tasks: Optional[BackgroundTasks],
+    send: Callable[..., Awaitable[bool]],
+    **kwargs: Any
+) -> None:
+    """
+    Send an email now, or after the response if background_tasks is given.
+
+    Deferring keeps the SMTP round-trip out of the request; the token rows
+    the email refers to are committed before this is called.
+
+    Args:
+        background_tasks: Request's background tasks, or None to send inline
+        send: Email sending coroutine function
+        **kwargs: Arguments for send
+    """
+    if background_tasks is not None:
+        background_tasks.add_task(send, **kwargs)
+    else:
+        await send(**kwargs)
+
 
 async def register_user(
     db: AsyncSession,
     email: str,
     password: str,
     full_name: str,
-    role: UserRole = UserRole.REGULAR_USER
+    role: UserRole = UserRole.REGULAR_USER,
+    background_tasks: Optional[BackgroundTasks] = None
 ) -> User:
     """
     Register a new user and send verification email.
@@ -57,6 +105,7 @@ async def register_user(
         password: Plain text password
         full_name: User's full name
         role: User role (default: REGULAR_USER)
+        background_tasks: If given, the email is sent after the response
 
     Returns:
         Created user (not yet verified)
@@ -75,7 +124,7 @@ async def register_user(
     # Create user
     user = User(
         email=email,
-        hashed_password=hash_password(password),
+        hashed_password=await asyncio.to_thread(hash_password, password),
         full_name=full_name,
         role=role,
         is_active=True,
@@ -87,7 +136,7 @@ async def register_user(
 
     # Generate email verification token
     token = generate_random_token()
-    expires_at = datetime.utcnow() + timedelta(hours=settings.EMAIL_VERIFICATION_EXPIRE_HOURS)
+    expires_at = datetime.utcnow() + EMAIL_VERIFICATION_TTL
 
     verification_token = EmailVerificationToken(
         token=token,
@@ -96,30 +145,38 @@ async def register_user(
     )
 
     db.add(verification_token)
+    # Server-side timestamps came back with the INSERT (eager_defaults) and
+    # commit doesn't expire the user, so no refresh is needed
     await db.commit()
-    await db.refresh(user)
 
     # Send verification email (non-blocking)
     try:
-        await send_verification_email(
+        await _send_email(
+            background_tasks,
+            send_verification_email,
             email=user.email,
             full_name=user.full_name,
             verification_token=token,
         )
-        logger.info(f"Verification email sent to {email}")
+        logger.info(f"Verification email queued for {email}")
     except Exception as e:
         logger.error(f"Failed to send verification email to {email}: {e}")
 
     return user
 
 
-async def verify_email(db: AsyncSession, token: str) -> User:
+async def verify_email(
+    db: AsyncSession,
+    token: str,
+    background_tasks: Optional[BackgroundTasks] = None
+) -> User:
     """
     Verify user's email address using verification token.
 
     Args:
         db: Database session
         token: Email verification token
+        background_tasks: If given, the welcome email is sent after the response
 
     Returns:
         Verified user
@@ -127,30 +184,25 @@ async def verify_email(db: AsyncSession, token: str) -> User:
     Raises:
         ValidationException: If token is invalid, expired, or already used
     """
-    # Find token
-    stmt = select(EmailVerificationToken).where(
-        EmailVerificationToken.token == token
+    # Find token together with its user in one round trip
+    stmt = (
+        select(EmailVerificationToken, User)
+        .join(User, EmailVerificationToken.user_id == User.id)
+        .where(EmailVerificationToken.token == token)
     )
-    result = await db.execute(stmt)
-    verification_token = result.scalar_one_or_none()
+    row = (await db.execute(stmt)).first()
 
-    if not verification_token:
+    if not row:
         raise ValidationException("Invalid verification token")
 
+    verification_token, user = row
+
     if verification_token.used:
         raise ValidationException("Verification token already used")
 
     if verification_token.expires_at < datetime.utcnow():
         raise ValidationException("Verification token expired")
 
-    # Get user
-    stmt = select(User).where(User.id == verification_token.user_id)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
-
-    if not user:
-        raise NotFoundException("User not found")
-
     # Mark user as verified
     user.is_verified = True
     verification_token.used = True
@@ -160,11 +212,13 @@ async def verify_email(db: AsyncSession, token: str) -> User:
 
     # Send welcome email (non-blocking)
     try:
-        await send_welcome_email(
+        await _send_email(
+            background_tasks,
+            send_welcome_email,
             email=user.email,
             full_name=user.full_name,
         )
-        logger.info(f"Welcome email sent to {user.email}")
+        logger.info(f"Welcome email queued for {user.email}")
     except Exception as e:
         logger.error(f"Failed to send welcome email to {user.email}: {e}")
 
@@ -175,7 +229,8 @@ async def login(
     db: AsyncSession,
     email: str,
     password: str,
-    remember_me: bool = False
+    remember_me: bool = False,
+    background_tasks: Optional[BackgroundTasks] = None
 ) -> Tuple[str, str, User]:
     """
     Authenticate user and generate JWT tokens.
@@ -185,6 +240,7 @@ async def login(
         email: User's email
         password: Plain text password
         remember_me: If True, refresh token expires in 90 days instead of 30
+        background_tasks: If given, the login is logged after the response
 
     Returns:
         Tuple of (access_token, refresh_token, user)
@@ -197,7 +253,9 @@ async def login(
     result = await db.execute(stmt)
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(password, user.hashed_password):
+    if not user or not await asyncio.to_thread(
+        verify_password, password, user.hashed_password
+    ):
         raise ValidationException("Invalid email or password")
 
     if not user.is_active:
@@ -207,19 +265,15 @@ async def login(
         raise ValidationException("Email not verified. Please check your inbox.")
 
     # Generate tokens
-    access_token = create_access_token(data={"sub": str(user.id), "role": user.role})
+    access_token = create_access_token(data=access_token_claims(user))
     refresh_token_str = create_refresh_token(
         data={"sub": str(user.id)},
         remember_me=remember_me
     )
 
     # Store refresh token in database (hashed)
-    expires_days = (
-        settings.REFRESH_TOKEN_REMEMBER_ME_EXPIRE_DAYS
-        if remember_me
-        else settings.REFRESH_TOKEN_EXPIRE_DAYS
-    )
-    expires_at = datetime.utcnow() + timedelta(days=expires_days)
+    ttl = REFRESH_TOKEN_REMEMBER_ME_TTL if remember_me else REFRESH_TOKEN_TTL
+    expires_at = datetime.utcnow() + ttl
 
     refresh_token = RefreshToken(
         token=hash_token(refresh_token_str),
@@ -230,7 +284,11 @@ async def login(
     db.add(refresh_token)
     await db.commit()
 
-    logger.info(f"User {user.email} logged in successfully")
+    message = f"User {user.email} logged in successfully"
+    if background_tasks is not None:
+        background_tasks.add_task(logger.info, message)
+    else:
+        logger.info(message)
 
     return access_token, refresh_token_str, user
 
@@ -238,7 +296,7 @@ async def login(
 async def refresh_access_token(
     db: AsyncSession,
     refresh_token_str: str
-) -> Tuple[str, str]:
+) -> Tuple[str, str, User]:
     """
     Refresh access token using refresh token (with token rotation).
 
@@ -247,7 +305,7 @@ async def refresh_access_token(
         refresh_token_str: Refresh token from client
 
     Returns:
-        Tuple of (new_access_token, new_refresh_token)
+        Tuple of (new_access_token, new_refresh_token, user)
 
     Raises:
         ValidationException: If refresh token is invalid or revoked
@@ -259,44 +317,39 @@ async def refresh_access_token(
 
     user_id = int(payload.get("sub"))
 
-    # Find refresh token in database
-    stmt = select(RefreshToken).where(
-        RefreshToken.user_id == user_id,
-        RefreshToken.revoked == False,  # noqa: E712
+    # Find refresh token by its (deterministic) hash, together with its user
+    stmt = (
+        select(RefreshToken, User)
+        .join(User, RefreshToken.user_id == User.id)
+        .where(
+            RefreshToken.token == hash_token(refresh_token_str),
+            RefreshToken.user_id == user_id,
+            RefreshToken.revoked == False,  # noqa: E712
+        )
     )
-    result = await db.execute(stmt)
-    tokens = result.scalars().all()
-
-    # Verify token hash
-    valid_token = None
-    for token in tokens:
-        if verify_token_hash(refresh_token_str, token.token):
-            valid_token = token
-            break
+    row = (await db.execute(stmt)).first()
 
-    if not valid_token:
+    if not row:
         raise ValidationException("Refresh token not found or revoked")
 
-    if valid_token.expires_at < datetime.utcnow():
-        raise ValidationException("Refresh token expired")
+    valid_token, user = row
+    now = datetime.utcnow()
 
-    # Get user
-    stmt = select(User).where(User.id == user_id)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    if valid_token.expires_at < now:
+        raise ValidationException("Refresh token expired")
 
-    if not user or not user.is_active or not user.is_verified:
+    if not user.is_active or not user.is_verified:
         raise ValidationException("User not found or inactive")
 
     # Token rotation: revoke old token and create new one
     valid_token.revoked = True
 
     # Generate new tokens
-    new_access_token = create_access_token(data={"sub": str(user.id), "role": user.role})
+    new_access_token = create_access_token(data=access_token_claims(user))
     new_refresh_token_str = create_refresh_token(data={"sub": str(user.id)})
 
     # Store new refresh token
-    expires_at = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    expires_at = now + REFRESH_TOKEN_TTL
     new_refresh_token = RefreshToken(
         token=hash_token(new_refresh_token_str),
         user_id=user.id,
@@ -308,7 +361,7 @@ async def refresh_access_token(
 
     logger.info(f"Tokens refreshed for user {user.email}")
 
-    return new_access_token, new_refresh_token_str
+    return new_access_token, new_refresh_token_str, user
 
 
 async def logout(db: AsyncSession, refresh_token_str: str) -> None:
@@ -331,30 +384,33 @@ async def logout(db: AsyncSession, refresh_token_str: str) -> None:
 
     # Find and revoke token
     stmt = select(RefreshToken).where(
+        RefreshToken.token == hash_token(refresh_token_str),
         RefreshToken.user_id == user_id,
         RefreshToken.revoked == False,  # noqa: E712
     )
     result = await db.execute(stmt)
-    tokens = result.scalars().all()
+    token = result.scalars().first()
 
-    # Verify and revoke token
-    for token in tokens:
-        if verify_token_hash(refresh_token_str, token.token):
-            token.revoked = True
-            await db.commit()
-            logger.info(f"User {user_id} logged out successfully")
-            return
+    if not token:
+        raise ValidationException("Refresh token not found")
 
-    raise ValidationException("Refresh token not found")
+    token.revoked = True
+    await db.commit()
+    logger.info(f"User {user_id} logged out successfully")
 
 
-async def request_password_reset(db: AsyncSession, email: str) -> None:
+async def request_password_reset(
+    db: AsyncSession,
+    email: str,
+    background_tasks: Optional[BackgroundTasks] = None
+) -> None:
     """
     Generate password reset token and send email.
 
     Args:
         db: Database session
         email: User's email address
+        background_tasks: If given, the email is sent after the response
 
     Note:
         Does not raise exception if email not found (security: don't reveal user existence)
@@ -371,7 +427,7 @@ async def request_password_reset(db: AsyncSession, email: str) -> None:
 
     # Generate password reset token
     token = generate_random_token()
-    expires_at = datetime.utcnow() + timedelta(hours=settings.PASSWORD_RESET_EXPIRE_HOURS)
+    expires_at = datetime.utcnow() + PASSWORD_RESET_TTL
 
     reset_token = PasswordResetToken(
         token=token,
@@ -384,12 +440,14 @@ async def request_password_reset(db: AsyncSession, email: str) -> None:
 
     # Send password reset email
     try:
-        await send_password_reset_email(
+        await _send_email(
+            background_tasks,
+            send_password_reset_email,
             email=user.email,
             full_name=user.full_name,
             reset_token=token,
         )
-        logger.info(f"Password reset email sent to {email}")
+        logger.info(f"Password reset email queued for {email}")
     except Exception as e:
         logger.error(f"Failed to send password reset email to {email}: {e}")
 
@@ -409,44 +467,39 @@ async def reset_password(db: AsyncSession, token: str, new_password: str) -> Use
     Raises:
         ValidationException: If token is invalid, expired, or already used
     """
-    # Find token
-    stmt = select(PasswordResetToken).where(
-        PasswordResetToken.token == token
+    # Find token together with its user in one round trip
+    stmt = (
+        select(PasswordResetToken, User)
+        .join(User, PasswordResetToken.user_id == User.id)
+        .where(PasswordResetToken.token == token)
     )
-    result = await db.execute(stmt)
-    reset_token = result.scalar_one_or_none()
+    row = (await db.execute(stmt)).first()
 
-    if not reset_token:
+    if not row:
         raise ValidationException("Invalid password reset token")
 
+    reset_token, user = row
+
     if reset_token.used:
         raise ValidationException("Password reset token already used")
 
     if reset_token.expires_at < datetime.utcnow():
         raise ValidationException("Password reset token expired")
 
-    # Get user
-    stmt = select(User).where(User.id == reset_token.user_id)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
-
-    if not user:
-        raise NotFoundException("User not found")
-
     # Update password
-    user.hashed_password = hash_password(new_password)
+    user.hashed_password = await asyncio.to_thread(hash_password, new_password)
     reset_token.used = True
 
-    # Revoke all refresh tokens for security
-    stmt = select(RefreshToken).where(
-        RefreshToken.user_id == user.id,
-        RefreshToken.revoked == False,  # noqa: E712
+    # Revoke all refresh tokens for security, in one UPDATE
+    await db.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.user_id == user.id,
+            RefreshToken.revoked == False,  # noqa: E712
+        )
+        .values(revoked=True)
+        .execution_options(synchronize_session=False)
     )
-    result = await db.execute(stmt)
-    refresh_tokens = result.scalars().all()
-
-    for rt in refresh_tokens:
-        rt.revoked = True
 
     await db.commit()
     await db.refresh(user)
@@ -456,13 +509,18 @@ async def reset_password(db: AsyncSession, token: str, new_password: str) -> Use
     return user
 
 
-async def resend_verification_email(db: AsyncSession, email: str) -> None:
+async def resend_verification_email(
+    db: AsyncSession,
+    email: str,
+    background_tasks: Optional[BackgroundTasks] = None
+) -> None:
     """
     Resend verification email to user.
 
     Args:
         db: Database session
         email: User's email address
+        background_tasks: If given, the email is sent after the response
 
     Raises:
         ValidationException: If user not found or already verified
@@ -480,7 +538,7 @@ async def resend_verification_email(db: AsyncSession, email: str) -> None:
 
     # Generate new verification token
     token = generate_random_token()
-    expires_at = datetime.utcnow() + timedelta(hours=settings.EMAIL_VERIFICATION_EXPIRE_HOURS)
+    expires_at = datetime.utcnow() + EMAIL_VERIFICATION_TTL
 
     verification_token = EmailVerificationToken(
         token=token,
@@ -493,12 +551,62 @@ async def resend_verification_email(db: AsyncSession, email: str) -> None:
 
     # Send verification email
     try:
-        await send_verification_email(
+        await _send_email(
+            background_tasks,
+            send_verification_email,
             email=user.email,
             full_name=user.full_name,
             verification_token=token,
         )
-        logger.info(f"Verification email resent to {email}")
+        logger.info(f"Verification email re-queued for {email}")
     except Exception as e:
         logger.error(f"Failed to resend verification email to {email}: {e}")
         raise ValidationException("Failed to send verification email")
+
+
+# Rows deleted per statement by cleanup_expired_tokens
+TOKEN_CLEANUP_BATCH_SIZE = 5000
+
+
+async def cleanup_expired_tokens(
+    db: AsyncSession,
+    batch_size: int = TOKEN_CLEANUP_BATCH_SIZE,
+) -> int:
+    """
+    Delete expired refresh, password reset and email verification tokens.
+
+    Expired tokens can never be redeemed, so keeping them only grows the
+    tables and their indexes. Rows are deleted in batches (oldest first),
+    committing after each, so no single statement holds long locks or
+    builds a huge undo log.
+
+    Args:
+        db: Database session
+        batch_size: Maximum rows deleted per statement
+
+    Returns:
+        Number of deleted tokens
+    """
+    now = datetime.utcnow()
+    deleted = 0
+
+    for model in (RefreshToken, PasswordResetToken, EmailVerificationToken):
+        while True:
+            stmt = (
+                select(model.id)
+                .where(model.expires_at < now)
+                .order_by(model.expires_at)
+                .limit(batch_size)
+            )
+            ids = (await db.execute(stmt)).scalars().all()
+            if not ids:
+                break
+
+            await db.execute(delete(model).where(model.id.in_(ids)))
+            await db.commit()
+            deleted += len(ids)
+
+    if deleted:
+        logger.info(f"Removed {deleted} expired tokens")
+
+    return deleted
@@ -4,12 +4,14 @@ Company service layer - business logic for company operations.
 All database queries for companies happen here.
 """
 
-from typing import List, Optional
-from sqlalchemy import select
+from typing import List, Optional, Tuple
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.company import Company
+from app.models.job import Job
 from app.schemas.company import CompanyCreate
 
 
@@ -17,27 +19,70 @@ class CompanyService:
     """Service class for company-related operations."""
     
     @staticmethod
-    async def get_all(db: AsyncSession) -> List[Company]:
+    async def get_all(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Company]:
         """
-        Get all companies.
+        Get a page of companies, ordered by ID.
+        
+        Relationships are not loaded; touching one raises instead of
+        silently issuing a query per company.
         
         Args:
             db: Database session
+            skip: Number of records to skip
+            limit: Maximum number of records to return
             
         Returns:
-            List of all companies
+            List of companies
         """
-        result = await db.execute(select(Company))
+        result = await db.execute(
+            select(Company)
+            .options(raiseload("*"))
+            .order_by(Company.id)
+            .offset(skip)
+            .limit(limit)
+        )
         return list(result.scalars().all())
     
     @staticmethod
-    async def get_by_id(db: AsyncSession, company_id: int) -> Optional[Company]:
+    async def get_list_version(db: AsyncSession) -> Tuple[int, Optional[int]]:
+        """
+        Get a cheap version key for the company list.
+        
+        Companies are only ever added through the API (never edited or
+        deleted), so the row count and highest ID change exactly when
+        the list does.
+        
+        Args:
+            db: Database session
+            
+        Returns:
+            (number of companies, highest company ID)
+        """
+        result = await db.execute(select(func.count(Company.id), func.max(Company.id)))
+        count, max_id = result.one()
+        return count, max_id
+    
+    @staticmethod
+    async def get_by_id(
+        db: AsyncSession,
+        company_id: int,
+        jobs_limit: int = 100
+    ) -> Optional[Company]:
         """
-        Get company by ID with all jobs.
+        Get company by ID with its most recent jobs.
+        
+        The jobs are read with their own LIMITed query (served by the
+        (company_id, created_at) index) and assigned to company.jobs, so a
+        company with thousands of postings never loads them all.
         
         Args:
             db: Database session
             company_id: Company ID
+            jobs_limit: Maximum number of jobs to include, newest first
             
         Returns:
             Company with jobs or None if not found
@@ -45,9 +90,24 @@ class CompanyService:
         result = await db.execute(
             select(Company)
             .where(Company.id == company_id)
-            .options(selectinload(Company.jobs))
+            .options(raiseload("*"))
         )
-        return result.scalar_one_or_none()
+        company = result.scalar_one_or_none()
+        if company is None:
+            return None
+        
+        jobs_result = await db.execute(
+            select(Job)
+            .where(Job.company_id == company_id)
+            .options(raiseload("*"))
+            .order_by(Job.created_at.desc())
+            .limit(jobs_limit)
+        )
+        jobs = list(jobs_result.scalars().all())
+        for job in jobs:
+            set_committed_value(job, "company", company)
+        set_committed_value(company, "jobs", jobs)
+        return company
     
     @staticmethod
     async def create(
@@ -72,6 +132,6 @@ class CompanyService:
 
         company = Company(**company_dict)
         db.add(company)
-        await db.flush()
+        await db.commit()
         await db.refresh(company)
         return company
@@ -39,8 +39,10 @@ async def send_email(
     Returns:
         True if email sent successfully, False otherwise
     """
+    smtp = settings.smtp
+
     # Skip if SMTP not configured
-    if not settings.SMTP_USER or not settings.SMTP_PASSWORD:
+    if not smtp.SMTP_USER or not smtp.SMTP_PASSWORD:
         logger.warning(
             f"SMTP not configured. Email not sent to {email_to} with subject: {subject}"
         )
@@ -48,7 +50,7 @@ async def send_email(
 
     try:
         message = EmailMessage()
-        message["From"] = f"{settings.SMTP_FROM_NAME} <{settings.SMTP_FROM_EMAIL or settings.SMTP_USER}>"
+        message["From"] = f"{smtp.SMTP_FROM_NAME} <{smtp.SMTP_FROM_EMAIL or smtp.SMTP_USER}>"
         message["To"] = email_to
         message["Subject"] = subject
 
@@ -62,10 +64,10 @@ async def send_email(
         # Send email
         await aiosmtplib.send(
             message,
-            hostname=settings.SMTP_HOST,
-            port=settings.SMTP_PORT,
-            username=settings.SMTP_USER,
-            password=settings.SMTP_PASSWORD,
+            hostname=smtp.SMTP_HOST,
+            port=smtp.SMTP_PORT,
+            username=smtp.SMTP_USER,
+            password=smtp.SMTP_PASSWORD,
             start_tls=True,
         )
 
@@ -2,13 +2,42 @@
 HeadHunter API Client Service
 Handles all interactions with hh.ru API
 """
+import asyncio
 import logging
-from typing import Optional
+import random
+from functools import partial
+from typing import Any, Optional
 import httpx
 from app.schemas.hh_vacancy import HHVacanciesResponse, HHVacancy
+from app.utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# hh.ru results change slowly and popular searches repeat across users,
+# so successful responses are reused for a short while
+_search_cache = TTLCache(maxsize=512, ttl=120)
+_vacancy_cache = TTLCache(maxsize=2048, ttl=900)
+
+# Searches currently being fetched, so concurrent identical requests
+# (e.g. a burst after the cache entry expires) make one upstream call.
+# Each fetch runs in its own task, so it completes even if the request
+# that started it is cancelled.
+_inflight_searches: dict[tuple, asyncio.Task] = {}
+
+
+def _forget_search(cache_key: tuple, task: asyncio.Task) -> None:
+    """Drop a finished search from _inflight_searches."""
+    if _inflight_searches.get(cache_key) is task:
+        del _inflight_searches[cache_key]
+    if not task.cancelled():
+        task.exception()  # Retrieved here, so no warning if nobody waited
+
+# 429s from hh.ru are retried with "full jitter" exponential backoff, so a
+# burst of our own requests is spread out instead of failing together
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.1  # seconds
+RETRY_MAX_DELAY = 2.0  # seconds
+
 
 class HHAPIError(Exception):
     """Base exception for HH API errors"""
@@ -54,22 +83,58 @@ class HHService:
         self.timeout = timeout
         self._client: Optional[httpx.AsyncClient] = None
     
-    async def __aenter__(self):
-        """Async context manager entry"""
+    async def open(self) -> None:
+        """
+        Create the underlying HTTP client
+        
+        The client keeps connections (and their TLS sessions) to hh.ru alive,
+        so a long-lived instance saves a handshake on every call.
+        """
         self._client = httpx.AsyncClient(
             base_url=self.BASE_URL,
             timeout=self.timeout,
             headers={
                 "User-Agent": self.user_agent,
                 "Accept": "application/json"
-            }
+            },
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=75
+            )
         )
+    
+    async def close(self) -> None:
+        """Close the underlying HTTP client"""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+    
+    async def __aenter__(self):
+        """Async context manager entry"""
+        await self.open()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self._client:
-            await self._client.aclose()
+        await self.close()
+    
+    async def _get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        GET with retries on 429 (rate limited) responses
+        
+        Sleeps a random delay in [0, min(max, base * 2^attempt)] between
+        attempts. The last response is returned as is, so callers still see
+        a 429 once the retries are used up.
+        """
+        for attempt in range(RETRY_ATTEMPTS):
+            response = await self._client.get(url, **kwargs)
+            if response.status_code != 429 or attempt == RETRY_ATTEMPTS - 1:
+                return response
+            
+            delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+            logger.warning(f"HH API rate limited {url}, retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
     
     async def get_vacancies(
         self,
@@ -93,7 +158,7 @@ class HHService:
             order_by: Sort order (publication_time, salary_desc, salary_asc, relevance)
         
         Returns:
-            HHVacanciesResponse with list of vacancies
+            HHVacanciesResponse with list of vacancies (cached for 2 minutes)
         
         Raises:
             HHRateLimitError: When rate limit exceeded (429)
@@ -114,9 +179,35 @@ class HHService:
             "search_field": "name"  # Search only in vacancy title for better precision
         }
         
+        cache_key = (text, role_id, area_id, per_page, page, order_by)
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Identical searches already in flight share that one upstream call.
+        # Every caller only waits on the shared task (shield), so a caller
+        # going away cancels its own wait, never the fetch the others need.
+        task = _inflight_searches.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_cache(cache_key, params))
+            _inflight_searches[cache_key] = task
+            task.add_done_callback(partial(_forget_search, cache_key))
+        return await asyncio.shield(task)
+    
+    async def _fetch_and_cache(self, cache_key: tuple, params: dict) -> HHVacanciesResponse:
+        """Fetch a vacancy search and cache the result under cache_key"""
+        vacancies = await self._fetch_vacancies(params)
+        _search_cache.set(cache_key, vacancies)
+        return vacancies
+    
+    async def _fetch_vacancies(self, params: dict) -> HHVacanciesResponse:
+        """Run one vacancy search against hh.ru and map errors to HHAPIError"""
         try:
-            logger.info(f"Fetching vacancies: text={text}, area={area_id}, page={page}")
-            response = await self._client.get("/vacancies", params=params)
+            logger.info(
+                f"Fetching vacancies: text={params['text']}, "
+                f"area={params['area']}, page={params['page']}"
+            )
+            response = await self._get("/vacancies", params=params)
             
             # Handle specific error codes
             if response.status_code == 429:
@@ -135,11 +226,12 @@ class HHService:
             # Raise for other error status codes
             response.raise_for_status()
             
-            # Parse response
-            data = response.json()
-            logger.info(f"Successfully fetched {len(data.get('items', []))} vacancies")
+            # Parse and validate straight from the raw bytes in pydantic-core,
+            # skipping the intermediate dict of the (much larger) HH payload
+            vacancies = HHVacanciesResponse.model_validate_json(response.content)
+            logger.info(f"Successfully fetched {len(vacancies.items)} vacancies")
             
-            return HHVacanciesResponse(**data)
+            return vacancies
         
         except httpx.TimeoutException as e:
             logger.error(f"Request timeout: {e}")
@@ -161,20 +253,26 @@ class HHService:
             vacancy_id: Vacancy ID from HH
         
         Returns:
-            Full vacancy details as dict
+            Full vacancy details as dict (cached for 15 minutes)
         """
         if not self._client:
             raise RuntimeError("HHService must be used as async context manager")
         
+        cached = _vacancy_cache.get(vacancy_id)
+        if cached is not None:
+            return cached
+        
         try:
             logger.info(f"Fetching vacancy details: id={vacancy_id}")
-            response = await self._client.get(f"/vacancies/{vacancy_id}")
+            response = await self._get(f"/vacancies/{vacancy_id}")
             
             if response.status_code == 404:
                 raise HHAPIError(f"Vacancy {vacancy_id} not found")
             
             response.raise_for_status()
-            return response.json()
+            vacancy = response.json()
+            _vacancy_cache.set(vacancy_id, vacancy)
+            return vacancy
         
         except httpx.HTTPError as e:
             logger.error(f"Error fetching vacancy {vacancy_id}: {e}")
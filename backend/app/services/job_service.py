@@ -4,18 +4,57 @@ Job service layer - business logic for job operations.
 All database queries for jobs happen here.
 """
 
-from typing import List, Optional
-from sqlalchemy import select, or_
+from typing import AsyncIterator, List, NoReturn, Optional
+from sqlalchemy import ColumnElement, Select, and_, delete, or_, select, true, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload
 
 from app.models.job import Job, JobLevel
 from app.schemas.job import JobCreate, JobUpdate
+from app.utils.exceptions import ForbiddenException, NotFoundException
+
+# Rows fetched per round-trip when streaming job lists
+STREAM_BATCH_SIZE = 50
 
 
 class JobService:
     """Service class for job-related operations."""
     
+    @staticmethod
+    def _list_stmt(
+        location: Optional[str],
+        level: Optional[JobLevel],
+        search: Optional[str],
+        skip: int,
+        limit: int
+    ) -> Select:
+        """Build the filtered, paginated job list query."""
+        # Company is joined into the same query (every job has one); any
+        # other relationship raises rather than lazy-loading per row
+        query = select(Job).options(
+            joinedload(Job.company, innerjoin=True),
+            raiseload("*")
+        )
+        
+        # Apply filters (substring matches use the trigram GIN indexes on PostgreSQL)
+        if location:
+            query = query.where(Job.location.ilike(f"%{location}%"))
+        
+        if level:
+            query = query.where(Job.level == level)
+        
+        if search:
+            search_pattern = f"%{search}%"
+            query = query.where(
+                or_(
+                    Job.title.ilike(search_pattern),
+                    Job.description.ilike(search_pattern)
+                )
+            )
+        
+        # Apply pagination and ordering
+        return query.order_by(Job.created_at.desc()).offset(skip).limit(limit)
+    
     @staticmethod
     async def get_all(
         db: AsyncSession,
@@ -39,30 +78,45 @@ class JobService:
         Returns:
             List of jobs matching filters
         """
-        query = select(Job).options(selectinload(Job.company))
-        
-        # Apply filters
-        if location:
-            query = query.where(Job.location.ilike(f"%{location}%"))
-        
-        if level:
-            query = query.where(Job.level == level)
-        
-        if search:
-            search_pattern = f"%{search}%"
-            query = query.where(
-                or_(
-                    Job.title.ilike(search_pattern),
-                    Job.description.ilike(search_pattern)
-                )
-            )
-        
-        # Apply pagination and ordering
-        query = query.order_by(Job.created_at.desc()).offset(skip).limit(limit)
-        
+        query = JobService._list_stmt(location, level, search, skip, limit)
         result = await db.execute(query)
         return list(result.scalars().all())
     
+    @staticmethod
+    async def stream_all(
+        db: AsyncSession,
+        location: Optional[str] = None,
+        level: Optional[JobLevel] = None,
+        search: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> AsyncIterator[Job]:
+        """
+        Stream jobs row by row.
+        
+        Same query as get_all, but rows are fetched from a server-side
+        cursor in batches of STREAM_BATCH_SIZE instead of being buffered
+        into a list first. The session must stay open until the iterator
+        is exhausted.
+        
+        Args:
+            db: Database session
+            location: Filter by location
+            level: Filter by seniority level
+            search: Search in title and description
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            
+        Yields:
+            Jobs with company
+        """
+        query = JobService._list_stmt(location, level, search, skip, limit)
+        result = await db.stream_scalars(
+            query.execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        async for job in result:
+            yield job
+    
     @staticmethod
     async def get_by_id(db: AsyncSession, job_id: int) -> Optional[Job]:
         """
@@ -78,7 +132,7 @@ class JobService:
         result = await db.execute(
             select(Job)
             .where(Job.id == job_id)
-            .options(selectinload(Job.company))
+            .options(joinedload(Job.company, innerjoin=True))
         )
         return result.scalar_one_or_none()
     
@@ -105,56 +159,107 @@ class JobService:
 
         job = Job(**job_dict)
         db.add(job)
-        await db.flush()
+        await db.commit()
         await db.refresh(job, ["company"])
         return job
     
+    @staticmethod
+    def _can_modify(user_id: int, is_admin: bool) -> ColumnElement[bool]:
+        """Condition limiting a write to jobs the user created (or any, for admins)."""
+        return true() if is_admin else Job.created_by_id == user_id
+    
+    @staticmethod
+    async def _raise_not_modifiable(
+        db: AsyncSession,
+        job_id: int,
+        action: str
+    ) -> NoReturn:
+        """
+        Explain why an authorized write matched no row.
+        
+        Raises:
+            NotFoundException: If the job does not exist
+            ForbiddenException: If it exists but belongs to someone else
+        """
+        exists_result = await db.execute(select(Job.id).where(Job.id == job_id))
+        if exists_result.scalar_one_or_none() is None:
+            raise NotFoundException("Job", job_id)
+        raise ForbiddenException(f"You don't have permission to {action} this job")
+    
     @staticmethod
     async def update(
         db: AsyncSession,
         job_id: int,
-        job_data: JobUpdate
-    ) -> Optional[Job]:
+        job_data: JobUpdate,
+        user_id: int,
+        is_admin: bool = False
+    ) -> Job:
         """
-        Update an existing job.
+        Update a job the user created (admins may update any job).
+        
+        Ownership is checked in the UPDATE's WHERE clause, so there is no
+        separate read before the write; only a write that matches no row
+        costs one more query to tell 404 from 403.
         
         Args:
             db: Database session
             job_id: Job ID to update
             job_data: Job update data
+            user_id: ID of the user making the change
+            is_admin: Whether the user is an admin
             
         Returns:
-            Updated job or None if not found
+            Updated job with company
+            
+        Raises:
+            NotFoundException: If job not found
+            ForbiddenException: If the user may not update the job
         """
-        job = await JobService.get_by_id(db, job_id)
-        if not job:
-            return None
+        allowed = and_(Job.id == job_id, JobService._can_modify(user_id, is_admin))
         
         # Update only provided fields
         update_data = job_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(job, field, value)
+        if update_data:
+            result = await db.execute(
+                update(Job).where(allowed).values(**update_data).returning(Job.id)
+            )
+        else:
+            result = await db.execute(select(Job.id).where(allowed))
+        if result.scalar_one_or_none() is None:
+            await JobService._raise_not_modifiable(db, job_id, "update")
         
-        await db.flush()
-        await db.refresh(job, ["company"])
-        return job
+        await db.commit()
+        return await JobService.get_by_id(db, job_id)
     
     @staticmethod
-    async def delete(db: AsyncSession, job_id: int) -> bool:
+    async def delete(
+        db: AsyncSession,
+        job_id: int,
+        user_id: int,
+        is_admin: bool = False
+    ) -> None:
         """
-        Delete a job.
+        Delete a job the user created (admins may delete any job).
+        
+        Saved jobs and applications go with it through their ON DELETE
+        CASCADE foreign keys.
         
         Args:
             db: Database session
             job_id: Job ID to delete
+            user_id: ID of the user deleting
+            is_admin: Whether the user is an admin
             
-        Returns:
-            True if deleted, False if not found
+        Raises:
+            NotFoundException: If job not found
+            ForbiddenException: If the user may not delete the job
         """
-        job = await JobService.get_by_id(db, job_id)
-        if not job:
-            return False
+        result = await db.execute(
+            delete(Job)
+            .where(Job.id == job_id, JobService._can_modify(user_id, is_admin))
+            .returning(Job.id)
+        )
+        if result.scalar_one_or_none() is None:
+            await JobService._raise_not_modifiable(db, job_id, "delete")
         
-        await db.delete(job)
-        await db.flush()
-        return True
+        await db.commit()
@@ -5,19 +5,26 @@ OAuth service for Google and GitHub authentication.
 
 import logging
 from typing import Dict, Optional, Tuple
-from urllib.parse import urlencode
+from functools import lru_cache
+from urllib.parse import quote_plus, urlencode
 
 import httpx
-from authlib.integrations.httpx_client import AsyncOAuth2Client
-from sqlalchemy import select
+from sqlalchemy import delete, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.models.user import User, UserRole
 from app.models.refresh_token import RefreshToken
 from app.models.oauth_state import OAuthState
-from app.utils.security import create_access_token, create_refresh_token, hash_token, generate_random_token
+from app.utils.security import (
+    create_access_token,
+    create_refresh_token,
+    hash_token,
+    generate_random_token,
+    REFRESH_TOKEN_TTL,
+)
 from app.utils.exceptions import ValidationException
+from app.services.auth_service import access_token_claims
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
@@ -37,6 +44,29 @@ GITHUB_CONFIG = {
     "scopes": ["user:email"],
 }
 
+# Shared client for token exchange and userinfo calls, so callbacks reuse
+# kept-alive connections to the providers instead of a new TLS handshake each
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared provider HTTP client, creating it if needed."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=5.0,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared provider HTTP client."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 async def create_oauth_state(db: AsyncSession, provider: str) -> str:
     """
@@ -57,7 +87,7 @@ async def create_oauth_state(db: AsyncSession, provider: str) -> str:
 
     # Generate random state token
     state = generate_random_token()
-    expires_at = datetime.utcnow() + timedelta(minutes=settings.OAUTH_STATE_EXPIRE_MINUTES)
+    expires_at = datetime.utcnow() + timedelta(minutes=settings.oauth.OAUTH_STATE_EXPIRE_MINUTES)
 
     # Store in database
     oauth_state = OAuthState(
@@ -89,28 +119,76 @@ async def validate_oauth_state(db: AsyncSession, state: str, provider: str) -> N
     if not state:
         raise ValidationException("Missing state parameter")
 
-    # Find state token
-    stmt = select(OAuthState).where(
-        OAuthState.state == state,
-        OAuthState.provider == provider,
+    # Consume the state in one atomic statement (served by the partial index
+    # on unused states); concurrent callbacks can't both claim it
+    stmt = (
+        update(OAuthState)
+        .where(
+            OAuthState.state == state,
+            OAuthState.provider == provider,
+            OAuthState.used == False,  # noqa: E712
+            OAuthState.expires_at >= datetime.utcnow(),
+        )
+        .values(used=True)
+        .returning(OAuthState.id)
     )
     result = await db.execute(stmt)
-    oauth_state = result.scalar_one_or_none()
+    consumed = result.scalar_one_or_none()
+    await db.commit()
 
-    if not oauth_state:
-        raise ValidationException("Invalid state parameter - possible CSRF attack")
+    if consumed is None:
+        raise ValidationException(
+            "Invalid, expired or already used state parameter - possible CSRF attack"
+        )
 
-    if oauth_state.used:
-        raise ValidationException("State token already used - possible replay attack")
+    logger.info(f"Validated OAuth state token for {provider}")
 
-    if oauth_state.expires_at < datetime.utcnow():
-        raise ValidationException("State token expired")
 
-    # Mark as used
-    oauth_state.used = True
+async def cleanup_expired_oauth_states(db: AsyncSession) -> int:
+    """
+    Delete used and expired OAuth state tokens.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Number of deleted state tokens
+    """
+    stmt = delete(OAuthState).where(
+        or_(OAuthState.used.is_(True), OAuthState.expires_at < datetime.utcnow())
+    )
+    result = await db.execute(stmt)
     await db.commit()
 
-    logger.info(f"Validated OAuth state token for {provider}")
+    if result.rowcount:
+        logger.info(f"Removed {result.rowcount} used or expired OAuth state tokens")
+
+    return result.rowcount
+
+
+@lru_cache(maxsize=None)
+def _google_auth_url_prefix() -> str:
+    """Authorization URL with every query parameter except state (built once)."""
+    params = {
+        "client_id": settings.oauth.GOOGLE_CLIENT_ID,
+        "redirect_uri": settings.oauth.OAUTH_REDIRECT_URI,
+        "response_type": "code",
+        "scope": " ".join(GOOGLE_CONFIG["scopes"]),
+        "access_type": "offline",
+        "prompt": "consent",
+    }
+    return f"{GOOGLE_CONFIG['authorize_url']}?{urlencode(params)}"
+
+
+@lru_cache(maxsize=None)
+def _github_auth_url_prefix() -> str:
+    """Authorization URL with every query parameter except state (built once)."""
+    params = {
+        "client_id": settings.oauth.GITHUB_CLIENT_ID,
+        "redirect_uri": settings.oauth.OAUTH_REDIRECT_URI,
+        "scope": " ".join(GITHUB_CONFIG["scopes"]),
+    }
+    return f"{GITHUB_CONFIG['authorize_url']}?{urlencode(params)}"
 
 
 def get_google_auth_url(state: str) -> str:
@@ -123,20 +201,10 @@ def get_google_auth_url(state: str) -> str:
     Returns:
         Authorization URL
     """
-    if not settings.GOOGLE_CLIENT_ID:
+    if not settings.oauth.GOOGLE_CLIENT_ID:
         raise ValidationException("Google OAuth not configured")
 
-    params = {
-        "client_id": settings.GOOGLE_CLIENT_ID,
-        "redirect_uri": settings.OAUTH_REDIRECT_URI,
-        "response_type": "code",
-        "scope": " ".join(GOOGLE_CONFIG["scopes"]),
-        "state": state,
-        "access_type": "offline",
-        "prompt": "consent",
-    }
-
-    return f"{GOOGLE_CONFIG['authorize_url']}?{urlencode(params)}"
+    return f"{_google_auth_url_prefix()}&state={quote_plus(state)}"
 
 
 def get_github_auth_url(state: str) -> str:
@@ -149,17 +217,10 @@ def get_github_auth_url(state: str) -> str:
     Returns:
         Authorization URL
     """
-    if not settings.GITHUB_CLIENT_ID:
+    if not settings.oauth.GITHUB_CLIENT_ID:
         raise ValidationException("GitHub OAuth not configured")
 
-    params = {
-        "client_id": settings.GITHUB_CLIENT_ID,
-        "redirect_uri": settings.OAUTH_REDIRECT_URI,
-        "scope": " ".join(GITHUB_CONFIG["scopes"]),
-        "state": state,
-    }
-
-    return f"{GITHUB_CONFIG['authorize_url']}?{urlencode(params)}"
+    return f"{_github_auth_url_prefix()}&state={quote_plus(state)}"
 
 
 async def handle_google_callback(
@@ -184,34 +245,36 @@ async def handle_google_callback(
     # Validate state token for CSRF protection
     await validate_oauth_state(db=db, state=state, provider='google')
 
-    if not settings.GOOGLE_CLIENT_ID or not settings.GOOGLE_CLIENT_SECRET:
+    if not settings.oauth.GOOGLE_CLIENT_ID or not settings.oauth.GOOGLE_CLIENT_SECRET:
         raise ValidationException("Google OAuth not configured")
 
     try:
-        # Exchange code for access token
-        async with httpx.AsyncClient() as client:
-            oauth_client = AsyncOAuth2Client(
-                client_id=settings.GOOGLE_CLIENT_ID,
-                client_secret=settings.GOOGLE_CLIENT_SECRET,
-                redirect_uri=settings.OAUTH_REDIRECT_URI,
-            )
-
-            token_response = await oauth_client.fetch_token(
-                url=GOOGLE_CONFIG["token_url"],
-                code=code,
-                grant_type="authorization_code",
-            )
-
-            # Get user info
-            access_token = token_response.get("access_token")
-            headers = {"Authorization": f"Bearer {access_token}"}
+        client = get_http_client()
 
-            userinfo_response = await client.get(
-                GOOGLE_CONFIG["userinfo_url"],
-                headers=headers,
-            )
-            userinfo_response.raise_for_status()
-            userinfo = userinfo_response.json()
+        # Exchange code for access token
+        token_response = await client.post(
+            GOOGLE_CONFIG["token_url"],
+            data={
+                "client_id": settings.oauth.GOOGLE_CLIENT_ID,
+                "client_secret": settings.oauth.GOOGLE_CLIENT_SECRET,
+                "code": code,
+                "grant_type": "authorization_code",
+                "redirect_uri": settings.oauth.OAUTH_REDIRECT_URI,
+            },
+            headers={"Accept": "application/json"},
+        )
+        token_response.raise_for_status()
+
+        # Get user info
+        access_token = token_response.json().get("access_token")
+        headers = {"Authorization": f"Bearer {access_token}"}
+
+        userinfo_response = await client.get(
+            GOOGLE_CONFIG["userinfo_url"],
+            headers=headers,
+        )
+        userinfo_response.raise_for_status()
+        userinfo = userinfo_response.json()
 
     except Exception as e:
         logger.error(f"Google OAuth error: {e}")
@@ -264,57 +327,58 @@ async def handle_github_callback(
     # Validate state token for CSRF protection
     await validate_oauth_state(db=db, state=state, provider='github')
 
-    if not settings.GITHUB_CLIENT_ID or not settings.GITHUB_CLIENT_SECRET:
+    if not settings.oauth.GITHUB_CLIENT_ID or not settings.oauth.GITHUB_CLIENT_SECRET:
         raise ValidationException("GitHub OAuth not configured")
 
     try:
-        # Exchange code for access token
-        async with httpx.AsyncClient() as client:
-            token_response = await client.post(
-                GITHUB_CONFIG["token_url"],
-                data={
-                    "client_id": settings.GITHUB_CLIENT_ID,
-                    "client_secret": settings.GITHUB_CLIENT_SECRET,
-                    "code": code,
-                    "redirect_uri": settings.OAUTH_REDIRECT_URI,
-                },
-                headers={"Accept": "application/json"},
-            )
-            token_response.raise_for_status()
-            token_data = token_response.json()
-
-            access_token = token_data.get("access_token")
-            if not access_token:
-                raise ValidationException("Failed to get access token from GitHub")
+        client = get_http_client()
 
-            # Get user info
-            headers = {
-                "Authorization": f"Bearer {access_token}",
-                "Accept": "application/json",
-            }
-
-            userinfo_response = await client.get(
-                GITHUB_CONFIG["userinfo_url"],
+        # Exchange code for access token
+        token_response = await client.post(
+            GITHUB_CONFIG["token_url"],
+            data={
+                "client_id": settings.oauth.GITHUB_CLIENT_ID,
+                "client_secret": settings.oauth.GITHUB_CLIENT_SECRET,
+                "code": code,
+                "redirect_uri": settings.oauth.OAUTH_REDIRECT_URI,
+            },
+            headers={"Accept": "application/json"},
+        )
+        token_response.raise_for_status()
+        token_data = token_response.json()
+
+        access_token = token_data.get("access_token")
+        if not access_token:
+            raise ValidationException("Failed to get access token from GitHub")
+
+        # Get user info
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Accept": "application/json",
+        }
+
+        userinfo_response = await client.get(
+            GITHUB_CONFIG["userinfo_url"],
+            headers=headers,
+        )
+        userinfo_response.raise_for_status()
+        userinfo = userinfo_response.json()
+
+        # Get primary email (GitHub may not return email in profile)
+        email = userinfo.get("email")
+        if not email:
+            emails_response = await client.get(
+                "https://api.github.com/user/emails",
                 headers=headers,
             )
-            userinfo_response.raise_for_status()
-            userinfo = userinfo_response.json()
-
-            # Get primary email (GitHub may not return email in profile)
-            email = userinfo.get("email")
-            if not email:
-                emails_response = await client.get(
-                    "https://api.github.com/user/emails",
-                    headers=headers,
-                )
-                emails_response.raise_for_status()
-                emails = emails_response.json()
-
-                # Find primary verified email
-                for email_obj in emails:
-                    if email_obj.get("primary") and email_obj.get("verified"):
-                        email = email_obj.get("email")
-                        break
+            emails_response.raise_for_status()
+            emails = emails_response.json()
+
+            # Find primary verified email
+            for email_obj in emails:
+                if email_obj.get("primary") and email_obj.get("verified"):
+                    email = email_obj.get("email")
+                    break
 
     except Exception as e:
         logger.error(f"GitHub OAuth error: {e}")
@@ -405,8 +469,8 @@ async def _find_or_create_oauth_user(
     )
 
     db.add(user)
+    # Timestamps come back with the INSERT (eager_defaults); no refresh needed
     await db.commit()
-    await db.refresh(user)
 
     logger.info(f"Created new user via {provider}: {user.email}")
 
@@ -428,11 +492,11 @@ async def _generate_tokens_for_user(
         Tuple of (access_token, refresh_token)
     """
     # Generate tokens
-    access_token = create_access_token(data={"sub": str(user.id), "role": user.role})
+    access_token = create_access_token(data=access_token_claims(user))
     refresh_token_str = create_refresh_token(data={"sub": str(user.id)})
 
     # Store refresh token in database
-    expires_at = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    expires_at = datetime.utcnow() + REFRESH_TOKEN_TTL
 
     refresh_token = RefreshToken(
         token=hash_token(refresh_token_str),
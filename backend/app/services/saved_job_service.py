@@ -3,10 +3,13 @@
 Saved job service for managing user's saved/bookmarked jobs.
 """
 import logging
-from typing import List, Optional
-from sqlalchemy import select, and_
+from typing import List, Optional, Set
+from sqlalchemy import select, and_, exists
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, raiseload
 
 from app.models.saved_job import SavedJob
 from app.models.job import Job
@@ -37,16 +40,22 @@ class SavedJobService:
         Returns:
             List of saved jobs with job details
         """
+        # Job and company are required many-to-ones, so both are inner-joined
+        # into the one query and no row de-duplication is needed
         stmt = (
             select(SavedJob)
-            .options(joinedload(SavedJob.job).joinedload(Job.company))
+            .options(
+                joinedload(SavedJob.job, innerjoin=True)
+                .joinedload(Job.company, innerjoin=True),
+                raiseload("*")
+            )
             .where(SavedJob.user_id == user_id)
             .order_by(SavedJob.saved_at.desc())
             .offset(skip)
             .limit(limit)
         )
         result = await db.execute(stmt)
-        return list(result.scalars().unique().all())
+        return list(result.scalars().all())
 
     @staticmethod
     async def is_job_saved(
@@ -65,14 +74,44 @@ class SavedJobService:
         Returns:
             True if job is saved, False otherwise
         """
-        stmt = select(SavedJob).where(
+        stmt = select(
+            exists().where(
+                and_(
+                    SavedJob.user_id == user_id,
+                    SavedJob.job_id == job_id
+                )
+            )
+        )
+        result = await db.execute(stmt)
+        return bool(result.scalar())
+
+    @staticmethod
+    async def get_saved_job_ids(
+        db: AsyncSession,
+        user_id: int,
+        job_ids: List[int]
+    ) -> Set[int]:
+        """
+        Check which of several jobs are saved by a user, in one query.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            job_ids: Job IDs to check
+
+        Returns:
+            The subset of job_ids the user has saved
+        """
+        if not job_ids:
+            return set()
+        stmt = select(SavedJob.job_id).where(
             and_(
                 SavedJob.user_id == user_id,
-                SavedJob.job_id == job_id
+                SavedJob.job_id.in_(job_ids)
             )
         )
         result = await db.execute(stmt)
-        return result.scalar_one_or_none() is not None
+        return set(result.scalars().all())
 
     @staticmethod
     async def save_job(
@@ -95,26 +134,37 @@ class SavedJobService:
             NotFoundException: If job not found
             ConflictException: If job already saved
         """
-        # Check if job exists
-        job_stmt = select(Job).where(Job.id == job_id)
-        job_result = await db.execute(job_stmt)
-        job = job_result.scalar_one_or_none()
-        if not job:
+        # One statement: the primary key turns a duplicate into a no-op and
+        # the foreign key rejects a missing job, with no check-then-insert race
+        insert = pg_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+        stmt = (
+            insert(SavedJob)
+            .values(user_id=user_id, job_id=job_id)
+            .on_conflict_do_nothing(index_elements=["user_id", "job_id"])
+            .returning(SavedJob.job_id)
+        )
+        try:
+            inserted = (await db.execute(stmt)).scalar_one_or_none()
+        except IntegrityError:
+            await db.rollback()
             raise NotFoundException("Job", job_id)
 
-        # Check if already saved
-        is_saved = await SavedJobService.is_job_saved(db, user_id, job_id)
-        if is_saved:
+        if inserted is None:
+            await db.rollback()
             raise ConflictException(f"Job {job_id} is already saved")
 
-        # Create saved job
-        saved_job = SavedJob(user_id=user_id, job_id=job_id)
-        db.add(saved_job)
-        await db.flush()
+        await db.commit()
 
-        # Reload with job details
-        await db.refresh(saved_job, ["job"])
-        await db.refresh(saved_job.job, ["company"])
+        # Load with job details
+        result = await db.execute(
+            select(SavedJob)
+            .where(SavedJob.user_id == user_id, SavedJob.job_id == job_id)
+            .options(
+                joinedload(SavedJob.job, innerjoin=True)
+                .joinedload(Job.company, innerjoin=True)
+            )
+        )
+        saved_job = result.scalar_one()
 
         logger.info(f"User {user_id} saved job {job_id}")
         return saved_job
@@ -149,7 +199,7 @@ class SavedJobService:
             return False
 
         await db.delete(saved_job)
-        await db.flush()
+        await db.commit()
 
         logger.info(f"User {user_id} unsaved job {job_id}")
         return True
@@ -3,6 +3,7 @@
 User service for profile management operations.
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Optional
@@ -152,11 +153,11 @@ async def change_password(
     if not user.hashed_password:
         raise ValidationException("Cannot change password for OAuth users")
 
-    if not verify_password(current_password, user.hashed_password):
+    if not await asyncio.to_thread(verify_password, current_password, user.hashed_password):
         raise ValidationException("Current password is incorrect")
 
     # Update password
-    user.hashed_password = hash_password(new_password)
+    user.hashed_password = await asyncio.to_thread(hash_password, new_password)
 
     await db.commit()
     await db.refresh(user)
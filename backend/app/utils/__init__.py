@@ -3,7 +3,7 @@
 Utilities package.
 """
 
-from app.utils.exceptions import NotFoundException, ValidationException
+from app.utils.exceptions import ForbiddenException, NotFoundException, ValidationException
 from app.utils.security import (
     hash_password,
     verify_password,
@@ -15,9 +15,12 @@ from app.utils.security import (
     verify_token_hash,
 )
 from app.utils.rate_limit import limiter
+from app.utils.cache import TTLCache
 from app.utils.dependencies import (
     get_current_user,
     get_current_active_user,
+    get_active_user_profile,
+    get_read_user_profile,
     get_optional_user,
     require_role,
     oauth2_scheme,
@@ -27,6 +30,7 @@ __all__ = [
     # Exceptions
     "NotFoundException",
     "ValidationException",
+    "ForbiddenException",
     # Security
     "hash_password",
     "verify_password",
@@ -38,9 +42,13 @@ __all__ = [
     "verify_token_hash",
     # Rate limiting
     "limiter",
+    # Caching
+    "TTLCache",
     # Dependencies
     "get_current_user",
     "get_current_active_user",
+    "get_active_user_profile",
+    "get_read_user_profile",
     "get_optional_user",
     "require_role",
     "oauth2_scheme",
@@ -0,0 +1,58 @@
+# app/utils/cache.py
+"""
+Small in-process caches for hot, short-lived lookups.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries expire after a fixed time-to-live.
+
+    Not shared between worker processes; use it only for data where a
+    briefly stale answer is acceptable.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store value under key, evicting the least recently used entry if full.
+
+        ttl overrides the cache-wide time-to-live for this entry only.
+        """
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Drop key from the cache if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
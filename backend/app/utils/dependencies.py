@@ -6,10 +6,12 @@ FastAPI dependency injection utilities for authentication and authorization.
 from typing import List, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models.user import User, UserRole
+from app.schemas.user import UserResponse
 from app.utils.security import decode_token
 
 # OAuth2 scheme for token authentication
@@ -19,19 +21,16 @@ oauth2_scheme = OAuth2PasswordBearer(
 )
 
 
-async def get_current_user(
-    token: Optional[str] = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db)
-) -> Optional[User]:
+async def _user_from_token(token: Optional[str], db: AsyncSession) -> Optional[User]:
     """
-    Get the current authenticated user from JWT token.
+    Load the user an access token belongs to.
 
     Args:
-        token: JWT access token from Authorization header
-        db: Database session
+        token: JWT access token, or None if none was sent
+        db: Database session to load the user with
 
     Returns:
-        User object if authenticated, None otherwise
+        User object if a token was sent, None otherwise
 
     Raises:
         HTTPException: If token is invalid or user not found
@@ -66,7 +65,6 @@ async def get_current_user(
         )
 
     # Fetch user from database
-    from sqlalchemy import select
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
 
@@ -80,20 +78,18 @@ async def get_current_user(
     return user
 
 
-async def get_current_active_user(
-    current_user: Optional[User] = Depends(get_current_user)
-) -> User:
+def _require_active(current_user: Optional[User]) -> User:
     """
-    Get the current active and verified user.
+    Refuse anonymous and inactive users.
 
     Args:
-        current_user: Current user from get_current_user dependency
+        current_user: User loaded from the token, or None
 
     Returns:
-        User object if active and verified
+        The same user if active
 
     Raises:
-        HTTPException: If user is not authenticated, inactive, or not verified
+        HTTPException: If user is not authenticated or inactive
     """
     if current_user is None:
         raise HTTPException(
@@ -118,14 +114,101 @@ async def get_current_active_user(
     return current_user
 
 
+async def get_current_user(
+    token: Optional[str] = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db)
+) -> Optional[User]:
+    """
+    Get the current authenticated user from JWT token.
+
+    Args:
+        token: JWT access token from Authorization header
+        db: Database session
+
+    Returns:
+        User object if authenticated, None otherwise
+
+    Raises:
+        HTTPException: If token is invalid or user not found
+    """
+    return await _user_from_token(token, db)
+
+
+async def get_current_active_user(
+    current_user: Optional[User] = Depends(get_current_user)
+) -> User:
+    """
+    Get the current active and verified user.
+
+    Args:
+        current_user: Current user from get_current_user dependency
+
+    Returns:
+        User object if active and verified
+
+    Raises:
+        HTTPException: If user is not authenticated, inactive, or not verified
+    """
+    return _require_active(current_user)
+
+
+async def get_active_user_profile(
+    current_user: User = Depends(get_current_active_user)
+) -> UserResponse:
+    """
+    Get the current active user's profile.
+
+    The user is loaded from the database on every request (one primary-key
+    read), so role and is_active are always current: a deactivated or
+    demoted user loses access immediately, not when their token expires.
+
+    Args:
+        current_user: Current active user from get_current_active_user
+
+    Returns:
+        UserResponse of the current user
+    """
+    return UserResponse.from_user(current_user)
+
+
+async def get_read_user_profile(
+    token: Optional[str] = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_read_db)
+) -> UserResponse:
+    """
+    Get the current active user's profile for read-only endpoints.
+
+    Same checks as get_active_user_profile, but the user is loaded through
+    get_read_db. FastAPI shares that session with a route that depends on
+    get_read_db too, so a read request uses one read-pool connection instead
+    of also taking one from the primary pool. With a replica configured,
+    a deactivation reaches these endpoints once it has replicated.
+
+    Args:
+        token: JWT access token from Authorization header
+        db: Read-only database session
+
+    Returns:
+        UserResponse of the current user
+
+    Raises:
+        HTTPException: If not authenticated, token invalid, or user inactive
+    """
+    user = _require_active(await _user_from_token(token, db))
+    return UserResponse.from_user(user)
+
+
 def require_role(allowed_roles: List[UserRole]):
     """
     Factory function to create a dependency that checks user role.
 
+    The role is read from the database with the user, so a role change
+    takes effect on the next request.
+
     Usage:
         @router.post("/admin-only")
         async def admin_endpoint(
-            user: User = Depends(require_role([UserRole.ADMIN]))
+            user: UserResponse = Depends(require_role([UserRole.ADMIN]))
         ):
             ...
 
@@ -136,8 +219,8 @@ def require_role(allowed_roles: List[UserRole]):
         Dependency function that validates user role
     """
     async def role_checker(
-        current_user: User = Depends(get_current_active_user)
-    ) -> User:
+        current_user: UserResponse = Depends(get_active_user_profile)
+    ) -> UserResponse:
         """
         Check if current user has one of the allowed roles.
 
@@ -145,7 +228,7 @@ def require_role(allowed_roles: List[UserRole]):
             current_user: Current active user
 
         Returns:
-            User object if authorized
+            Current user's profile if authorized
 
         Raises:
             HTTPException: If user doesn't have required role
@@ -32,6 +32,19 @@ class ValidationException(HTTPException):
         )
 
 
+class ForbiddenException(HTTPException):
+    """
+    Exception raised when the user may not act on an existing resource.
+    Returns 403 status code.
+    """
+
+    def __init__(self, detail: str):
+        super().__init__(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=detail
+        )
+
+
 class ConflictException(HTTPException):
     """
     Exception raised when a resource conflict occurs (e.g. duplicate entry).
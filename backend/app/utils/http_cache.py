@@ -0,0 +1,84 @@
+# app/utils/http_cache.py
+"""
+HTTP caching helpers (ETag / Cache-Control / 304 Not Modified).
+"""
+
+import hashlib
+
+from fastapi import Request, Response, status
+
+# For data that only changes with a deploy
+STATIC_CACHE_CONTROL = "public, max-age=86400"
+
+# For data that can change at any time: cache, but revalidate via ETag
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+def make_etag(data: bytes) -> str:
+    """
+    Build a strong ETag from bytes (a response body or a version key).
+
+    Args:
+        data: Bytes identifying the representation
+
+    Returns:
+        Quoted ETag value
+    """
+    return f'"{hashlib.blake2b(data, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the client's If-None-Match already covers etag.
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client's cached copy is still current
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in header.split(",")
+    )
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    """Build a bodyless 304 response carrying the validators."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": cache_control}
+    )
+
+
+def cached_json_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    cache_control: str
+) -> Response:
+    """
+    Return pre-encoded JSON with caching headers, or 304 if unchanged.
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        body: Encoded JSON body
+        etag: ETag of body
+        cache_control: Cache-Control header value
+
+    Returns:
+        200 response with body, or 304 without it
+    """
+    if etag_matches(request, etag):
+        return not_modified(etag, cache_control)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": cache_control}
+    )
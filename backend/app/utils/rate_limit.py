@@ -3,17 +3,48 @@
 Rate limiting configuration using SlowAPI.
 """
 
+from fastapi import Request
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
 from app.config import settings
+from app.utils.security import decode_token
+
+
+def rate_limit_key(request: Request) -> str:
+    """
+    Key rate limits by user for authenticated requests, by IP otherwise.
+
+    Users behind a shared address (office NAT, mobile carrier) then get their
+    own budget. Decoding is cheap: validated tokens are cached.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        "user:<id>" for a valid access token, the client address otherwise
+    """
+    authorization = request.headers.get("authorization")
+    if authorization and authorization[:7].lower() == "bearer ":
+        payload = decode_token(authorization[7:])
+        if payload and payload.get("type") == "access" and payload.get("sub"):
+            return f"user:{payload['sub']}"
+    return get_remote_address(request)
+
 
 # Initialize rate limiter
-# For production, use Redis: storage_uri="redis://localhost:6379"
+# Counters live in RATE_LIMIT_STORAGE_URI; with Redis they are shared by all
+# workers. If Redis is unreachable, limits fall back to per-process memory
+# instead of failing requests.
+# The default moving window admits at most N requests in any trailing period,
+# so a client cannot burst 2N across a fixed-window boundary and is not locked
+# out until the next boundary either. On Redis each check is one atomic Lua
+# script.
 limiter = Limiter(
-    key_func=get_remote_address,
+    key_func=rate_limit_key,
     enabled=settings.RATE_LIMIT_ENABLED,
     storage_uri=settings.RATE_LIMIT_STORAGE_URI,
-    strategy="fixed-window",
+    strategy=settings.RATE_LIMIT_STRATEGY,
+    in_memory_fallback_enabled=True,
     headers_enabled=True,  # Add rate limit headers to responses
 )
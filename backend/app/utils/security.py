@@ -3,7 +3,10 @@
 Security utilities for password hashing and JWT token management.
 """
 
+import hashlib
+import hmac
 import secrets
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 
@@ -11,10 +14,20 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.config import settings
+from app.utils.cache import TTLCache
+
+# Token lifetimes, computed once from settings
+ACCESS_TOKEN_TTL = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+REFRESH_TOKEN_TTL = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+REFRESH_TOKEN_REMEMBER_ME_TTL = timedelta(days=settings.REFRESH_TOKEN_REMEMBER_ME_EXPIRE_DAYS)
 
 # Password hashing context using bcrypt
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Decoded payloads of recently validated tokens, keyed by a digest of the
+# raw token. Entries never outlive the token's own exp claim.
+_decoded_token_cache = TTLCache(maxsize=10_000, ttl=3600)
+
 
 def hash_password(password: str) -> str:
     """
@@ -55,15 +68,11 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
         Encoded JWT token string
     """
     to_encode = data.copy()
-
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    now = datetime.utcnow()
 
     to_encode.update({
-        "exp": expire,
-        "iat": datetime.utcnow(),
+        "exp": now + (expires_delta or ACCESS_TOKEN_TTL),
+        "iat": now,
         "type": "access"
     })
 
@@ -88,16 +97,13 @@ def create_refresh_token(data: Dict[str, Any], remember_me: bool = False) -> str
         Encoded JWT token string
     """
     to_encode = data.copy()
-
-    if remember_me:
-        expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_REMEMBER_ME_EXPIRE_DAYS)
-    else:
-        expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    now = datetime.utcnow()
 
     to_encode.update({
-        "exp": expire,
-        "iat": datetime.utcnow(),
-        "type": "refresh"
+        "exp": now + (REFRESH_TOKEN_REMEMBER_ME_TTL if remember_me else REFRESH_TOKEN_TTL),
+        "iat": now,
+        "type": "refresh",
+        "jti": secrets.token_urlsafe(16)  # Unique even when issued in the same second
     })
 
     encoded_jwt = jwt.encode(
@@ -113,22 +119,35 @@ def decode_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Decode and validate a JWT token.
 
+    Valid tokens are cached until they expire (at most an hour), so the
+    signature is verified once per token rather than once per request.
+    Invalid tokens are never cached.
+
     Args:
         token: JWT token string to decode
 
     Returns:
         Dictionary of claims if token is valid, None otherwise
     """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    payload = _decoded_token_cache.get(key)
+    if payload is not None:
+        return dict(payload)
+
     try:
         payload = jwt.decode(
             token,
             settings.JWT_SECRET_KEY,
             algorithms=[settings.JWT_ALGORITHM]
         )
-        return payload
     except JWTError:
         return None
 
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        _decoded_token_cache.set(key, payload, ttl=min(exp - time.time(), 3600))
+    return dict(payload)
+
 
 def generate_random_token(length: int = 32) -> str:
     """
@@ -150,14 +169,18 @@ def hash_token(token: str) -> str:
     Hash a token for secure storage.
 
     Used for refresh tokens to prevent them from being reused if stolen.
+    The digest is a keyed HMAC-SHA256, so it is deterministic: a token is
+    found with one indexed equality lookup instead of verifying it against
+    every stored hash. Refresh tokens are long random-looking JWTs, so a
+    slow password hash adds nothing here.
 
     Args:
         token: Token string to hash
 
     Returns:
-        Hashed token string
+        Hex digest (64 characters)
     """
-    return pwd_context.hash(token)
+    return hmac.new(settings.SECRET_KEY.encode(), token.encode(), hashlib.sha256).hexdigest()
 
 
 def verify_token_hash(token: str, hashed_token: str) -> bool:
@@ -171,4 +194,4 @@ def verify_token_hash(token: str, hashed_token: str) -> bool:
     Returns:
         True if token matches hash, False otherwise
     """
-    return pwd_context.verify(token, hashed_token)
+    return hmac.compare_digest(hash_token(token), hashed_token)
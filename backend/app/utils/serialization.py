@@ -0,0 +1,36 @@
+# app/utils/serialization.py
+"""
+Helpers for encoding ORM results to JSON response bodies.
+"""
+
+import asyncio
+from typing import Any, Sequence
+
+from pydantic import TypeAdapter
+
+# Lists at least this long are encoded in a worker thread; below it the
+# thread hop costs more than the event loop time it frees
+OFFLOAD_THRESHOLD = 32
+
+
+async def dump_json_list(adapter: TypeAdapter, items: Sequence[Any]) -> bytes:
+    """
+    Validate ORM objects through a list TypeAdapter and encode them to JSON.
+
+    Large lists are handed to a worker thread so the event loop keeps serving
+    other requests meanwhile. All attributes the schema reads must already be
+    loaded; nothing may lazy-load from the thread.
+
+    Args:
+        adapter: TypeAdapter for a list of response models
+        items: ORM objects to encode
+
+    Returns:
+        bytes: Encoded JSON array
+    """
+    def dump() -> bytes:
+        return adapter.dump_json(adapter.validate_python(items, from_attributes=True))
+
+    if len(items) < OFFLOAD_THRESHOLD:
+        return dump()
+    return await asyncio.to_thread(dump)
@@ -0,0 +1,74 @@
+# app/utils/streaming.py
+"""
+Helpers for streaming large JSON list responses.
+"""
+
+from contextlib import AsyncExitStack
+from typing import Any, AsyncIterator, Callable
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.background import BackgroundTask
+from starlette.responses import StreamingResponse
+
+_END = object()
+
+
+async def stream_json_response(
+    session_factory: async_sessionmaker,
+    query: Callable[[AsyncSession], AsyncIterator[Any]],
+    schema: type[BaseModel]
+) -> StreamingResponse:
+    """
+    Stream query results as a JSON array response, one element per chunk.
+
+    Request-scoped sessions are closed before the body is sent, so the stream
+    opens its own session from session_factory and keeps it until the body is
+    done. The query is started and its first row encoded before the response
+    is returned: a query that fails up front becomes an error status rather
+    than a 200 with a truncated body. A failure after that propagates out of
+    the body so the server aborts the connection instead of sending an array
+    that merely looks complete.
+
+    Each item is validated against the response schema and encoded on its own
+    with the same serializer as the buffered list endpoints, so the body is
+    byte-identical to theirs while only the current row is held in memory.
+
+    Args:
+        session_factory: Session maker for the stream's own session
+        query: Called with that session; returns an async iterator of ORM
+            objects (or anything the schema accepts)
+        schema: Pydantic model used to validate and shape each item
+
+    Returns:
+        StreamingResponse: "[", encoded items separated by ",", then "]"
+    """
+    def encode(item: Any) -> bytes:
+        return schema.model_validate(item, from_attributes=True).model_dump_json().encode()
+
+    stack = AsyncExitStack()
+    try:
+        db = await stack.enter_async_context(session_factory())
+        items = query(db)
+        first = await anext(items, _END)
+        head = b"[]" if first is _END else b"[" + encode(first)
+    except BaseException:
+        await stack.aclose()
+        raise
+
+    async def body() -> AsyncIterator[bytes]:
+        async with stack:
+            yield head
+            if first is _END:
+                return
+            async for item in items:
+                yield b"," + encode(item)
+            yield b"]"
+
+    # Closing again after the body finished is a no-op; the background task
+    # only matters when the client disconnects before the body is exhausted
+    return StreamingResponse(
+        body(),
+        media_type="application/json",
+        background=BackgroundTask(stack.aclose)
+    )
@@ -0,0 +1,123 @@
+"""
+Shared fixtures for API tests.
+
+Points the app at a throwaway SQLite database before any app module is
+imported, and gives every API test an empty schema and cold in-process
+caches.
+"""
+
+import itertools
+import os
+import tempfile
+
+import pytest
+
+_TEST_DB_DIR = tempfile.mkdtemp(prefix="job-board-tests-")
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{_TEST_DB_DIR}/test.db")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("JWT_SECRET_KEY", "test-jwt-secret-key")
+
+
+def _clear_caches() -> None:
+    """Drop cached responses and lookups left over from earlier tests."""
+    from app.routes import jobs as jobs_routes
+    from app.services import application_service, hh_client
+    from app.utils import security
+
+    for cache in (
+        jobs_routes._jobs_page_cache,
+        jobs_routes._job_detail_cache,
+        application_service._auth_context_cache,
+        hh_client._search_cache,
+        hh_client._vacancy_cache,
+        security._decoded_token_cache,
+    ):
+        cache.clear()
+
+
+async def _reset_schema() -> None:
+    """Recreate all tables so every test starts from an empty database."""
+    from app.database import Base, engine
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+
+@pytest.fixture
+def client():
+    """TestClient for the app, running its lifespan on an empty database."""
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    _clear_caches()
+    with TestClient(app) as test_client:
+        test_client.portal.call(_reset_schema)
+        yield test_client
+    _clear_caches()
+
+
+@pytest.fixture
+def create_user(client):
+    """
+    Factory creating a verified, active user directly in the database.
+
+    Returns a function taking email and role and returning
+    (user_id, auth headers with a fresh access token).
+    """
+    from app.database import AsyncSessionLocal
+    from app.models.user import User, UserRole
+    from app.services.auth_service import access_token_claims
+    from app.utils.security import create_access_token, hash_password
+
+    password_hash = hash_password("Passw0rdX")
+
+    async def insert(email: str, role: UserRole) -> User:
+        async with AsyncSessionLocal() as db:
+            user = User(
+                email=email,
+                full_name=email.split("@")[0],
+                hashed_password=password_hash,
+                role=role,
+                is_active=True,
+                is_verified=True,
+            )
+            db.add(user)
+            await db.commit()
+            return user
+
+    def factory(email: str, role: UserRole = UserRole.REGULAR_USER):
+        user = client.portal.call(insert, email, role)
+        token = create_access_token(data=access_token_claims(user))
+        return user.id, {"Authorization": f"Bearer {token}"}
+
+    return factory
+
+
+@pytest.fixture
+def create_job(client):
+    """
+    Factory posting a job (and a company for it) as the given employer.
+
+    Takes the employer's auth headers and optional job fields; returns the
+    created job as JSON.
+    """
+    company_numbers = itertools.count(1)
+
+    def factory(headers: dict, **fields) -> dict:
+        company = {"name": f"Company {next(company_numbers)}"}
+        response = client.post("/api/companies", json=company, headers=headers)
+        assert response.status_code == 201
+        payload = {
+            "title": "Python developer",
+            "description": "Build APIs",
+            "location": "Almaty",
+            "level": "senior",
+            "company_id": response.json()["id"],
+            **fields,
+        }
+        response = client.post("/api/jobs", json=payload, headers=headers)
+        assert response.status_code == 201
+        return response.json()
+
+    return factory
@@ -0,0 +1,53 @@
+"""
+Test submitting and withdrawing job applications.
+
+This test verifies that:
+1. Applying twice to the same job returns 409
+2. Applying to a missing job returns 404
+3. Only the applicant can withdraw an application
+"""
+
+from app.models.user import UserRole
+
+
+class TestApplications:
+    """Test suite for POST /applications and /applications/{id}/withdraw."""
+
+    def test_duplicate_application_conflicts(self, client, create_user, create_job):
+        """Test that a second application to the same job gets 409."""
+        _, employer = create_user("employer@example.com", UserRole.EMPLOYER)
+        _, seeker = create_user("seeker@example.com")
+        job = create_job(employer)
+
+        first = client.post("/api/applications", json={"job_id": job["id"]}, headers=seeker)
+        second = client.post("/api/applications", json={"job_id": job["id"]}, headers=seeker)
+
+        assert first.status_code == 201
+        assert first.json()["job"]["id"] == job["id"]
+        assert second.status_code == 409
+        assert len(client.get("/api/applications/me", headers=seeker).json()) == 1
+
+    def test_apply_to_missing_job(self, client, create_user):
+        """Test that applying to a job that doesn't exist gets 404, not 409."""
+        _, seeker = create_user("seeker@example.com")
+
+        response = client.post("/api/applications", json={"job_id": 999}, headers=seeker)
+
+        assert response.status_code == 404
+
+    def test_withdraw_own_application_only(self, client, create_user, create_job):
+        """Test that another user can't withdraw an application."""
+        _, employer = create_user("employer@example.com", UserRole.EMPLOYER)
+        _, seeker = create_user("seeker@example.com")
+        _, other = create_user("other@example.com")
+        job = create_job(employer)
+        application = client.post(
+            "/api/applications", json={"job_id": job["id"]}, headers=seeker
+        ).json()
+        url = f"/api/applications/{application['id']}/withdraw"
+
+        assert client.post(url, headers=other).status_code == 404
+
+        response = client.post(url, headers=seeker)
+        assert response.status_code == 200
+        assert response.json()["status"] == "withdrawn"
@@ -0,0 +1,56 @@
+"""
+Test the current user's profile endpoint.
+
+This test verifies that:
+1. GET /auth/me reflects profile changes made after the token was issued
+2. Access tokens only carry the user ID and role
+"""
+
+from jose import jwt
+
+from app.config import settings
+
+
+class TestCurrentUserProfile:
+    """Test suite for /api/auth/me."""
+
+    def test_me_reflects_profile_update(self, client, create_user):
+        """Test that a profile update shows up with the same access token."""
+        _, headers = create_user("alice@example.com")
+
+        response = client.put("/api/auth/me", json={"full_name": "New Name"}, headers=headers)
+        assert response.status_code == 200
+        assert response.json()["full_name"] == "New Name"
+
+        response = client.get("/api/auth/me", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["full_name"] == "New Name"
+
+    def test_access_token_has_no_profile_claims(self, client):
+        """Test that login issues a token without profile data."""
+        from app.database import AsyncSessionLocal
+        from app.models.email_verification_token import EmailVerificationToken
+        from sqlalchemy import select
+
+        client.post(
+            "/api/auth/register",
+            json={"email": "bob@example.com", "password": "Passw0rdX", "full_name": "Bob"},
+        )
+
+        async def verification_token() -> str:
+            async with AsyncSessionLocal() as db:
+                return await db.scalar(select(EmailVerificationToken.token))
+
+        token = client.portal.call(verification_token)
+        assert client.post("/api/auth/verify-email", json={"token": token}).status_code == 200
+
+        response = client.post(
+            "/api/auth/login", json={"email": "bob@example.com", "password": "Passw0rdX"}
+        )
+        assert response.status_code == 200
+        claims = jwt.decode(
+            response.json()["access_token"],
+            settings.JWT_SECRET_KEY,
+            algorithms=[settings.JWT_ALGORITHM],
+        )
+        assert set(claims) == {"sub", "role", "exp", "iat", "type"}
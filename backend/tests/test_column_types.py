@@ -0,0 +1,141 @@
+"""
+Test the custom column types in app.models.types.
+
+This test verifies that values survive a round trip through a real
+database column, that None stays None, and that stored values the type
+doesn't recognise are rejected instead of silently mapped.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, insert, select, text
+from sqlalchemy.exc import StatementError
+
+from app.models.job import JobLevel
+from app.models.types import EnumInt, EpochMs, epoch_ms_now
+
+_metadata = MetaData()
+
+_samples = Table(
+    "samples",
+    _metadata,
+    Column("id", Integer, primary_key=True),
+    Column("level", EnumInt(JobLevel), nullable=True),
+)
+
+_events = Table(
+    "events",
+    _metadata,
+    Column("id", Integer, primary_key=True),
+    Column("at", EpochMs, nullable=True, server_default=epoch_ms_now()),
+)
+
+
+@pytest.fixture
+def conn():
+    """Connection to an in-memory SQLite database with the sample table."""
+    engine = create_engine("sqlite://")
+    _metadata.create_all(engine)
+    with engine.begin() as connection:
+        yield connection
+    engine.dispose()
+
+
+class TestEnumInt:
+    """Test suite for enums stored as SMALLINT codes."""
+
+    def test_codes_follow_declaration_order(self, conn):
+        """Test that each member is stored as its position and loaded back."""
+        for level in JobLevel:
+            conn.execute(insert(_samples).values(level=level))
+
+        stored = conn.execute(text("SELECT level FROM samples ORDER BY id")).scalars().all()
+        loaded = conn.execute(select(_samples.c.level).order_by(_samples.c.id)).scalars().all()
+
+        assert stored == [0, 1, 2, 3]
+        assert loaded == list(JobLevel)
+        assert all(isinstance(level, JobLevel) for level in loaded)
+
+    def test_binds_enum_values(self, conn):
+        """Test that plain values ("senior") bind like their members, also in filters."""
+        conn.execute(insert(_samples).values(level="senior"))
+
+        found = conn.execute(
+            select(_samples.c.id).where(_samples.c.level == JobLevel.SENIOR)
+        ).scalar_one_or_none()
+
+        assert found == 1
+
+    def test_none_round_trips(self, conn):
+        """Test that NULL is stored and loaded as None."""
+        conn.execute(insert(_samples).values(level=None))
+
+        assert conn.execute(text("SELECT level FROM samples")).scalar() is None
+        assert conn.execute(select(_samples.c.level)).scalar() is None
+
+    def test_unknown_value_is_not_bound(self, conn):
+        """Test that a value outside the enum can't be written."""
+        with pytest.raises(StatementError, match="'principal' is not a valid JobLevel"):
+            conn.execute(insert(_samples).values(level="principal"))
+
+    @pytest.mark.parametrize("code", [4, 99, -1])
+    def test_unknown_code_is_rejected(self, conn, code):
+        """Test that codes outside the enum, negative ones included, raise LookupError."""
+        conn.execute(text("INSERT INTO samples (level) VALUES (:code)"), {"code": code})
+
+        with pytest.raises(LookupError, match="JobLevel"):
+            conn.execute(select(_samples.c.level)).scalar()
+
+
+class TestEpochMs:
+    """Test suite for datetimes stored as epoch milliseconds."""
+
+    def test_naive_utc_round_trips(self, conn):
+        """Test that a naive UTC datetime is stored as epoch ms and loaded back."""
+        moment = datetime(2024, 5, 6, 7, 8, 9, 123000)
+        conn.execute(insert(_events).values(at=moment))
+
+        stored = conn.execute(text("SELECT at FROM events")).scalar()
+        loaded = conn.execute(select(_events.c.at)).scalar()
+
+        assert stored == 1714979289123
+        assert loaded == moment
+        assert loaded.tzinfo is None
+
+    def test_aware_datetime_is_stored_as_utc(self, conn):
+        """Test that an aware datetime is converted to UTC and loaded back naive."""
+        almaty = timezone(timedelta(hours=5))
+        conn.execute(insert(_events).values(at=datetime(2024, 5, 6, 12, 8, 9, tzinfo=almaty)))
+
+        assert conn.execute(select(_events.c.at)).scalar() == datetime(2024, 5, 6, 7, 8, 9)
+
+    def test_sub_millisecond_part_is_dropped(self, conn):
+        """Test that microseconds are truncated to whole milliseconds."""
+        conn.execute(insert(_events).values(at=datetime(2024, 5, 6, 7, 8, 9, 123999)))
+
+        assert conn.execute(select(_events.c.at)).scalar() == datetime(2024, 5, 6, 7, 8, 9, 123000)
+
+    def test_before_epoch(self, conn):
+        """Test that datetimes before 1970 round-trip through negative values."""
+        moment = datetime(1969, 12, 31, 23, 59, 59, 500000)
+        conn.execute(insert(_events).values(at=moment))
+
+        assert conn.execute(text("SELECT at FROM events")).scalar() == -500
+        assert conn.execute(select(_events.c.at)).scalar() == moment
+
+    def test_none_round_trips(self, conn):
+        """Test that an explicit None is stored as NULL and loaded as None."""
+        conn.execute(insert(_events).values(at=None))
+
+        assert conn.execute(select(_events.c.at)).scalar() is None
+
+    def test_server_default_is_now(self, conn):
+        """Test that epoch_ms_now fills in the current UTC time."""
+        before = datetime.now(timezone.utc).replace(tzinfo=None)
+        conn.execute(insert(_events).values(id=1))
+        after = datetime.now(timezone.utc).replace(tzinfo=None)
+
+        loaded = conn.execute(select(_events.c.at)).scalar()
+
+        assert before - timedelta(seconds=1) <= loaded <= after + timedelta(seconds=1)
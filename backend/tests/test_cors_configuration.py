@@ -273,7 +273,7 @@ def test_cors_settings_validation():
     assert hasattr(settings, 'CORS_MAX_AGE')
     
     # Verify origins list is properly parsed
-    assert isinstance(settings.cors_origins_list, list)
+    assert isinstance(settings.cors_origins_list, tuple)
     assert len(settings.cors_origins_list) > 0
     
     # Verify all origins start with http:// or https://
@@ -0,0 +1,84 @@
+"""
+Test sharing of in-flight HH vacancy searches.
+
+This test verifies that concurrent identical searches:
+1. Make a single upstream call whose result every caller receives
+2. Still complete for the remaining callers when the first caller is cancelled
+3. Share a failure instead of retrying it per caller
+"""
+
+import asyncio
+
+import pytest
+
+from app.services import hh_client
+from app.services.hh_client import HHAPIError, HHService
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """HHService whose upstream fetch is controlled by the test."""
+    hh_client._search_cache.clear()
+    hh_client._inflight_searches.clear()
+
+    svc = HHService()
+    svc._client = object()  # get_vacancies only checks that a client exists
+    svc.calls = 0
+    svc.release = asyncio.Event()
+    svc.outcome = "result"
+
+    async def fake_fetch(params):
+        svc.calls += 1
+        await svc.release.wait()
+        if isinstance(svc.outcome, Exception):
+            raise svc.outcome
+        return svc.outcome
+
+    monkeypatch.setattr(svc, "_fetch_vacancies", fake_fetch)
+    yield svc
+    hh_client._search_cache.clear()
+    hh_client._inflight_searches.clear()
+
+
+class TestSearchSingleflight:
+    """Test suite for HHService.get_vacancies request sharing."""
+
+    async def test_followers_get_leader_result(self, service):
+        """Test that identical concurrent searches share one fetch."""
+        callers = [asyncio.create_task(service.get_vacancies("python")) for _ in range(3)]
+        await asyncio.sleep(0)
+        service.release.set()
+
+        assert await asyncio.gather(*callers) == ["result"] * 3
+        assert service.calls == 1
+        assert hh_client._inflight_searches == {}
+
+    async def test_cancelled_leader_does_not_fail_followers(self, service):
+        """Test that the first caller going away doesn't abort the fetch."""
+        leader = asyncio.create_task(service.get_vacancies("python"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(service.get_vacancies("python"))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        service.release.set()
+        assert await follower == "result"
+        assert service.calls == 1
+        # The finished fetch still populated the cache
+        assert await service.get_vacancies("python") == "result"
+        assert service.calls == 1
+
+    async def test_failure_is_shared(self, service):
+        """Test that an upstream error reaches every waiting caller once."""
+        service.outcome = HHAPIError("upstream down")
+        callers = [asyncio.create_task(service.get_vacancies("python")) for _ in range(2)]
+        await asyncio.sleep(0)
+        service.release.set()
+
+        results = await asyncio.gather(*callers, return_exceptions=True)
+        assert all(isinstance(r, HHAPIError) for r in results)
+        assert service.calls == 1
+        assert hh_client._inflight_searches == {}
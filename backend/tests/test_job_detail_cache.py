@@ -0,0 +1,55 @@
+"""
+Test caching of GET /jobs/{job_id}.
+
+This test verifies that:
+1. Responses carry an ETag, and a matching If-None-Match gets 304
+2. Updating or deleting a job drops its cached body and changes the ETag
+"""
+
+from app.models.user import UserRole
+
+
+class TestJobDetailCache:
+    """Test suite for job detail ETags and the in-process body cache."""
+
+    def test_matching_etag_is_not_modified(self, client, create_user, create_job):
+        """Test that revalidating with the current ETag gets an empty 304."""
+        _, employer = create_user("employer@example.com", UserRole.EMPLOYER)
+        job = create_job(employer)
+
+        response = client.get(f"/api/jobs/{job['id']}")
+        etag = response.headers["etag"]
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "no-cache"
+
+        revalidated = client.get(f"/api/jobs/{job['id']}", headers={"If-None-Match": etag})
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert revalidated.headers["etag"] == etag
+
+        stale = client.get(f"/api/jobs/{job['id']}", headers={"If-None-Match": '"stale"'})
+        assert stale.status_code == 200
+
+    def test_update_invalidates_cached_detail(self, client, create_user, create_job):
+        """Test that a cached detail is refreshed after the job is updated."""
+        _, employer = create_user("employer@example.com", UserRole.EMPLOYER)
+        job = create_job(employer)
+        etag = client.get(f"/api/jobs/{job['id']}").headers["etag"]
+
+        response = client.put(f"/api/jobs/{job['id']}", json={"title": "Renamed"}, headers=employer)
+        assert response.status_code == 200
+
+        response = client.get(f"/api/jobs/{job['id']}", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["title"] == "Renamed"
+        assert response.headers["etag"] != etag
+
+    def test_delete_invalidates_cached_detail(self, client, create_user, create_job):
+        """Test that a deleted job is no longer served from the cache."""
+        _, employer = create_user("employer@example.com", UserRole.EMPLOYER)
+        job = create_job(employer)
+        assert client.get(f"/api/jobs/{job['id']}").status_code == 200
+
+        assert client.delete(f"/api/jobs/{job['id']}", headers=employer).status_code == 204
+
+        assert client.get(f"/api/jobs/{job['id']}").status_code == 404
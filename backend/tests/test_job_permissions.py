@@ -0,0 +1,57 @@
+"""
+Test job update and delete authorization.
+
+This test verifies that:
+1. Only the job's creator or an admin can update or delete it
+2. Updating or deleting a missing job returns 404
+"""
+
+from app.models.user import UserRole
+
+
+class TestJobPermissions:
+    """Test suite for PUT/DELETE /jobs/{job_id}."""
+
+    def test_non_owner_cannot_update(self, client, create_user, create_job):
+        """Test that another employer gets 403 and the job is unchanged."""
+        _, owner = create_user("owner@example.com", UserRole.EMPLOYER)
+        _, other = create_user("other@example.com", UserRole.EMPLOYER)
+        job = create_job(owner)
+
+        response = client.put(f"/api/jobs/{job['id']}", json={"title": "Hijacked"}, headers=other)
+
+        assert response.status_code == 403
+        assert client.get(f"/api/jobs/{job['id']}").json()["title"] == job["title"]
+
+    def test_non_owner_cannot_delete(self, client, create_user, create_job):
+        """Test that another employer gets 403 and the job still exists."""
+        _, owner = create_user("owner@example.com", UserRole.EMPLOYER)
+        _, other = create_user("other@example.com", UserRole.EMPLOYER)
+        job = create_job(owner)
+
+        response = client.delete(f"/api/jobs/{job['id']}", headers=other)
+
+        assert response.status_code == 403
+        assert client.get(f"/api/jobs/{job['id']}").status_code == 200
+
+    def test_owner_and_admin_can_write(self, client, create_user, create_job):
+        """Test that the creator and an admin are both allowed."""
+        _, owner = create_user("owner@example.com", UserRole.EMPLOYER)
+        _, admin = create_user("admin@example.com", UserRole.ADMIN)
+        job = create_job(owner)
+
+        response = client.put(f"/api/jobs/{job['id']}", json={"title": "Renamed"}, headers=owner)
+        assert response.status_code == 200
+        assert response.json()["title"] == "Renamed"
+
+        assert client.delete(f"/api/jobs/{job['id']}", headers=admin).status_code == 204
+        assert client.get(f"/api/jobs/{job['id']}").status_code == 404
+
+    def test_missing_job_is_404(self, client, create_user):
+        """Test that writes to a job that doesn't exist return 404, not 403."""
+        _, employer = create_user("employer@example.com", UserRole.EMPLOYER)
+
+        response = client.put("/api/jobs/999", json={"title": "Ghost"}, headers=employer)
+        assert response.status_code == 404
+
+        assert client.delete("/api/jobs/999", headers=employer).status_code == 404
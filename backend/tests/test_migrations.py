@@ -0,0 +1,157 @@
+"""
+Test data conversions done by migrations.
+
+Each migration is run on its own against an in-memory SQLite database that
+holds just the columns it converts, in their pre-migration shape, and the
+converted rows are checked against what the models read.
+"""
+
+import importlib.util
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import create_engine, text
+
+from app.models.application import ApplicationStatus
+from app.models.job import JobLevel
+from app.models.types import EnumInt, EpochMs
+
+_VERSIONS = Path(__file__).resolve().parent.parent / "alembic" / "versions"
+
+
+def _load_migration(revision: str):
+    """Import a migration module by its revision ID."""
+    (path,) = _VERSIONS.glob(f"{revision}_*.py")
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _run(conn, migration, direction: str) -> None:
+    """Run a migration's upgrade or downgrade on conn."""
+    with Operations.context(MigrationContext.configure(conn)):
+        getattr(migration, direction)()
+
+
+@pytest.fixture
+def conn():
+    """Connection to an empty in-memory SQLite database."""
+    engine = create_engine("sqlite://")
+    with engine.begin() as connection:
+        yield connection
+    engine.dispose()
+
+
+class TestStoreEnumsAsSmallint:
+    """Test suite for d9b3f6a2c8e1 (enum names to SMALLINT codes)."""
+
+    @pytest.fixture
+    def migration(self, conn):
+        conn.execute(text(
+            "CREATE TABLE jobs (id INTEGER PRIMARY KEY, level VARCHAR(6) NOT NULL)"
+        ))
+        conn.execute(text(
+            "CREATE TABLE applications (id INTEGER PRIMARY KEY, status VARCHAR(9) NOT NULL)"
+        ))
+        conn.execute(text(
+            "INSERT INTO jobs (level) VALUES ('JUNIOR'), ('MIDDLE'), ('SENIOR'), ('LEAD')"
+        ))
+        conn.execute(text(
+            "INSERT INTO applications (status) VALUES ('PENDING'), ('WITHDRAWN'), ('ACCEPTED')"
+        ))
+        return _load_migration("d9b3f6a2c8e1")
+
+    def test_upgrade_converts_names_to_codes(self, conn, migration):
+        """Test that stored member names become the codes EnumInt reads back."""
+        _run(conn, migration, "upgrade")
+
+        levels = conn.execute(text("SELECT level FROM jobs ORDER BY id")).scalars().all()
+        statuses = conn.execute(
+            text("SELECT status FROM applications ORDER BY id")
+        ).scalars().all()
+        job_level = EnumInt(JobLevel)
+        application_status = EnumInt(ApplicationStatus)
+
+        assert [job_level.process_result_value(code, None) for code in levels] == list(JobLevel)
+        assert [application_status.process_result_value(code, None) for code in statuses] == [
+            ApplicationStatus.PENDING,
+            ApplicationStatus.WITHDRAWN,
+            ApplicationStatus.ACCEPTED,
+        ]
+
+    def test_downgrade_restores_names(self, conn, migration):
+        """Test that a round trip gives back the original names."""
+        _run(conn, migration, "upgrade")
+        _run(conn, migration, "downgrade")
+
+        levels = conn.execute(text("SELECT level FROM jobs ORDER BY id")).scalars().all()
+        statuses = conn.execute(
+            text("SELECT status FROM applications ORDER BY id")
+        ).scalars().all()
+
+        assert levels == ["JUNIOR", "MIDDLE", "SENIOR", "LEAD"]
+        assert statuses == ["PENDING", "WITHDRAWN", "ACCEPTED"]
+
+
+class TestEpochMsSortTimestamps:
+    """Test suite for f5d1b8c3e6a2 (DATETIME sort keys to epoch milliseconds)."""
+
+    @pytest.fixture
+    def migration(self, conn):
+        conn.execute(text(
+            "CREATE TABLE jobs (id INTEGER PRIMARY KEY, "
+            "created_at DATETIME NOT NULL DEFAULT (CURRENT_TIMESTAMP))"
+        ))
+        conn.execute(text(
+            "CREATE TABLE applications (id INTEGER PRIMARY KEY, "
+            "applied_at DATETIME NOT NULL DEFAULT (CURRENT_TIMESTAMP))"
+        ))
+        # Both formats SQLite rows can have: SQLAlchemy's and CURRENT_TIMESTAMP's
+        conn.execute(text(
+            "INSERT INTO jobs (created_at) VALUES "
+            "('2024-05-06 07:08:09.123000'), ('1999-12-31 23:59:59')"
+        ))
+        conn.execute(text(
+            "INSERT INTO applications (applied_at) VALUES ('2024-05-06 07:08:09.123000')"
+        ))
+        return _load_migration("f5d1b8c3e6a2")
+
+    def test_upgrade_converts_datetimes_to_epoch_ms(self, conn, migration):
+        """Test that stored datetimes become the values EpochMs reads back."""
+        _run(conn, migration, "upgrade")
+
+        created = conn.execute(text("SELECT created_at FROM jobs ORDER BY id")).scalars().all()
+        applied = conn.execute(text("SELECT applied_at FROM applications")).scalar()
+        epoch_ms = EpochMs()
+
+        assert [epoch_ms.process_result_value(value, None) for value in created] == [
+            datetime(2024, 5, 6, 7, 8, 9, 123000),
+            datetime(1999, 12, 31, 23, 59, 59),
+        ]
+        assert applied == epoch_ms.process_bind_param(datetime(2024, 5, 6, 7, 8, 9, 123000), None)
+
+    def test_upgrade_sets_epoch_ms_default(self, conn, migration):
+        """Test that rows inserted after the upgrade get the current time in epoch ms."""
+        _run(conn, migration, "upgrade")
+        conn.execute(text("INSERT INTO jobs (id) VALUES (3)"))
+
+        created = conn.execute(text("SELECT created_at FROM jobs WHERE id = 3")).scalar()
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+        assert abs(EpochMs().process_result_value(created, None) - now) < timedelta(seconds=5)
+
+    def test_downgrade_restores_datetimes(self, conn, migration):
+        """Test that a round trip gives back the same instants as DATETIME text."""
+        _run(conn, migration, "upgrade")
+        _run(conn, migration, "downgrade")
+
+        created = conn.execute(text("SELECT created_at FROM jobs ORDER BY id")).scalars().all()
+
+        assert [datetime.fromisoformat(value) for value in created] == [
+            datetime(2024, 5, 6, 7, 8, 9, 123000),
+            datetime(1999, 12, 31, 23, 59, 59),
+        ]
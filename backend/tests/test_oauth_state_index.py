@@ -0,0 +1,45 @@
+"""
+Test that OAuth state lookups use the partial index on unused states.
+
+SQLite only uses a partial index when the query repeats its WHERE
+predicate (used = 0) exactly, so this checks the plan of the statement
+validate_oauth_state actually runs.
+"""
+
+from sqlalchemy import event
+
+from app.database import AsyncSessionLocal, engine
+from app.services.oauth_service import create_oauth_state, validate_oauth_state
+
+
+async def _consume_state_and_explain() -> list[str]:
+    """Validate a fresh state and return the query plan of the consuming UPDATE."""
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("UPDATE oauth_states"):
+            captured.append((statement, parameters))
+
+    async with AsyncSessionLocal() as db:
+        state = await create_oauth_state(db=db, provider="google")
+        event.listen(engine.sync_engine, "before_cursor_execute", capture)
+        try:
+            await validate_oauth_state(db=db, state=state, provider="google")
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+    [(statement, parameters)] = captured
+    async with engine.connect() as conn:
+        rows = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return [row[-1] for row in rows]
+
+
+class TestOAuthStateIndex:
+    """Test suite for the oauth_states partial index."""
+
+    def test_validate_uses_partial_index(self, client):
+        """Test that consuming a state searches ix_oauth_states_state_active."""
+        plan = client.portal.call(_consume_state_and_explain)
+
+        assert any("ix_oauth_states_state_active" in step for step in plan), plan
+        assert not any(step.startswith("SCAN oauth_states") for step in plan), plan
@@ -0,0 +1,57 @@
+"""
+Test saving and unsaving jobs.
+
+This test verifies that:
+1. Saving a job twice returns 409
+2. Saving a missing job returns 404
+3. A saved job shows up in the check endpoints until it is unsaved
+"""
+
+from app.models.user import UserRole
+
+
+class TestSavedJobs:
+    """Test suite for /saved-jobs."""
+
+    def test_duplicate_save_conflicts(self, client, create_user, create_job):
+        """Test that saving the same job again gets 409 and keeps one row."""
+        _, employer = create_user("employer@example.com", UserRole.EMPLOYER)
+        _, seeker = create_user("seeker@example.com")
+        job = create_job(employer)
+
+        first = client.post("/api/saved-jobs", json={"job_id": job["id"]}, headers=seeker)
+        second = client.post("/api/saved-jobs", json={"job_id": job["id"]}, headers=seeker)
+
+        assert first.status_code == 201
+        assert first.json()["job"]["id"] == job["id"]
+        assert second.status_code == 409
+        assert len(client.get("/api/saved-jobs", headers=seeker).json()) == 1
+
+    def test_save_missing_job(self, client, create_user):
+        """Test that saving a job that doesn't exist gets 404, not 409."""
+        _, seeker = create_user("seeker@example.com")
+
+        response = client.post("/api/saved-jobs", json={"job_id": 999}, headers=seeker)
+
+        assert response.status_code == 404
+
+    def test_check_follows_save_and_unsave(self, client, create_user, create_job):
+        """Test that /check and /check-batch reflect saving and unsaving."""
+        _, employer = create_user("employer@example.com", UserRole.EMPLOYER)
+        _, seeker = create_user("seeker@example.com")
+        job_id = create_job(employer)["id"]
+
+        client.post("/api/saved-jobs", json={"job_id": job_id}, headers=seeker)
+        assert client.get(f"/api/saved-jobs/{job_id}/check", headers=seeker).json() == {
+            "is_saved": True
+        }
+        batch = client.post(
+            "/api/saved-jobs/check-batch", json={"job_ids": [job_id, 999]}, headers=seeker
+        )
+        assert batch.json() == {"saved_job_ids": [job_id]}
+
+        assert client.delete(f"/api/saved-jobs/{job_id}", headers=seeker).status_code == 204
+        assert client.delete(f"/api/saved-jobs/{job_id}", headers=seeker).status_code == 404
+        assert client.get(f"/api/saved-jobs/{job_id}/check", headers=seeker).json() == {
+            "is_saved": False
+        }
@@ -0,0 +1,50 @@
+"""
+Test the security headers added by middleware.
+
+This test verifies that every response carries each security header
+exactly once, including when a route already set one of them.
+"""
+
+import pytest
+from fastapi import Response
+
+from app.main import app
+
+_ROUTE_PATH = "/__test__/framed"
+
+
+@pytest.fixture
+def framed_route(client):
+    """Temporary route that sets its own X-Frame-Options."""
+    async def framed():
+        return Response(headers={"X-Frame-Options": "SAMEORIGIN", "X-Custom": "kept"})
+
+    app.add_api_route(_ROUTE_PATH, framed)
+    yield _ROUTE_PATH
+    app.router.routes[:] = [
+        route for route in app.router.routes if getattr(route, "path", None) != _ROUTE_PATH
+    ]
+
+
+def _values(response, name: str) -> list[str]:
+    return response.headers.get_list(name)
+
+
+class TestSecurityHeaders:
+    """Test suite for add_security_headers."""
+
+    def test_headers_sent_once(self, client):
+        """Test that a plain response gets each security header once."""
+        response = client.get("/health")
+
+        assert _values(response, "x-content-type-options") == ["nosniff"]
+        assert _values(response, "x-frame-options") == ["DENY"]
+        assert _values(response, "x-xss-protection") == ["1; mode=block"]
+
+    def test_route_value_is_overwritten(self, client, framed_route):
+        """Test that a header the route set is replaced, not duplicated."""
+        response = client.get(framed_route)
+
+        assert _values(response, "x-frame-options") == ["DENY"]
+        assert _values(response, "x-content-type-options") == ["nosniff"]
+        assert response.headers["x-custom"] == "kept"
@@ -0,0 +1,72 @@
+"""
+Test streamed JSON list responses.
+
+This test verifies that:
+1. Streamed bodies are valid JSON and byte-identical to the buffered ones
+2. A query failing before the first row returns an error status, not a 200
+"""
+
+import json
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.user import UserRole
+from app.services.job_service import JobService
+
+
+class TestStreamedLists:
+    """Test suite for /jobs?search and /applications/me."""
+
+    def test_search_matches_buffered_body(self, client, create_user, create_job):
+        """Test that a search matching every job returns the same bytes as the plain list."""
+        _, employer = create_user("employer@example.com", UserRole.EMPLOYER)
+        for title in ("Python developer", "Senior Python engineer", "Python team lead"):
+            create_job(employer, title=title)
+
+        buffered = client.get("/api/jobs")
+        streamed = client.get("/api/jobs", params={"search": "Python"})
+
+        assert streamed.status_code == 200
+        assert len(json.loads(streamed.content)) == 3
+        assert streamed.content == buffered.content
+
+    def test_empty_search_is_empty_array(self, client):
+        """Test that a search without matches returns []."""
+        response = client.get("/api/jobs", params={"search": "nothing"})
+
+        assert response.status_code == 200
+        assert response.content == b"[]"
+
+    def test_my_applications_is_valid_json(self, client, create_user, create_job):
+        """Test that /applications/me streams every application as a JSON array."""
+        _, employer = create_user("employer@example.com", UserRole.EMPLOYER)
+        _, seeker = create_user("seeker@example.com")
+        for title in ("Backend developer", "Frontend developer"):
+            job = create_job(employer, title=title)
+            response = client.post(
+                "/api/applications", json={"job_id": job["id"]}, headers=seeker
+            )
+            assert response.status_code == 201
+
+        response = client.get("/api/applications/me", headers=seeker)
+
+        assert response.status_code == 200
+        applications = json.loads(response.content)
+        assert {a["job"]["title"] for a in applications} == {
+            "Backend developer",
+            "Frontend developer",
+        }
+
+    def test_failing_query_is_not_200(self, client, monkeypatch):
+        """Test that an error before the first row becomes a 500 response."""
+        async def broken(*args, **kwargs):
+            raise RuntimeError("database is gone")
+            yield
+
+        monkeypatch.setattr(JobService, "stream_all", broken)
+
+        with TestClient(app, raise_server_exceptions=False) as failing_client:
+            response = failing_client.get("/api/jobs", params={"search": "Python"})
+
+        assert response.status_code == 500
@@ -0,0 +1,68 @@
+"""
+Test the in-process TTL cache used for short-lived lookups.
+
+This test verifies that the cache:
+1. Returns stored values until they expire
+2. Honours a per-entry TTL override
+3. Evicts the least recently used entry when full
+4. Supports explicit invalidation
+"""
+
+from app.utils import cache as cache_module
+from app.utils.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test suite for TTLCache."""
+
+    def test_get_returns_value_until_expired(self, monkeypatch):
+        """Test that entries are served until their TTL passes."""
+        now = [100.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        cache = TTLCache(maxsize=10, ttl=60)
+
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+        now[0] += 61
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_per_entry_ttl(self, monkeypatch):
+        """Test that an entry's own TTL overrides the cache default."""
+        now = [100.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        cache = TTLCache(maxsize=10, ttl=60)
+
+        cache.set("short", 1, ttl=5)
+        cache.set("default", 2)
+
+        now[0] += 6
+        assert cache.get("short") is None
+        assert cache.get("default") == 2
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest untouched entry is evicted first."""
+        cache = TTLCache(maxsize=2, ttl=60)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_pop_and_clear(self):
+        """Test explicit invalidation."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.pop("a")
+        cache.pop("missing")
+        assert cache.get("a", "default") == "default"
+
+        cache.clear()
+        assert len(cache) == 0
@@ -0,0 +1,85 @@
+"""
+Test that authorization follows the user's current state.
+
+This test verifies that changes to a user take effect on the next request,
+not when their access token expires:
+1. A deactivated user is refused
+2. A demoted employer can no longer post jobs
+3. Read endpoints load the user through their own read session
+"""
+
+from sqlalchemy import event, update
+
+from app.database import AsyncSessionLocal, engine, read_engine
+from app.models.user import User, UserRole
+
+
+def _update_user(client, user_id: int, **values) -> None:
+    async def run() -> None:
+        async with AsyncSessionLocal() as db:
+            await db.execute(update(User).where(User.id == user_id).values(**values))
+            await db.commit()
+
+    client.portal.call(run)
+
+
+def _create_company(client, headers) -> int:
+    response = client.post("/api/companies", json={"name": "ACME"}, headers=headers)
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def _job_payload(company_id: int) -> dict:
+    return {
+        "title": "Python developer",
+        "description": "Build APIs",
+        "location": "Almaty",
+        "level": "senior",
+        "company_id": company_id,
+    }
+
+
+class TestUserAccess:
+    """Test suite for authorization against the current user state."""
+
+    def test_deactivated_user_is_refused(self, client, create_user):
+        """Test that deactivation revokes access with an unexpired token."""
+        user_id, headers = create_user("seeker@example.com")
+        assert client.get("/api/saved-jobs", headers=headers).status_code == 200
+
+        _update_user(client, user_id, is_active=False)
+
+        assert client.get("/api/saved-jobs", headers=headers).status_code == 403
+        assert client.get("/api/auth/me", headers=headers).status_code == 403
+
+    def test_demoted_employer_cannot_post_jobs(self, client, create_user):
+        """Test that a role change applies to the next request."""
+        user_id, headers = create_user("employer@example.com", UserRole.EMPLOYER)
+        company_id = _create_company(client, headers)
+        response = client.post("/api/jobs", json=_job_payload(company_id), headers=headers)
+        assert response.status_code == 201
+
+        _update_user(client, user_id, role=UserRole.REGULAR_USER)
+
+        response = client.post("/api/jobs", json=_job_payload(company_id), headers=headers)
+        assert response.status_code == 403
+
+    def test_read_endpoint_uses_one_connection(self, client, create_user):
+        """Test that a read endpoint doesn't take a second, primary connection for auth."""
+        _, headers = create_user("seeker@example.com")
+        checkouts = []
+
+        def count(dbapi_connection, connection_record, connection_proxy):
+            checkouts.append(connection_record)
+
+        engines = {engine.sync_engine, read_engine.sync_engine}
+        for sync_engine in engines:
+            event.listen(sync_engine, "checkout", count)
+        try:
+            for url in ("/api/saved-jobs", "/api/saved-jobs/1/check"):
+                checkouts.clear()
+                assert client.get(url, headers=headers).status_code == 200
+                assert len(checkouts) == 1, url
+        finally:
+            for sync_engine in engines:
+                event.remove(sync_engine, "checkout", count)
@@ -0,0 +1,59 @@
+"""
+Tests for users.updated_at, which the database trigger maintains.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import select, update
+
+from app.database import AsyncSessionLocal
+from app.models.user import User
+
+_LONG_AGO = datetime(2000, 1, 1)
+
+
+async def _backdate(user_id: int) -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(created_at=_LONG_AGO, updated_at=_LONG_AGO)
+        )
+        await db.commit()
+
+
+async def _rename(user_id: int) -> tuple[datetime, datetime]:
+    """Rename the user through the ORM; return (loaded, stored) updated_at."""
+    async with AsyncSessionLocal() as db:
+        user = await db.get(User, user_id)
+        user.full_name = "Renamed"
+        await db.commit()
+        loaded = user.updated_at
+        stored = await db.scalar(select(User.updated_at).where(User.id == user_id))
+        return loaded, stored
+
+
+async def _touch_nothing(user_id: int) -> datetime:
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(User).where(User.id == user_id).values(updated_at=User.updated_at)
+        )
+        await db.commit()
+        return await db.scalar(select(User.updated_at).where(User.id == user_id))
+
+
+class TestUpdatedAt:
+    def test_orm_update_loads_trigger_timestamp(self, client, create_user):
+        user_id, _ = create_user("stamp@example.com")
+        client.portal.call(_backdate, user_id)
+
+        loaded, stored = client.portal.call(_rename, user_id)
+
+        assert stored > _LONG_AGO
+        assert loaded == stored
+
+    def test_noop_update_keeps_timestamp(self, client, create_user):
+        user_id, _ = create_user("noop@example.com")
+        client.portal.call(_backdate, user_id)
+
+        assert client.portal.call(_touch_nothing, user_id) == _LONG_AGO
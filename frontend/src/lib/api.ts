@@ -270,6 +270,26 @@ export async function checkJobSaved(jobId: number): Promise<boolean> {
   return data.is_saved
 }
 
+export async function checkJobsSaved(jobIds: number[]): Promise<Set<number>> {
+  const res = await fetch(`${API_URL}/api/saved-jobs/check-batch`, {
+    ...defaultFetchOptions,
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+      ...getAuthHeaders(),
+    },
+    body: JSON.stringify({ job_ids: jobIds }),
+    cache: 'no-store',
+  })
+
+  if (!res.ok) {
+    return new Set()
+  }
+
+  const data = await res.json()
+  return new Set(data.saved_job_ids)
+}
+
 export async function saveJob(jobId: number): Promise<SavedJob> {
   const res = await fetch(`${API_URL}/api/saved-jobs`, {
     ...defaultFetchOptions,
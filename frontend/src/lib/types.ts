@@ -47,6 +47,7 @@ export interface User {
   email: string
   full_name: string
   role: UserRole
+  is_admin: boolean
   is_active: boolean
   is_verified: boolean
   oauth_provider?: string | null